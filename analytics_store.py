@@ -0,0 +1,272 @@
+import hashlib
+import json
+import sqlite3
+import threading
+
+from meeting_analytics import add_derived_fields
+
+# Per-meeting fact tables, plus rollups that triggers keep current on every
+# insert and delete, so aggregate queries read a few hundred rows instead of
+# scanning every meeting.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meetings (
+    id INTEGER PRIMARY KEY,
+    file_name TEXT UNIQUE NOT NULL,
+    signature TEXT NOT NULL,
+    date TEXT,
+    month TEXT NOT NULL,
+    quarter TEXT NOT NULL,
+    duration_minutes REAL NOT NULL,
+    action_items INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS speaker_time (
+    meeting_id INTEGER NOT NULL, month TEXT NOT NULL, speaker TEXT NOT NULL, minutes REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS speaker_time_meeting ON speaker_time (meeting_id);
+CREATE TABLE IF NOT EXISTS keyword_counts (
+    meeting_id INTEGER NOT NULL, quarter TEXT NOT NULL, keyword TEXT NOT NULL, count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS keyword_counts_meeting ON keyword_counts (meeting_id);
+CREATE TABLE IF NOT EXISTS participants (
+    meeting_id INTEGER NOT NULL, month TEXT NOT NULL, participant TEXT NOT NULL, action_items INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS participants_meeting ON participants (meeting_id);
+
+CREATE TABLE IF NOT EXISTS monthly (
+    month TEXT PRIMARY KEY, meetings INTEGER NOT NULL, minutes REAL NOT NULL, action_items INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS speaker_month (
+    month TEXT NOT NULL, speaker TEXT NOT NULL, meetings INTEGER NOT NULL, minutes REAL NOT NULL,
+    PRIMARY KEY (month, speaker)
+);
+CREATE TABLE IF NOT EXISTS keyword_quarter (
+    quarter TEXT NOT NULL, keyword TEXT NOT NULL, meetings INTEGER NOT NULL, count INTEGER NOT NULL,
+    PRIMARY KEY (quarter, keyword)
+);
+CREATE TABLE IF NOT EXISTS participant_month (
+    month TEXT NOT NULL, participant TEXT NOT NULL, meetings INTEGER NOT NULL, action_items INTEGER NOT NULL,
+    PRIMARY KEY (month, participant)
+);
+
+CREATE TRIGGER IF NOT EXISTS meetings_add AFTER INSERT ON meetings BEGIN
+    INSERT INTO monthly VALUES (NEW.month, 1, NEW.duration_minutes, NEW.action_items)
+    ON CONFLICT (month) DO UPDATE SET meetings = meetings + 1,
+        minutes = minutes + excluded.minutes, action_items = action_items + excluded.action_items;
+END;
+CREATE TRIGGER IF NOT EXISTS meetings_drop AFTER DELETE ON meetings BEGIN
+    UPDATE monthly SET meetings = meetings - 1, minutes = minutes - OLD.duration_minutes,
+        action_items = action_items - OLD.action_items WHERE month = OLD.month;
+    DELETE FROM monthly WHERE month = OLD.month AND meetings <= 0;
+END;
+CREATE TRIGGER IF NOT EXISTS speaker_time_add AFTER INSERT ON speaker_time BEGIN
+    INSERT INTO speaker_month VALUES (NEW.month, NEW.speaker, 1, NEW.minutes)
+    ON CONFLICT (month, speaker) DO UPDATE SET meetings = meetings + 1, minutes = minutes + excluded.minutes;
+END;
+CREATE TRIGGER IF NOT EXISTS speaker_time_drop AFTER DELETE ON speaker_time BEGIN
+    UPDATE speaker_month SET meetings = meetings - 1, minutes = minutes - OLD.minutes
+        WHERE month = OLD.month AND speaker = OLD.speaker;
+    DELETE FROM speaker_month WHERE month = OLD.month AND speaker = OLD.speaker AND meetings <= 0;
+END;
+CREATE TRIGGER IF NOT EXISTS keyword_counts_add AFTER INSERT ON keyword_counts BEGIN
+    INSERT INTO keyword_quarter VALUES (NEW.quarter, NEW.keyword, 1, NEW.count)
+    ON CONFLICT (quarter, keyword) DO UPDATE SET meetings = meetings + 1, count = count + excluded.count;
+END;
+CREATE TRIGGER IF NOT EXISTS keyword_counts_drop AFTER DELETE ON keyword_counts BEGIN
+    UPDATE keyword_quarter SET meetings = meetings - 1, count = count - OLD.count
+        WHERE quarter = OLD.quarter AND keyword = OLD.keyword;
+    DELETE FROM keyword_quarter WHERE quarter = OLD.quarter AND keyword = OLD.keyword AND meetings <= 0;
+END;
+CREATE TRIGGER IF NOT EXISTS participants_add AFTER INSERT ON participants BEGIN
+    INSERT INTO participant_month VALUES (NEW.month, NEW.participant, 1, NEW.action_items)
+    ON CONFLICT (month, participant) DO UPDATE SET meetings = meetings + 1,
+        action_items = action_items + excluded.action_items;
+END;
+CREATE TRIGGER IF NOT EXISTS participants_drop AFTER DELETE ON participants BEGIN
+    UPDATE participant_month SET meetings = meetings - 1, action_items = action_items - OLD.action_items
+        WHERE month = OLD.month AND participant = OLD.participant;
+    DELETE FROM participant_month WHERE month = OLD.month AND participant = OLD.participant AND meetings <= 0;
+END;
+"""
+
+UNKNOWN = "unknown"  # month/quarter of meetings without a parseable date
+
+
+def period_labels(date):
+    """(month, quarter) labels such as ("2025-08", "2025-Q3") for a YYYY-MM-DD date"""
+    try:
+        year, month = str(date)[:4], int(str(date)[5:7])
+    except ValueError:
+        return UNKNOWN, UNKNOWN
+    if not year.isdigit() or not 1 <= month <= 12:
+        return UNKNOWN, UNKNOWN
+    return f"{year}-{month:02d}", f"{year}-Q{(month - 1) // 3 + 1}"
+
+
+def _range_clause(column, start, end):
+    clauses, params = [], []
+    if start or end:
+        # "unknown" sorts after every date; a bounded range never includes undated meetings
+        clauses.append(f"{column} != ?")
+        params.append(UNKNOWN)
+    if start:
+        clauses.append(f"{column} >= ?")
+        params.append(start)
+    if end:
+        clauses.append(f"{column} <= ?")
+        params.append(end)
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+
+class AnalyticsStore:
+    """SQLite sidecar of per-meeting analytics, for trends across meetings
+
+    Holds each meeting's date, duration, participants, speaker talk time,
+    keywords and action-item count, kept in sync through the catalog like
+    the search index. Month/quarter rollup tables are maintained by
+    triggers, so the aggregate queries below stay in the low milliseconds
+    regardless of how many meetings are stored.
+
+    content_hash(file_name), when given, supplies the change signature
+    (the catalog already hashes every file); otherwise the meeting's
+    analytics fields are hashed.
+    """
+
+    def __init__(self, db_path, content_hash=None):
+        self.db_path = db_path
+        self.content_hash = content_hash
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._conn:
+            self._conn.executescript(SCHEMA)
+
+    def _signature(self, file_name, meeting):
+        if self.content_hash is not None:
+            digest = self.content_hash(file_name)
+            if digest:
+                return digest
+        fields = [meeting.get(k) for k in ("date", "duration_minutes", "participants", "action_items",
+                                           "speaker_stats", "segments", "keywords", "summary")]
+        return hashlib.sha1(json.dumps(fields, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def _upsert(self, file_name, meeting, stored=None):
+        """Insert or replace a meeting; stored is its current signature, if already looked up"""
+        signature = self._signature(file_name, meeting)
+        if stored is None:
+            row = self._conn.execute(
+                "SELECT signature FROM meetings WHERE file_name = ?", (file_name,)
+            ).fetchone()
+            stored = row[0] if row else ""
+        if stored == signature:
+            return
+        if stored:
+            self._delete(file_name)
+
+        meeting = add_derived_fields(dict(meeting))
+        month, quarter = period_labels(meeting.get("date"))
+        action_items = len(meeting.get("action_items") or [])
+        meeting_id = self._conn.execute(
+            "INSERT INTO meetings (file_name, signature, date, month, quarter, duration_minutes, action_items) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (file_name, signature, meeting.get("date"), month, quarter,
+             float(meeting.get("duration_minutes") or 0), action_items),
+        ).lastrowid
+        self._conn.executemany(
+            "INSERT INTO speaker_time VALUES (?, ?, ?, ?)",
+            [(meeting_id, month, str(speaker), float(minutes))
+             for speaker, minutes in (meeting.get("speaker_stats") or {}).items()],
+        )
+        self._conn.executemany(
+            "INSERT INTO keyword_counts VALUES (?, ?, ?, ?)",
+            [(meeting_id, quarter, str(keyword), int(count))
+             for keyword, count in (meeting.get("keywords") or {}).items()],
+        )
+        self._conn.executemany(
+            "INSERT INTO participants VALUES (?, ?, ?, ?)",
+            [(meeting_id, month, str(participant), action_items)
+             for participant in dict.fromkeys(meeting.get("participants") or [])],
+        )
+
+    def _delete(self, file_name):
+        row = self._conn.execute("SELECT id FROM meetings WHERE file_name = ?", (file_name,)).fetchone()
+        if row:
+            for table in ("speaker_time", "keyword_counts", "participants"):
+                self._conn.execute(f"DELETE FROM {table} WHERE meeting_id = ?", (row[0],))
+            self._conn.execute("DELETE FROM meetings WHERE id = ?", (row[0],))
+
+    def sync(self, file_names, load):
+        """Bring the store in line with the catalog's meetings (used at startup)
+
+        load(file_name) returns a full meeting, or None if it is gone. With
+        content_hash, only files whose hash differs from the stored
+        signature are loaded, one at a time.
+        """
+        with self._lock, self._conn:
+            stored = dict(self._conn.execute("SELECT file_name, signature FROM meetings"))
+            for file_name in stored.keys() - set(file_names):
+                self._delete(file_name)
+            for file_name in file_names:
+                if self.content_hash is not None and stored.get(file_name) == self.content_hash(file_name):
+                    continue
+                meeting = load(file_name)
+                if meeting is not None:
+                    self._upsert(file_name, meeting, stored.get(file_name, ""))
+
+    def on_change(self, file_name, meeting):
+        """MeetingCatalog listener: store or drop a single meeting"""
+        with self._lock, self._conn:
+            if meeting is None:
+                self._delete(file_name)
+            else:
+                self._upsert(file_name, meeting)
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            columns = [c[0] for c in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor]
+
+    # --- Aggregates; month bounds are "YYYY-MM", quarter bounds "YYYY-Qn" ---
+
+    def monthly_totals(self, start=None, end=None):
+        """Meetings, minutes and action items per month"""
+        where, params = _range_clause("month", start, end)
+        return self._query(
+            "SELECT month, meetings, ROUND(minutes, 2) AS minutes, action_items "
+            f"FROM monthly{where} ORDER BY month", params)
+
+    def talk_time(self, start=None, end=None, speaker=None):
+        """Talk time (minutes) per speaker per month"""
+        where, params = _range_clause("month", start, end)
+        if speaker:
+            where += (" AND" if where else " WHERE") + " speaker = ?"
+            params.append(speaker)
+        return self._query(
+            "SELECT month, speaker, meetings, ROUND(minutes, 2) AS minutes "
+            f"FROM speaker_month{where} ORDER BY month, minutes DESC", params)
+
+    def top_keywords(self, start=None, end=None, limit=10):
+        """The limit most frequent keywords of each quarter"""
+        where, params = _range_clause("quarter", start, end)
+        return self._query(
+            "SELECT quarter, keyword, count, meetings FROM ("
+            "  SELECT *, ROW_NUMBER() OVER (PARTITION BY quarter ORDER BY count DESC, keyword) AS rank"
+            f"  FROM keyword_quarter{where}"
+            ") WHERE rank <= ? ORDER BY quarter, rank", params + [limit])
+
+    def action_items_by_participant(self, start=None, end=None, limit=None):
+        """Meetings attended and action items raised in them, per participant"""
+        where, params = _range_clause("month", start, end)
+        sql = ("SELECT participant, SUM(meetings) AS meetings, SUM(action_items) AS action_items "
+               f"FROM participant_month{where} GROUP BY participant ORDER BY action_items DESC, participant")
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return self._query(sql, params)
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM meetings").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
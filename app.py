@@ -1,12 +1,19 @@
-from flask import Flask, render_template, send_file, request, redirect, url_for
-import os, json, tempfile, re
-import pandas as pd
-import plotly.express as px
-from io import BytesIO
-from fpdf import FPDF
-from collections import Counter
+from flask import Flask, Response, render_template, send_file, request, redirect, url_for, jsonify, g
+import os, io, tempfile, hashlib, time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
 from werkzeug.utils import secure_filename
-from datetime import datetime
+from meeting_catalog import MeetingCatalog, SORT_KEYS
+from search_index import SearchIndex
+from analytics_store import AnalyticsStore, period_labels
+from meeting_analytics import AnalyticsCache, add_derived_fields
+from timeline_index import TimelineIndex
+from transcript_model import parse_timestamp
+from export_cache import ExportCache, stream_zip
+import report_renderer
+import meeting_store
+from job_queue import JobQueue
+import metrics
 
 # Initialize Flask app
 app = Flask(__name__)
@@ -14,7 +21,46 @@ app = Flask(__name__)
 # Define folders for storing data and uploaded files
 DATA_FOLDER = "data"
 UPLOAD_FOLDER = "uploads"
+EXPORT_FOLDER = "exports"  # generated PDF/TXT reports, named by meeting content hash
 ALLOWED_EXTENSIONS = {"mp3", "mp4"}  # Supported audio/video formats
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # Bytes read per chunk while hashing uploads
+
+# Speaker chart rendering: "light" ships the talk-time series as JSON and draws it
+# client-side; "plotly" renders server-side (pandas/plotly imported on first use)
+CHART_MODE = os.environ.get("CHART_MODE", "light")
+STATIC_MAX_AGE = 7 * 24 * 3600  # static assets are versioned by mtime, cache for a week
+
+# Background processing: uploads are queued and handled by worker processes.
+# JOB_WORKERS=0 disables the embedded pool (run `python job_queue.py` instead).
+JOB_WORKERS = int(os.environ.get("JOB_WORKERS", os.cpu_count() or 1))
+
+# Per-request sampling profiler: with PROFILING_ENABLED=1, add ?profile=1 to any URL
+# to write a collapsed-stack profile of that request to PROFILE_FOLDER
+PROFILING_ENABLED = os.environ.get("PROFILING_ENABLED") == "1"
+PROFILE_FOLDER = "profiles"
+
+# Where uploaded recordings are archived (s3://bucket/prefix or a directory); unset keeps them local only
+ARTIFACT_STORE = os.environ.get("ARTIFACT_STORE")
+
+# Where uploads are split into silence-delimited chunks plus a manifest; empty disables it
+CHUNK_FOLDER = os.environ.get("CHUNK_FOLDER", "chunks")
+
+# Speech-to-text for preprocessed uploads: "stub", "vosk" or "transcribe-json"; unset keeps mock turns
+TRANSCRIPTION_ENGINE = os.environ.get("TRANSCRIPTION_ENGINE")
+
+# Threads rendering reports for one bulk export
+EXPORT_WORKERS = int(os.environ.get("EXPORT_WORKERS", min(8, os.cpu_count() or 1)))
+
+# Pagination defaults for the meeting list
+PER_PAGE = 24
+MAX_PER_PAGE = 100
+MAX_SEARCH_HITS = 1000  # matches re-sorted when search results are ordered by date/duration/id
+
+# Speaker columns in the trends page's talk-time table (the rest are omitted)
+TREND_SPEAKERS = 8
+
+# Turns listed with seek links on the meeting page (the timeline API has the rest)
+TIMELINE_TURNS = 200
 
 # Store last 5 search queries
 recent_searches = []
@@ -23,90 +69,178 @@ recent_searches = []
 os.makedirs(DATA_FOLDER, exist_ok=True)
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
+# In-memory meeting index, loaded once and kept current by a background watcher
+meeting_catalog = MeetingCatalog(DATA_FOLDER)
+meeting_catalog.refresh()
+startup_names = [m["file_name"] for m in meeting_catalog.headers()]
+
+# Full-text search index (SQLite FTS5 sidecar), kept in sync through the catalog.
+# Startup compares content hashes and decodes only the meetings that changed
+search_index = SearchIndex(os.path.join(DATA_FOLDER, "search_index.db"),
+                           content_hash=meeting_catalog.content_hash)
+search_index.sync(startup_names, meeting_catalog.get)
+meeting_catalog.add_listener(search_index.on_change)
+
+# Cross-meeting analytics (SQLite sidecar with trigger-maintained rollups), synced the same way
+analytics_store = AnalyticsStore(os.path.join(DATA_FOLDER, "analytics.db"),
+                                 content_hash=meeting_catalog.content_hash)
+analytics_store.sync(startup_names, meeting_catalog.get)
+meeting_catalog.add_listener(analytics_store.on_change)
+
+# LRU cache of per-meeting derived artifacts (stats, keywords, rendered chart)
+analytics_cache = AnalyticsCache(max_entries=256)
+meeting_catalog.add_listener(analytics_cache.invalidate)
+
+# Interval indexes over speaker turns and word timings, built on first timeline query
+timeline_cache = AnalyticsCache(max_entries=64)
+meeting_catalog.add_listener(timeline_cache.invalidate)
+
+# Generated reports on disk; files for meetings changed while the app was down are pruned
+export_cache = ExportCache(EXPORT_FOLDER)
+export_cache.prune(meeting_catalog.content_hash(m["file_name"]) for m in meeting_catalog.headers())
+meeting_catalog.add_listener(export_cache.invalidate)
+
+# Persistent job queue; the worker pool is started on first use
+job_queue = JobQueue(os.path.join(DATA_FOLDER, "jobs.db"))
+meeting_catalog.start_watcher()
+
+# Request instrumentation: latency histogram per route, optional sampling profiler
+@app.before_request
+def start_request_timer():
+    g.request_start = time.perf_counter()
+    g.profiler = None
+    if PROFILING_ENABLED and request.args.get("profile") == "1":
+        g.profiler = metrics.SamplingProfiler().start()
+
+@app.after_request
+def record_request_metrics(response):
+    route = request.url_rule.rule if request.url_rule else "unmatched"
+    metrics.REQUEST_SECONDS.observe(time.perf_counter() - g.request_start,
+                                    route=route, method=request.method, status=response.status_code)
+    if g.profiler is not None:
+        g.profiler.stop()
+        os.makedirs(PROFILE_FOLDER, exist_ok=True)
+        profile_path = os.path.join(
+            PROFILE_FOLDER, f"{time.strftime('%Y%m%d-%H%M%S')}-{request.endpoint or 'unmatched'}.collapsed")
+        with open(profile_path, "w") as f:
+            f.write(g.profiler.collapsed())
+        response.headers["X-Profile-File"] = profile_path
+    return response
+
+# Versioned static URL (mtime query string) so browsers can cache assets long-term
+@app.context_processor
+def static_helpers():
+    def versioned_static(filename):
+        path = os.path.join(app.static_folder, filename)
+        version = int(os.path.getmtime(path)) if os.path.exists(path) else 0
+        return url_for("static", filename=filename, v=version)
+    return {"versioned_static": versioned_static}
+
+@app.after_request
+def cache_static_assets(response):
+    if request.endpoint == "static" and request.args.get("v"):
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = STATIC_MAX_AGE
+    return response
+
 # Function to check if uploaded file type is allowed
 def allowed_file(filename):
     return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
 
-# Load all meeting JSON files from data folder
-def load_meetings():
-    files = [f for f in os.listdir(DATA_FOLDER) if f.endswith(".json")]
-    meetings = []
-    for f in files:
-        with open(os.path.join(DATA_FOLDER, f), "r") as file:
-            data = json.load(file)
-            data["file_name"] = f
-            meetings.append(data)
-    return meetings
+# Parse an integer query parameter, clamped to [low, high]
+def int_arg(name, default, low, high=None):
+    try:
+        value = int(request.args.get(name, default))
+    except ValueError:
+        value = default
+    value = max(low, value)
+    return min(value, high) if high is not None else value
+
+# Resolve search, sorting and pagination args into one page of meeting projections
+def query_meetings():
+    keyword = request.args.get("q", "").strip().lower()
+    sort = request.args.get("sort", "relevance" if keyword else "date")
+    if sort not in SORT_KEYS and not (keyword and sort == "relevance"):
+        sort = "date"
+    descending = request.args.get("order", "desc") != "asc"
+    page = int_arg("page", 1, 1)
+    per_page = int_arg("per_page", PER_PAGE, 1, MAX_PER_PAGE)
+    offset = (page - 1) * per_page
+
+    if keyword and sort == "relevance":
+        # Ranked, prefix-matching lookup in the search index, one page at a time
+        meetings = meeting_catalog.projections(search_index.search(keyword, per_page, offset))
+        total = search_index.count(keyword)
+    elif keyword:
+        # Other orders re-sort the best MAX_SEARCH_HITS matches
+        hits = meeting_catalog.projections(search_index.search(keyword, MAX_SEARCH_HITS))
+        hits.sort(key=SORT_KEYS[sort], reverse=descending)
+        total = len(hits)
+        meetings = hits[offset:offset + per_page]
+    else:
+        meetings, total = meeting_catalog.page(sort, descending, offset, per_page)
+
+    return {
+        "q": keyword,
+        "sort": sort,
+        "order": "desc" if descending else "asc",
+        "page": page,
+        "per_page": per_page,
+        "total": total,
+        "pages": max(1, -(-total // per_page)),
+        "meetings": meetings,
+    }
 
 # Homepage route: display meetings, search bar, recent searches
 @app.route("/", methods=["GET"])
 def index():
-    meetings = load_meetings()
-    keyword = request.args.get("q", "").strip().lower()
+    listing = query_meetings()
 
-    # Handle search logic
-    if keyword:
-        recent_searches.insert(0, keyword)
+    # Remember the search for the "Recent Searches" list
+    if listing["q"] and listing["page"] == 1:
+        recent_searches.insert(0, listing["q"])
         if len(recent_searches) > 5:
             recent_searches.pop()
-        meetings = [
-            m for m in meetings
-            if keyword in m.get("summary", "").lower()
-            or any(keyword in p.lower() for p in m.get("participants", []))
-            or keyword in m.get("meeting_id", "").lower()
-            or keyword in m.get("date", "").lower()
-        ]
-
-    return render_template("index.html", meetings=meetings, recent_searches=recent_searches)
-
-# Meeting detail view: speaker stats, keyword analytics
-@app.route("/meeting/<filename>")
-def meeting_detail(filename):
-    file_path = os.path.join(DATA_FOLDER, filename)
-    if not os.path.exists(file_path):
-        return "Meeting not found", 404
 
-    with open(file_path, "r") as file:
-        meeting = json.load(file)
-
-    meeting["file_name"] = filename
+    return render_template("index.html", meetings=listing.pop("meetings"), listing=listing,
+                           recent_searches=recent_searches, job_id=request.args.get("job"))
+
+# JSON listing: one page of lightweight meeting projections
+@app.route("/api/meetings")
+def api_meetings():
+    return jsonify(query_meetings())
+
+# Render the speaker bar chart server-side with Plotly (opt-in, imported lazily)
+def render_plotly_chart(speaker_stats):
+    import pandas as pd
+    import plotly.express as px
+
+    df = pd.DataFrame(list(speaker_stats.items()), columns=["Speaker", "Talk Time (mins)"])
+    fig = px.bar(
+        df, x="Speaker", y="Talk Time (mins)",
+        title="Speaker Talk Time (Bar Chart)", color="Speaker",
+        color_discrete_sequence=px.colors.qualitative.Bold
+    )
+    fig.update_layout(template="plotly_white", title_font=dict(size=20))
+    return fig.to_html(full_html=False)
+
+# Compute the derived artifacts shown on the detail page (cached per content hash)
+def build_meeting_artifacts(meeting):
+    meeting = add_derived_fields(dict(meeting))
+    chart_data = None
     chart_html = ""
     keyword_html = ""
 
-    # ✅ Calculate speaker talk time if missing
-    if "speaker_stats" not in meeting and "segments" in meeting:
-        speaker_stats = {}
-        for seg in meeting["segments"]:
-            speaker = seg.get("speaker", "Unknown")
-            start = seg.get("start", 0)
-            end = seg.get("end", 0)
-            duration = max(0, end - start)
-            speaker_stats[speaker] = speaker_stats.get(speaker, 0) + round(duration / 60, 2)
-        meeting["speaker_stats"] = speaker_stats
-
-    # ✅ Create speaker bar chart using Plotly
-    if "speaker_stats" in meeting and meeting["speaker_stats"]:
-        df = pd.DataFrame(list(meeting["speaker_stats"].items()), columns=["Speaker", "Talk Time (mins)"])
-        fig = px.bar(
-            df, x="Speaker", y="Talk Time (mins)",
-            title="Speaker Talk Time (Bar Chart)", color="Speaker",
-            color_discrete_sequence=px.colors.qualitative.Bold
-        )
-        fig.update_layout(template="plotly_white", title_font=dict(size=20))
-        chart_html = fig.to_html(full_html=False)
-
-    # ✅ Extract top keywords if not already done
-    if "keywords" not in meeting:
-        summary_text = meeting.get("summary", "").lower()
-        words = re.findall(r'\b\w+\b', summary_text)
-        stopwords = set([
-            'the', 'is', 'in', 'it', 'and', 'of', 'to', 'a', 'that', 'this', 'we',
-            'on', 'for', 'with', 'as', 'at', 'be', 'an', 'are', 'by', 'will', 'or',
-            'can', 'not', 'should', 'you', 'our', 'they', 'about'
-        ])
-        filtered_words = [word for word in words if word not in stopwords and len(word) > 2]
-        freq = Counter(filtered_words)
-        meeting["keywords"] = dict(freq.most_common(5))
+    # ✅ Speaker talk-time chart: compact series for the client, or Plotly HTML
+    if meeting.get("speaker_stats"):
+        if CHART_MODE == "plotly":
+            chart_html = render_plotly_chart(meeting["speaker_stats"])
+        else:
+            chart_data = {
+                "speakers": list(meeting["speaker_stats"]),
+                "minutes": [round(v, 2) for v in meeting["speaker_stats"].values()],
+            }
 
     # ✅ Display keywords on HTML
     if meeting.get("keywords"):
@@ -115,14 +249,127 @@ def meeting_detail(filename):
             keyword_html += f"<li><strong>{kw}</strong>: {freq} mentions</li>"
         keyword_html += "</ul>"
 
-    return render_template("meeting.html", meeting=meeting, chart_html=chart_html, keyword_html=keyword_html)
+    return {
+        "speaker_stats": meeting.get("speaker_stats"),
+        "keywords": meeting["keywords"],
+        "chart_data": chart_data,
+        "chart_html": chart_html,
+        "keyword_html": keyword_html,
+    }
+
+# Meeting by file name, picking up files written by another process since the watcher's last pass
+def load_meeting(filename):
+    meeting = meeting_catalog.get(filename)
+    if meeting is None and os.path.exists(os.path.join(DATA_FOLDER, filename)):
+        meeting_catalog.refresh()
+        meeting = meeting_catalog.get(filename)
+    return meeting
+
+# Cached interval index over a meeting's turns and word timings
+def meeting_timeline(filename, meeting):
+    def compute():
+        with metrics.stage("timeline.build_index"):
+            return TimelineIndex.from_meeting(meeting)
+
+    return timeline_cache.get_or_compute(filename, meeting_catalog.content_hash(filename), compute)
 
-# Delete selected meeting JSON file
+# Meeting detail view: speaker stats, keyword analytics
+@app.route("/meeting/<filename>")
+def meeting_detail(filename):
+    meeting = load_meeting(filename)
+    if meeting is None:
+        return "Meeting not found", 404
+    timeline = meeting_timeline(filename, meeting)
+
+    def compute():
+        with metrics.stage("meeting_detail.build_artifacts"):
+            source = meeting
+            if "speaker_stats" not in meeting and len(timeline.turns):
+                # Talk time from the interval index instead of another pass over the segments
+                source = dict(meeting, speaker_stats={
+                    speaker: round(seconds / 60, 2) for speaker, seconds in timeline.talk_time().items()})
+            return build_meeting_artifacts(source)
+
+    artifacts = analytics_cache.get_or_compute(filename, meeting_catalog.content_hash(filename), compute)
+    meeting = dict(meeting)
+    if artifacts["speaker_stats"] is not None:
+        meeting["speaker_stats"] = artifacts["speaker_stats"]
+    meeting["keywords"] = artifacts["keywords"]
+
+    turns = timeline.turns_between(0, float("inf"))
+    return render_template("meeting.html", meeting=meeting, chart_data=artifacts["chart_data"],
+                           chart_html=artifacts["chart_html"], keyword_html=artifacts["keyword_html"],
+                           audio_src=meeting_audio_src(meeting), timeline_turns=turns[:TIMELINE_TURNS],
+                           timeline_total=len(turns))
+
+# Playable source for a meeting's recording: an http(s) archive URL, the local upload, or None
+def meeting_audio_src(meeting):
+    if meeting.get("audio_url", "").startswith(("http://", "https://")):
+        return meeting["audio_url"]
+    audio_file = meeting.get("audio_file")
+    if audio_file and os.path.exists(os.path.join(UPLOAD_FOLDER, secure_filename(audio_file))):
+        return url_for("meeting_audio", filename=meeting["file_name"])
+    return None
+
+# Recording of a meeting; send_file answers Range requests, so players can seek
+@app.route("/audio/<filename>")
+def meeting_audio(filename):
+    meeting = load_meeting(filename)
+    if meeting is None or not meeting.get("audio_file"):
+        return "Audio not found", 404
+    path = os.path.abspath(os.path.join(UPLOAD_FOLDER, secure_filename(meeting["audio_file"])))
+    if not os.path.exists(path):
+        return "Audio not found", 404
+    return send_file(path, conditional=True)
+
+def seconds_arg(name):
+    value = request.args.get(name, "").strip()
+    return parse_timestamp(value) if value else None
+
+# Timeline queries for seek-to-timestamp playback:
+#   ?at=<t>               speakers talking at t
+#   ?from=<t1>&to=<t2>    turns, text, talk time and cross-talk counts in the window
+# Times are seconds or h:mm:ss
+@app.route("/api/meetings/<filename>/timeline")
+def api_timeline(filename):
+    meeting = load_meeting(filename)
+    if meeting is None:
+        return jsonify({"error": "Meeting not found"}), 404
+    try:
+        at, t1, t2 = seconds_arg("at"), seconds_arg("from"), seconds_arg("to")
+    except ValueError:
+        return jsonify({"error": "Times must be seconds or h:mm:ss"}), 400
+
+    timeline = meeting_timeline(filename, meeting)
+    with metrics.stage("timeline.query"):
+        if at is not None:
+            return jsonify({"at": at, "speakers": timeline.speakers_at(at)})
+        t1 = 0.0 if t1 is None else t1
+        t2 = timeline.duration if t2 is None else t2
+        turns = timeline.turns_between(t1, t2)
+        limit = int_arg("limit", MAX_PER_PAGE, 1, MAX_PER_PAGE)
+        return jsonify({
+            "from": t1,
+            "to": t2,
+            "duration": timeline.duration,
+            "talk_time": timeline.talk_time(t1, t2),
+            "overlaps": timeline.overlaps(t1, t2),
+            "interruptions": timeline.interruptions(t1, t2),
+            "text": timeline.text_between(t1, t2),
+            "turns": turns[:limit],
+            "total_turns": len(turns),
+        })
+
+# Delete selected meeting file. Only names the catalog knows are deleted; the
+# SQLite sidecars (search index, analytics, jobs) share the data folder
 @app.route("/delete/<filename>")
 def delete_meeting(filename):
-    file_path = os.path.join(DATA_FOLDER, filename)
-    if os.path.exists(file_path):
-        os.remove(file_path)
+    if meeting_catalog.header(filename) is None:
+        meeting_catalog.refresh()  # written by another process since the watcher's last pass
+        if meeting_catalog.header(filename) is None:
+            return "Meeting not found", 404
+    meeting_store.delete_meeting(DATA_FOLDER, filename)
+    meeting_catalog.remove(filename)
     return redirect(url_for("index"))
 
 # Clear recent search keywords
@@ -131,69 +378,156 @@ def clear_searches():
     recent_searches.clear()
     return redirect(url_for("index"))
 
-# Download meeting summary as TXT or PDF
+# Report formats served by /download and /export, rendered by report_renderer
+REPORT_MIMETYPES = {
+    "json": "application/json",  # JSON export of the stored meeting, whatever its storage format
+    "txt": "text/plain",
+    "pdf": "application/pdf",
+}
+
+# Path of a meeting's report, generated on first request into the export cache
+def cached_report(filename, meeting, fmt):
+    def build(path):
+        report_renderer.render(meeting, {fmt: path})
+        metrics.count_written("download", path)
+
+    return export_cache.get_or_build(filename, meeting_catalog.content_hash(filename), fmt, build)
+
+# Download meeting summary as TXT or PDF.
+# Reports are generated once per meeting version and served from the export
+# cache; send_file streams the file and answers If-None-Match and Range requests
 @app.route("/download/<filename>/<fmt>")
 def download_file(filename, fmt):
-    file_path = os.path.join(DATA_FOLDER, filename)
-    if not os.path.exists(file_path):
+    if fmt not in REPORT_MIMETYPES:
+        return "Invalid format", 400
+
+    meeting = load_meeting(filename)
+    if meeting is None:
         return "File not found", 404
 
-    with open(file_path, "r") as file:
-        meeting = json.load(file)
-
-    # Plain text download
-    if fmt == "txt":
-        lines = [
-            f"Meeting ID: {meeting.get('meeting_id')}",
-            f"Date: {meeting.get('date', 'N/A')}",
-            f"Duration: {meeting.get('duration_minutes')} minutes",
-            f"Participants: {', '.join(meeting.get('participants', []))}",
-            f"Summary: {meeting.get('summary')}",
-            f"Action Items: {', '.join(meeting.get('action_items', []))}",
-            f"Decisions: {', '.join(meeting.get('decisions', []))}"
-        ]
-        buffer = BytesIO("\n\n".join(lines).encode("utf-8"))
-        buffer.seek(0)
-        return send_file(buffer, as_attachment=True, download_name="meeting_summary.txt", mimetype="text/plain")
-
-    # PDF download using FPDF
-    elif fmt == "pdf":
-        pdf = FPDF()
-        pdf.add_page()
-        pdf.set_font("Arial", "B", 16)
-        pdf.cell(0, 10, "Voice to Text Generator", ln=True, align="C")
-        pdf.set_font("Arial", "", 12)
-        pdf.ln(10)
-
-        def add_section(title, content):
-            pdf.set_font("Arial", "B", 12)
-            pdf.cell(0, 10, f"{title}:", ln=True)
-            pdf.set_font("Arial", "", 12)
-            if isinstance(content, list):
-                for item in content:
-                    pdf.multi_cell(0, 10, f"- {item}")
-            else:
-                pdf.multi_cell(0, 10, content)
-            pdf.ln(4)
-
-        add_section("Meeting ID", meeting.get("meeting_id"))
-        add_section("Date", meeting.get("date", "N/A"))
-        add_section("Duration", f"{meeting.get('duration_minutes')} minutes")
-        add_section("Participants", meeting.get("participants", []))
-        add_section("Summary", meeting.get("summary"))
-        add_section("Action Items", meeting.get("action_items", []))
-        add_section("Decisions", meeting.get("decisions", []))
-
-        if "keywords" in meeting:
-            add_section("Keyword Analytics", [f"{k}: {v} mentions" for k, v in meeting["keywords"].items()])
-
-        tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-        pdf.output(tmp.name)
-        return send_file(tmp.name, as_attachment=True, download_name="meeting_summary.pdf", mimetype="application/pdf")
-
-    return "Invalid format", 400
-
-# Upload audio file (mp3/mp4), simulate summary JSON
+    def send(path):
+        return send_file(path, as_attachment=True, download_name=f"meeting_summary.{fmt}",
+                         mimetype=REPORT_MIMETYPES[fmt],
+                         etag=f"{meeting_catalog.content_hash(filename)}-{fmt}", max_age=0)
+
+    try:
+        response = send(cached_report(filename, meeting, fmt))
+    except FileNotFoundError:
+        # Evicted or pruned from the export cache before we opened it: render again
+        response = send(cached_report(filename, meeting, fmt))
+    if response.status_code != 304:
+        metrics.BYTES_WRITTEN.inc(response.content_length or 0, component="download_response")
+    return response
+
+# Meetings selected by a search query and/or an inclusive date range, by file name
+def select_meetings(keyword, date_from, date_to):
+    if keyword:
+        names = search_index.search(keyword)
+        meetings = [(name, meeting_catalog.header(name)) for name in names]
+    else:
+        meetings = [(m["file_name"], m) for m in meeting_catalog.headers()]
+    return [
+        (name, meeting) for name, meeting in meetings
+        if meeting is not None
+        and (not date_from or meeting.get("date", "") >= date_from)
+        and (not date_to or meeting.get("date", "") <= date_to)
+    ]
+
+# Bulk export: a ZIP of TXT/PDF/JSON reports for every matching meeting.
+# Reports render in parallel through the export cache, and the archive is
+# streamed to the client entry by entry as each one finishes
+@app.route("/export")
+def bulk_export():
+    keyword = request.args.get("q", "").strip().lower()
+    date_from = request.args.get("from", "").strip()
+    date_to = request.args.get("to", "").strip()
+    formats = [f for f in request.args.get("formats", "pdf").lower().split(",") if f]
+    if not formats or any(f not in REPORT_MIMETYPES for f in formats):
+        return jsonify({"error": "formats must be a comma-separated list of txt, pdf, json"}), 400
+    try:
+        for value in (date_from, date_to):
+            if value:
+                date.fromisoformat(value)
+    except ValueError:
+        return jsonify({"error": "from/to must be YYYY-MM-DD dates"}), 400
+
+    selected = select_meetings(keyword, date_from, date_to)
+    if not selected:
+        return jsonify({"error": "No meetings match"}), 404
+
+    def report(filename, meeting, fmt):
+        """(archive name, report path), or None if the meeting was deleted since it was selected"""
+        stem = filename.rsplit(".", 1)[0]
+        # Listings hold headers; JSON needs the body too
+        meeting = meeting_catalog.get(filename) if fmt == "json" else meeting_catalog.header(filename)
+        if meeting is None:
+            return None
+        return f"{stem}.{fmt}", cached_report(filename, meeting, fmt)
+
+    def open_entries(futures):
+        failed = []
+        for future in as_completed(futures):
+            filename, _, fmt = futures[future]
+            try:
+                entry = future.result()
+                try:
+                    src = entry and open(entry[1], "rb")
+                except FileNotFoundError:
+                    # Evicted from the export cache before we got to it: render again
+                    entry = report(*futures[future])
+                    src = entry and open(entry[1], "rb")
+            except Exception:
+                # One broken report must not cut the archive short; list it instead
+                app.logger.exception("Bulk export: could not render %s as %s", filename, fmt)
+                failed.append(f"{filename} ({fmt})")
+                continue
+            if entry is not None:
+                yield entry[0], src
+        if failed:
+            text = "Reports that could not be generated:\n" + "".join(f"{name}\n" for name in failed)
+            yield "export_errors.txt", io.BytesIO(text.encode("utf-8"))
+
+    def generate():
+        executor = ThreadPoolExecutor(max_workers=EXPORT_WORKERS)
+        try:
+            futures = {executor.submit(report, name, meeting, fmt): (name, meeting, fmt)
+                       for name, meeting in selected for fmt in formats}
+            for chunk in stream_zip(open_entries(futures)):
+                metrics.BYTES_WRITTEN.inc(len(chunk), component="bulk_export")
+                yield chunk
+        finally:
+            # Client went away (or we're done): drop reports nobody will read
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    return Response(generate(), mimetype="application/zip", headers={
+        "Content-Disposition": "attachment; filename=meeting_reports.zip"})
+
+# Stream an uploaded file to disk in chunks, hashing as it goes.
+# Audio is stored content-addressed as uploads/<sha256>.<ext>; returns (sha256, path)
+def save_upload(file, extension):
+    digest = hashlib.sha256()
+    fd, tmp_path = tempfile.mkstemp(dir=UPLOAD_FOLDER, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while True:
+                chunk = file.stream.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                out.write(chunk)
+        sha256 = digest.hexdigest()
+        filepath = os.path.join(UPLOAD_FOLDER, f"{sha256}.{extension}")
+        if os.path.exists(filepath):
+            os.remove(tmp_path)  # identical recording already stored
+        else:
+            os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return sha256, filepath
+
+# Upload audio file (mp3/mp4) and queue it for background processing
 @app.route("/upload", methods=["POST"])
 def upload():
     if "audio_file" not in request.files:
@@ -205,54 +539,103 @@ def upload():
 
     if file and allowed_file(file.filename):
         filename = secure_filename(file.filename)
-        filepath = os.path.join(UPLOAD_FOLDER, filename)
-        file.save(filepath)
-
-        # --- Simulated summary generation (dummy data) ---
-        now = datetime.now()
-        meeting_data = {
-            "meeting_id": f"M{now.strftime('%Y%m%d-%H%M')}",
-            "date": now.strftime("%Y-%m-%d"),
-            "duration_minutes": 5,
-            "participants": ["spk_0", "spk_1"],
-            "summary": "This is a mock summary generated after uploading the file.",
-            "action_items": ["Finalize report", "Send follow-up email"],
-            "decisions": ["Move to next sprint"],
-            "segments": [
-                {"speaker": "spk_0", "start": 0, "end": 60},
-                {"speaker": "spk_1", "start": 60, "end": 180}
-            ]
-        }
-
-        # Compute speaker stats from segments
-        speaker_stats = {}
-        for seg in meeting_data["segments"]:
-            spk = seg["speaker"]
-            duration = seg["end"] - seg["start"]
-            speaker_stats[spk] = speaker_stats.get(spk, 0) + round(duration / 60, 2)
-        meeting_data["speaker_stats"] = speaker_stats
-
-        # Extract top 5 keywords from mock summary
-        summary_text = meeting_data["summary"].lower()
-        words = re.findall(r'\b\w+\b', summary_text)
-        stopwords = set([
-            'the', 'is', 'in', 'it', 'and', 'of', 'to', 'a', 'that', 'this', 'we',
-            'on', 'for', 'with', 'as', 'at', 'be', 'an', 'are', 'by', 'will', 'or',
-            'can', 'not', 'should', 'you', 'our', 'they', 'about'
-        ])
-        filtered_words = [word for word in words if word not in stopwords and len(word) > 2]
-        freq = Counter(filtered_words)
-        meeting_data["keywords"] = dict(freq.most_common(5))
-
-        # Save to data folder
-        output_filename = f"{meeting_data['meeting_id']}.json"
-        with open(os.path.join(DATA_FOLDER, output_filename), "w") as f:
-            json.dump(meeting_data, f, indent=2)
-
-        return redirect(url_for("index"))
+        sha256, filepath = save_upload(file, filename.rsplit(".", 1)[1].lower())
+
+        # Same recording already summarized: skip reprocessing. A miss re-syncs the
+        # catalog first, in case a worker finished it since the watcher's last pass.
+        existing = meeting_catalog.find_by_audio(sha256)
+        if not existing and meeting_catalog.refresh():
+            existing = meeting_catalog.find_by_audio(sha256)
+        if existing:
+            if request.accept_mimetypes.best == "application/json":
+                return jsonify({"duplicate": True, "file_name": existing,
+                                "meeting_url": url_for("meeting_detail", filename=existing)})
+            return redirect(url_for("meeting_detail", filename=existing))
+
+        # Summary generation runs in a worker; the catalog watcher picks up its output
+        job_id = job_queue.enqueue("pipeline:process_upload", {
+            "audio_path": filepath,
+            "audio_sha256": sha256,
+            "source_filename": filename,
+            "data_folder": DATA_FOLDER,
+            "artifact_store": ARTIFACT_STORE,
+            "chunk_folder": CHUNK_FOLDER,
+            "transcription_engine": TRANSCRIPTION_ENGINE,
+        }, dedup_key=sha256)
+        if JOB_WORKERS:
+            job_queue.start_workers(JOB_WORKERS)
+
+        if request.accept_mimetypes.best == "application/json":
+            return jsonify({"job_id": job_id, "status_url": url_for("job_status", job_id=job_id)}), 202
+        return redirect(url_for("index", job=job_id))
 
     return "Invalid file type", 400
 
+# Aggregates across meetings. from/to bound the period: YYYY-MM, or YYYY-Qn for keywords
+ANALYTICS_QUERIES = {
+    "monthly": lambda a: analytics_store.monthly_totals(a["from"], a["to"]),
+    "talk-time": lambda a: analytics_store.talk_time(a["from"], a["to"], speaker=a["speaker"]),
+    "keywords": lambda a: analytics_store.top_keywords(a["from"], a["to"], limit=a["limit"]),
+    "action-items": lambda a: analytics_store.action_items_by_participant(a["from"], a["to"], limit=a["limit"]),
+}
+
+def analytics_args():
+    return {
+        "from": request.args.get("from", "").strip() or None,
+        "to": request.args.get("to", "").strip() or None,
+        "speaker": request.args.get("speaker", "").strip() or None,
+        "limit": int_arg("limit", 10, 1, MAX_PER_PAGE),
+    }
+
+@app.route("/api/analytics/<kind>")
+def api_analytics(kind):
+    if kind not in ANALYTICS_QUERIES:
+        return jsonify({"error": f"Unknown aggregate; choose from {', '.join(ANALYTICS_QUERIES)}"}), 404
+    with metrics.stage(f"analytics.{kind}"):
+        rows = ANALYTICS_QUERIES[kind](analytics_args())
+    return jsonify({"kind": kind, "rows": rows})
+
+# Trends page: monthly totals, talk time per speaker, keywords per quarter, action items per participant
+@app.route("/trends")
+def trends():
+    args = analytics_args()
+    with metrics.stage("analytics.trends"):
+        monthly = analytics_store.monthly_totals(args["from"], args["to"])
+        talk_time = analytics_store.talk_time(args["from"], args["to"])
+        keywords = analytics_store.top_keywords(*(period_labels(f"{m}-01")[1] if m else None
+                                                  for m in (args["from"], args["to"])), limit=5)
+        participants = analytics_store.action_items_by_participant(args["from"], args["to"], limit=args["limit"])
+
+    # Pivot talk time into one row per month, with a column for each of the top speakers
+    totals = {}
+    for row in talk_time:
+        totals[row["speaker"]] = totals.get(row["speaker"], 0) + row["minutes"]
+    speakers = sorted(totals, key=totals.get, reverse=True)[:TREND_SPEAKERS]
+    by_month = {}
+    for row in talk_time:
+        if row["speaker"] in speakers:
+            by_month.setdefault(row["month"], {})[row["speaker"]] = row["minutes"]
+    quarters = {}
+    for row in keywords:
+        quarters.setdefault(row["quarter"], []).append(row)
+
+    return render_template("trends.html", args=args, monthly=monthly, speakers=speakers,
+                           talk_time=sorted(by_month.items()), quarters=sorted(quarters.items()),
+                           participants=participants)
+
+# Prometheus text-format metrics for this process
+@app.route("/metrics")
+def metrics_endpoint():
+    return metrics.REGISTRY.render(), 200, {"Content-Type": "text/plain; version=0.0.4; charset=utf-8"}
+
+# Background job status (queued/running/done/failed) as JSON
+@app.route("/jobs/<job_id>")
+def job_status(job_id):
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify(job)
+
 # Run the app on local server (debug mode)
 if __name__ == "__main__":
     app.run(debug=True)
@@ -0,0 +1,160 @@
+"""Artifact storage: summaries, reports and audio, on S3 or a local directory
+
+    store = open_store("s3://my-bucket/summaries")   # or "file:///srv/artifacts", or a plain path
+    store.upload_many([("meeting_summary.json", None), ("meeting_summary.pdf", None)])
+
+S3Store keeps one client per store (boto3 clients are thread-safe) and lets
+boto3's transfer manager split large files into concurrent multipart
+uploads. Passing endpoint_url (or setting AWS_ENDPOINT_URL) points it at
+an S3-compatible stand-in such as MinIO or moto's server mode, so
+throughput can be measured offline without touching AWS.
+"""
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import metrics
+
+MB = 1024 * 1024
+MULTIPART_THRESHOLD = 16 * MB  # files above this go up in parallel parts
+MULTIPART_CHUNK_SIZE = 8 * MB
+MAX_CONCURRENCY = 8            # threads per multipart transfer, and files per upload_many
+
+
+class ArtifactStore:
+    """Base class: subclasses implement upload(path, key) and url(key)"""
+
+    def __init__(self, prefix=""):
+        self.prefix = prefix.strip("/")
+
+    def key_for(self, path, key=None):
+        """Default key: the prefix plus the file's base name"""
+        key = key or os.path.basename(path)
+        return f"{self.prefix}/{key}" if self.prefix else key
+
+    def upload(self, path, key=None):
+        raise NotImplementedError
+
+    def url(self, key):
+        raise NotImplementedError
+
+    def upload_many(self, files, max_workers=MAX_CONCURRENCY):
+        """Upload (path, key or None) pairs concurrently
+
+        Returns [(path, url or None, error or None)] in input order; one
+        failed file does not stop the others.
+        """
+        def upload_one(item):
+            path, key = item
+            try:
+                return path, self.upload(path, key), None
+            except Exception as e:
+                return path, None, e
+
+        files = list(files)
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(files)))) as executor:
+            return list(executor.map(upload_one, files))
+
+
+class LocalStore(ArtifactStore):
+    """Artifacts copied into a local directory tree (development, tests, NFS)"""
+
+    def __init__(self, root, prefix=""):
+        super().__init__(prefix)
+        self.root = os.path.abspath(root)
+
+    def upload(self, path, key=None):
+        key = self.key_for(path, key)
+        target = os.path.join(self.root, *key.split("/"))
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        # Copy to a temp file and rename, so readers never see a partial artifact
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target), suffix=".part")
+        os.close(fd)
+        try:
+            shutil.copyfile(path, tmp_path)
+            os.replace(tmp_path, target)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        metrics.BYTES_WRITTEN.inc(os.path.getsize(target), component="artifact_store")
+        return self.url(key)
+
+    def url(self, key):
+        return "file://" + os.path.join(self.root, *key.split("/"))
+
+
+class S3Store(ArtifactStore):
+    """Artifacts in an S3 bucket, or any S3-compatible endpoint (MinIO, moto server)"""
+
+    def __init__(self, bucket, prefix="", endpoint_url=None, region_name=None,
+                 multipart_threshold=MULTIPART_THRESHOLD, multipart_chunksize=MULTIPART_CHUNK_SIZE,
+                 max_concurrency=MAX_CONCURRENCY):
+        super().__init__(prefix)
+        self.bucket = bucket
+        self.endpoint_url = endpoint_url or os.environ.get("AWS_ENDPOINT_URL")
+        self.region_name = region_name
+        self.multipart_threshold = multipart_threshold
+        self.multipart_chunksize = multipart_chunksize
+        self.max_concurrency = max_concurrency
+        self._lock = threading.Lock()
+        self._client = None
+        self._transfer_config = None
+
+    @property
+    def client(self):
+        """The store's S3 client, created on first use and then reused"""
+        with self._lock:
+            if self._client is None:
+                import boto3
+                from boto3.s3.transfer import TransferConfig
+                from botocore.config import Config
+
+                # Enough pooled connections for upload_many x multipart threads
+                pool = Config(max_pool_connections=self.max_concurrency * MAX_CONCURRENCY)
+                self._client = boto3.session.Session().client(
+                    "s3", endpoint_url=self.endpoint_url, region_name=self.region_name, config=pool)
+                self._transfer_config = TransferConfig(
+                    multipart_threshold=self.multipart_threshold,
+                    multipart_chunksize=self.multipart_chunksize,
+                    max_concurrency=self.max_concurrency,
+                )
+            return self._client
+
+    def upload(self, path, key=None):
+        key = self.key_for(path, key)
+        client = self.client
+        client.upload_file(path, self.bucket, key, Config=self._transfer_config)
+        metrics.BYTES_WRITTEN.inc(os.path.getsize(path), component="artifact_store")
+        return self.url(key)
+
+    def url(self, key):
+        return f"s3://{self.bucket}/{key}"
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def open_store(location, **options):
+    """Store for an s3://bucket/prefix or file:// URL, or a plain directory path
+
+    Stores are cached per location, so repeated calls share one client.
+    """
+    with _stores_lock:
+        key = (location, tuple(sorted(options.items())))
+        store = _stores.get(key)
+        if store is None:
+            parsed = urlparse(location)
+            if "://" not in location:
+                store = LocalStore(location, **options)
+            elif parsed.scheme == "file":
+                store = LocalStore(parsed.path, **options)
+            elif parsed.scheme == "s3":
+                store = S3Store(parsed.netloc, parsed.path, **options)
+            else:
+                raise ValueError(f"Unsupported artifact store: {location}")
+            _stores[key] = store
+        return store
@@ -0,0 +1,377 @@
+"""Local audio preprocessing: decode, resample, split on silence, process chunks in parallel
+
+    python audio_preprocess.py uploads/test1_audio.mp3 --out chunks/test1
+
+Audio is decoded to 16 kHz mono 16-bit PCM as a stream (ffmpeg for
+mp3/mp4 and anything else it can read; .wav files natively), so memory
+stays bounded by one block however long the recording is. The stream is
+cut into chunk_NNNN.wav files at pauses: once a chunk is at least
+min_chunk seconds long, the next run of min_silence seconds of silence
+ends it, and max_chunk is a hard limit for recordings without pauses.
+Each finished chunk is handed to a process pool while decoding carries
+on.
+
+The result is a manifest.json next to the chunks recording where each
+chunk sits in the original recording, so per-chunk transcripts can be
+stitched back onto one timeline (stitch_items, shift_items).
+"""
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import subprocess
+import time
+import wave
+from concurrent.futures import ProcessPoolExecutor
+
+import metrics
+
+SAMPLE_RATE = 16000
+SAMPLE_WIDTH = 2                 # bytes per sample (signed 16-bit)
+BLOCK_SECONDS = 10               # decoded audio handled per step
+FRAME_SECONDS = 0.03             # silence is judged per frame
+SILENCE_DBFS = -40.0             # frames quieter than this count as silence
+MIN_SILENCE = 0.5                # seconds of silence that end a chunk
+MIN_CHUNK = 30.0                 # chunks are not cut before this length ...
+MAX_CHUNK = 300.0                # ... and always cut at this length
+NORMALIZE_DBFS = -1.0            # peak level chunks are normalized to
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+FFMPEG = os.environ.get("FFMPEG", "ffmpeg")
+
+
+class DecoderUnavailable(RuntimeError):
+    """No decoder for this file: ffmpeg is not installed and it is not a .wav"""
+
+
+# --- Decoding ---
+
+class _LinearResampler:
+    """Streaming linear-interpolation resampler for the .wav fallback path
+
+    Carries the tail of each block into the next, so block boundaries
+    leave no gaps. Adequate for speech chunking; ffmpeg does proper
+    filtered resampling for everything else.
+    """
+
+    def __init__(self, in_rate, out_rate):
+        import numpy as np
+
+        self.np = np
+        self.step = in_rate / out_rate
+        self.pos = 0.0
+        self.tail = np.zeros(0, dtype=np.float32)
+
+    def __call__(self, samples):
+        np = self.np
+        buf = np.concatenate((self.tail, samples))
+        last = len(buf) - 1
+        if last < self.pos:
+            self.tail = buf
+            return buf[:0]
+        count = int((last - self.pos) // self.step) + 1
+        out = np.interp(self.pos + self.step * np.arange(count), np.arange(len(buf)), buf)
+        next_pos = self.pos + self.step * count
+        keep = min(int(next_pos), last)
+        self.tail = buf[keep:]
+        self.pos = next_pos - keep
+        return out
+
+
+def _decode_wav(path, sample_rate):
+    import numpy as np
+
+    dtypes = {1: np.uint8, 2: np.int16, 4: np.int32}
+    with wave.open(path, "rb") as wav:
+        channels, width, rate = wav.getnchannels(), wav.getsampwidth(), wav.getframerate()
+        if width not in dtypes:
+            raise DecoderUnavailable(f"{width * 8}-bit WAV needs ffmpeg: {path}")
+        scale = float(2 ** (8 * width - 1))
+        resample = _LinearResampler(rate, sample_rate) if rate != sample_rate else None
+        block = max(1, int(rate * BLOCK_SECONDS))
+        while True:
+            raw = wav.readframes(block)
+            if not raw:
+                break
+            samples = np.frombuffer(raw, dtype=dtypes[width]).astype(np.float32)
+            if width == 1:
+                samples -= 128.0
+            samples = samples.reshape(-1, channels).mean(axis=1) / scale
+            if resample is not None:
+                samples = resample(samples)
+            yield np.clip(np.round(samples * 32767.0), -32768, 32767).astype(np.int16)
+
+
+def _decode_ffmpeg(path, sample_rate):
+    import numpy as np
+
+    command = [FFMPEG, "-nostdin", "-v", "error", "-i", path,
+               "-f", "s16le", "-acodec", "pcm_s16le", "-ac", "1", "-ar", str(sample_rate), "-"]
+    try:
+        proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except FileNotFoundError:
+        raise DecoderUnavailable(f"ffmpeg not found (set FFMPEG) to decode {path}") from None
+    block = int(sample_rate * BLOCK_SECONDS) * SAMPLE_WIDTH
+    pending = b""
+    finished = False
+    try:
+        while True:
+            raw = proc.stdout.read(block)
+            if not raw:
+                finished = True
+                break
+            raw = pending + raw
+            usable = len(raw) - len(raw) % SAMPLE_WIDTH
+            pending = raw[usable:]
+            yield np.frombuffer(raw[:usable], dtype="<i2").astype(np.int16)
+    finally:
+        proc.stdout.close()
+        error = proc.stderr.read().decode("utf-8", "replace").strip()
+        proc.stderr.close()
+        if proc.wait() != 0 and finished:
+            raise RuntimeError(f"ffmpeg failed on {path}: {error}")
+
+
+def decode_pcm(path, sample_rate=SAMPLE_RATE):
+    """Yield the recording as blocks of mono int16 samples at sample_rate"""
+    metrics.FILES_READ.inc(component="preprocess")
+    if path.lower().endswith(".wav"):
+        return _decode_wav(path, sample_rate)
+    return _decode_ffmpeg(path, sample_rate)
+
+
+def _dbfs(level):
+    return 20 * math.log10(level) if level > 0 else -math.inf
+
+
+def frame_levels(samples, frame):
+    """dBFS (RMS) of each whole frame in an int16 array"""
+    import numpy as np
+
+    frames = samples[:len(samples) - len(samples) % frame].astype(np.float32).reshape(-1, frame)
+    rms = np.sqrt(np.mean(frames * frames, axis=1)) / 32768.0
+    with np.errstate(divide="ignore"):
+        return 20 * np.log10(rms)
+
+
+# --- Per-chunk processing (runs in the process pool) ---
+
+def process_chunk(path, silence_dbfs=SILENCE_DBFS, normalize_dbfs=NORMALIZE_DBFS):
+    """Peak-normalize a chunk in place and describe where its speech is
+
+    Returns the level before normalization (rms_dbfs), the gain applied,
+    speech_ratio and speech_start/speech_end (seconds into the chunk,
+    None for an all-silent chunk), so transcription can skip silence.
+    """
+    import numpy as np
+
+    with wave.open(path, "rb") as wav:
+        rate = wav.getframerate()
+        samples = np.frombuffer(wav.readframes(wav.getnframes()), dtype="<i2")
+    frame = max(1, int(rate * FRAME_SECONDS))
+    speech = np.flatnonzero(frame_levels(samples, frame) > silence_dbfs)
+    level = float(np.sqrt(np.mean(samples.astype(np.float64) ** 2))) / 32768.0 if len(samples) else 0.0
+
+    peak = int(np.abs(samples.astype(np.int32)).max()) if len(samples) else 0
+    gain = 10 ** (normalize_dbfs / 20) * 32767 / peak if peak else 1.0
+    if len(speech) and gain > 1.0:
+        samples = np.clip(np.round(samples * gain), -32768, 32767).astype("<i2")
+        tmp_path = path + ".part"
+        with wave.open(tmp_path, "wb") as out:
+            out.setnchannels(1)
+            out.setsampwidth(SAMPLE_WIDTH)
+            out.setframerate(rate)
+            out.writeframes(samples.tobytes())
+        os.replace(tmp_path, path)
+
+    frames = len(samples) // frame
+    return {
+        "rms_dbfs": round(max(_dbfs(level), -120.0), 2),
+        "gain_db": round(_dbfs(gain) if len(speech) and gain > 1.0 else 0.0, 2),
+        "speech_ratio": round(len(speech) / frames, 4) if frames else 0.0,
+        "speech_start": round(float(speech[0]) * frame / rate, 3) if len(speech) else None,
+        "speech_end": round(float(speech[-1] + 1) * frame / rate, 3) if len(speech) else None,
+    }
+
+
+# --- Splitting ---
+
+class _ChunkFile:
+    """WAV chunk being written; renamed into place when closed"""
+
+    def __init__(self, folder, index, offset, sample_rate):
+        self.index = index
+        self.offset = offset  # samples from the start of the recording
+        self.samples = 0
+        self.name = f"chunk_{index:04d}.wav"
+        self.path = os.path.join(folder, self.name)
+        self._wav = wave.open(self.path + ".part", "wb")
+        self._wav.setnchannels(1)
+        self._wav.setsampwidth(SAMPLE_WIDTH)
+        self._wav.setframerate(sample_rate)
+
+    def write(self, samples):
+        self._wav.writeframes(samples.astype("<i2").tobytes())
+        self.samples += len(samples)
+
+    def close(self):
+        self._wav.close()
+        os.replace(self.path + ".part", self.path)
+
+
+def split_on_silence(blocks, folder, sample_rate=SAMPLE_RATE, silence_dbfs=SILENCE_DBFS,
+                     min_silence=MIN_SILENCE, min_chunk=MIN_CHUNK, max_chunk=MAX_CHUNK):
+    """Write decoded blocks to chunk files, yielding each _ChunkFile as soon as it is closed"""
+    import numpy as np
+
+    frame = max(1, int(sample_rate * FRAME_SECONDS))
+    silence_frames = max(1, int(round(min_silence / FRAME_SECONDS)))
+    min_samples, max_samples = int(min_chunk * sample_rate), int(max_chunk * sample_rate)
+    chunk = _ChunkFile(folder, 0, 0, sample_rate)
+    quiet = 0  # consecutive silent frames so far
+    carry = np.zeros(0, dtype=np.int16)
+
+    for block in blocks:
+        block = np.concatenate((carry, block))
+        levels = frame_levels(block, frame)
+        carry = block[len(levels) * frame:]
+        written = 0  # samples of this block already in a chunk
+        for i, level in enumerate(levels):
+            quiet = quiet + 1 if level <= silence_dbfs else 0
+            end = (i + 1) * frame
+            length = chunk.samples + end - written
+            if (length >= min_samples and quiet >= silence_frames) or length >= max_samples:
+                chunk.write(block[written:end])
+                written = end
+                chunk.close()
+                yield chunk
+                chunk = _ChunkFile(folder, chunk.index + 1, chunk.offset + chunk.samples, sample_rate)
+                quiet = 0
+        chunk.write(block[written:len(levels) * frame])
+
+    chunk.write(carry)
+    chunk.close()
+    if chunk.samples or chunk.index == 0:
+        yield chunk
+    else:
+        os.remove(chunk.path)  # the recording ended exactly on a cut
+
+
+# --- Pipeline ---
+
+def in_daemon():
+    """Daemonic processes (the job queue's workers) may not start a process pool"""
+    return multiprocessing.current_process().daemon
+
+
+def preprocess(source, folder, workers=None, sample_rate=SAMPLE_RATE, silence_dbfs=SILENCE_DBFS,
+               min_silence=MIN_SILENCE, min_chunk=MIN_CHUNK, max_chunk=MAX_CHUNK, task=process_chunk):
+    """Decode, split and process a recording into folder; returns the manifest
+
+    task(path, silence_dbfs) runs once per chunk in a pool of workers
+    processes (one per core by default; 0, or running inside a daemonic
+    job worker, processes chunks inline) and its dict is merged into the
+    chunk's manifest entry.
+    """
+    os.makedirs(folder, exist_ok=True)
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    pool = ProcessPoolExecutor(max_workers=workers) if workers and not in_daemon() else None
+    chunks, futures = [], []
+    started = time.perf_counter()
+    try:
+        with metrics.stage("preprocess.split"):
+            for chunk in split_on_silence(decode_pcm(source, sample_rate), folder, sample_rate,
+                                          silence_dbfs, min_silence, min_chunk, max_chunk):
+                chunks.append(chunk)
+                if pool is not None:
+                    futures.append(pool.submit(task, chunk.path, silence_dbfs))
+        with metrics.stage("preprocess.chunks"):
+            results = ([future.result() for future in futures] if pool is not None
+                       else [task(chunk.path, silence_dbfs) for chunk in chunks])
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    total = sum(chunk.samples for chunk in chunks)
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "source": os.path.abspath(source),
+        "sample_rate": sample_rate,
+        "sample_width": SAMPLE_WIDTH,
+        "channels": 1,
+        "duration": round(total / sample_rate, 3),
+        "settings": {"silence_dbfs": silence_dbfs, "min_silence": min_silence,
+                     "min_chunk": min_chunk, "max_chunk": max_chunk},
+        "elapsed": round(time.perf_counter() - started, 3),
+        "chunks": [
+            {
+                "index": chunk.index,
+                "file": chunk.name,
+                "offset_samples": chunk.offset,
+                "samples": chunk.samples,
+                "start": round(chunk.offset / sample_rate, 3),
+                "end": round((chunk.offset + chunk.samples) / sample_rate, 3),
+                **result,
+            }
+            for chunk, result in zip(chunks, results)
+        ],
+    }
+    manifest_path = os.path.join(folder, MANIFEST_NAME)
+    with open(manifest_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(manifest_path + ".tmp", manifest_path)
+    metrics.count_written("preprocess", manifest_path)
+    return manifest
+
+
+def load_manifest(folder):
+    with open(os.path.join(folder, MANIFEST_NAME), encoding="utf-8") as f:
+        return json.load(f)
+
+
+# --- Stitching per-chunk results back onto the recording's timeline ---
+
+def shift_items(items, offset):
+    """AWS Transcribe result items with start_time/end_time moved by offset seconds
+
+    Punctuation items carry no times and pass through unchanged.
+    """
+    for item in items:
+        if "start_time" in item:
+            item = dict(item, start_time=f"{float(item['start_time']) + offset:.3f}",
+                        end_time=f"{float(item['end_time']) + offset:.3f}")
+        yield item
+
+
+def stitch_items(manifest, item_streams):
+    """One item stream for the whole recording from per-chunk streams, in chunk order
+
+    Speaker labels are passed through as each chunk's transcription
+    assigned them; diarization is not reconciled across chunks.
+    """
+    for chunk, items in zip(manifest["chunks"], item_streams):
+        yield from shift_items(items, chunk["start"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Decode, resample and split a recording on silence")
+    parser.add_argument("source", help="audio/video file (mp3, mp4, wav, ...)")
+    parser.add_argument("--out", required=True, help="folder for the chunks and manifest.json")
+    parser.add_argument("--workers", type=int, default=None, help="chunk processes (0 = inline)")
+    parser.add_argument("--sample-rate", type=int, default=SAMPLE_RATE)
+    parser.add_argument("--silence-db", type=float, default=SILENCE_DBFS)
+    parser.add_argument("--min-silence", type=float, default=MIN_SILENCE)
+    parser.add_argument("--min-chunk", type=float, default=MIN_CHUNK)
+    parser.add_argument("--max-chunk", type=float, default=MAX_CHUNK)
+    args = parser.parse_args(argv)
+
+    manifest = preprocess(args.source, args.out, args.workers, args.sample_rate, args.silence_db,
+                          args.min_silence, args.min_chunk, args.max_chunk)
+    speed = manifest["duration"] / manifest["elapsed"] if manifest["elapsed"] else 0
+    print(f"{len(manifest['chunks'])} chunk(s), {manifest['duration']:.1f}s of audio "
+          f"in {manifest['elapsed']:.2f}s ({speed:.0f}x realtime) -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
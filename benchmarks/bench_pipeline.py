@@ -0,0 +1,231 @@
+"""Benchmarks for the transcript -> summary -> dashboard pipeline
+
+Times the transcript cleaner, the summarizer stages and the dashboard's
+hot paths on synthetic inputs, and writes machine-readable JSON so runs
+can be compared over time:
+
+    python benchmarks/bench_pipeline.py --scale small --output bench.json
+
+Dashboard benchmarks run in a child process per archive size, because
+app.py binds its data folder at import time.
+"""
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import synthetic  # noqa: E402
+
+SCALES = {
+    "small": {"minutes": [10, 60], "archives": [1000]},
+    "medium": {"minutes": [10, 60, 180], "archives": [10000]},
+    "large": {"minutes": [10, 60, 180, 480], "archives": [10000, 100000]},
+}
+
+
+def time_call(fn, repeat):
+    """Run fn repeat times and return the wall-clock durations in seconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def result(name, params, timings=None, skipped=None):
+    entry = {"name": name, "params": params}
+    if skipped:
+        entry["skipped"] = skipped
+    else:
+        entry.update({
+            "repeat": len(timings),
+            "min_s": min(timings),
+            "median_s": statistics.median(timings),
+            "max_s": max(timings),
+        })
+    return entry
+
+
+def bench_cleaner(minutes_list, repeat, workdir):
+    import transcript_cleaner
+
+    results = []
+    for minutes in minutes_list:
+        source = os.path.join(workdir, f"transcribe_{minutes}m.json")
+        with open(source, "w") as f:
+            json.dump(synthetic.transcribe_output(minutes), f)
+        params = {"minutes": minutes, "bytes": os.path.getsize(source)}
+        json_out = os.path.join(workdir, "clean.json")
+        txt_out = os.path.join(workdir, "clean.txt")
+
+        results.append(result("cleaner.write_outputs", params, time_call(
+            lambda: transcript_cleaner.write_outputs(
+                transcript_cleaner.clean_transcript(source), json_out, txt_out), repeat)))
+        results.append(result("cleaner.build_transcript", params, time_call(
+            lambda: transcript_cleaner.build_transcript(source), repeat)))
+        # End to end through the script, including interpreter start-up
+        script = os.path.join(REPO_ROOT, "module3-transcript.py")
+        results.append(result("cleaner.cli", params, time_call(
+            lambda: subprocess.run([sys.executable, script, source, "--json-out", json_out,
+                                    "--txt-out", txt_out], check=True, capture_output=True),
+            repeat)))
+    return results
+
+
+def _load_summarizer():
+    spec = importlib.util.spec_from_file_location(
+        "module3_summary", os.path.join(REPO_ROOT, "module3-summary.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def bench_summarizer(minutes_list, repeat):
+    from transcript_model import Transcript
+
+    summarizer = _load_summarizer()
+    generator = summarizer.MeetingSummaryGenerator()
+    try:
+        summarizer.ensure_nltk_data()
+        generator.stop_words
+    except LookupError as e:
+        reason = next(line.strip() for line in str(e).splitlines() if line.strip(" *"))
+        return [result("summarizer", {}, skipped=f"NLTK data unavailable: {reason}")]
+
+    results = []
+    for minutes in minutes_list:
+        transcript = Transcript.from_entries(synthetic.clean_transcript(minutes))
+        params = {"minutes": minutes, "turns": len(transcript), "chars": len(transcript.buffer)}
+        for name, fn in [
+            ("summarizer.generate_extractive_summary", generator.generate_extractive_summary),
+            ("summarizer.extract_action_items", generator.extract_action_items),
+            ("summarizer.extract_decisions", generator.extract_decisions),
+            ("summarizer.extract_candidates", generator.extract_candidates),
+        ]:
+            results.append(result(name, params, time_call(lambda: fn(transcript), repeat)))
+    return results
+
+
+def bench_dashboard(count, repeat):
+    """Runs inside a child process whose working directory holds the archive"""
+    from meeting_catalog import MeetingCatalog
+
+    params = {"meetings": count}
+    results = [result("catalog.cold_load", params, time_call(
+        lambda: MeetingCatalog("data").refresh(), 1))]
+
+    start = time.perf_counter()
+    import app
+    results.append(result("app.import", params, [time.perf_counter() - start]))
+
+    client = app.app.test_client()
+    first = app.meeting_catalog.headers()[0]["file_name"]
+
+    def get(url):
+        response = client.get(url)
+        assert response.status_code == 200, (url, response.status_code)
+
+    results += [
+        result("app.catalog_headers", params, time_call(app.meeting_catalog.headers, repeat)),
+        result("app.catalog_refresh_unchanged", params, time_call(app.meeting_catalog.refresh, repeat)),
+        result("app.index", params, time_call(lambda: get("/"), repeat)),
+        result("app.index_sorted_duration", params, time_call(lambda: get("/?sort=duration"), repeat)),
+        result("app.index_search", params, time_call(lambda: get("/?q=budget"), repeat)),
+        result("app.index_search_prefix", params, time_call(lambda: get("/?q=sched"), repeat)),
+        result("app.api_meetings", params, time_call(lambda: get("/api/meetings?page=3"), repeat)),
+        result("app.api_analytics_talk_time", params, time_call(
+            lambda: get("/api/analytics/talk-time"), repeat)),
+        result("app.api_analytics_keywords", params, time_call(
+            lambda: get("/api/analytics/keywords"), repeat)),
+        result("app.trends", params, time_call(lambda: get("/trends"), repeat)),
+        result("app.meeting_detail_cold", params, time_call(
+            lambda: get(f"/meeting/{first}"), 1)),
+        result("app.meeting_detail_warm", params, time_call(
+            lambda: get(f"/meeting/{first}"), repeat)),
+    ]
+    return results
+
+
+def run_dashboard_child(count, repeat):
+    """Build an archive in a scratch directory and benchmark it in a fresh interpreter"""
+    with tempfile.TemporaryDirectory() as workdir:
+        synthetic.write_archive(os.path.join(workdir, "data"), count)
+        env = dict(os.environ, JOB_WORKERS="0", VTT_OFFLINE="1")
+        out = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--dashboard-child", str(count),
+             "--repeat", str(repeat)],
+            cwd=workdir, env=env, capture_output=True, text=True, check=True,
+        )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the meeting pipeline")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--minutes", type=int, nargs="*", help="transcript lengths (overrides scale)")
+    parser.add_argument("--archives", type=int, nargs="*", help="archive sizes (overrides scale)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", choices=["cleaner", "summarizer", "dashboard"], nargs="*")
+    parser.add_argument("--output", help="write JSON results here (default: stdout)")
+    parser.add_argument("--allow-download", action="store_true",
+                        help="let the summarizer download missing NLTK data (default: offline)")
+    parser.add_argument("--dashboard-child", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.dashboard_child is not None:
+        print(json.dumps(bench_dashboard(args.dashboard_child, args.repeat)))
+        sys.stdout.flush()
+        os._exit(0)  # skip teardown of app.py's daemon threads
+
+    if not args.allow_download:
+        os.environ["VTT_OFFLINE"] = "1"
+
+    scale = SCALES[args.scale]
+    minutes = args.minutes or scale["minutes"]
+    archives = args.archives or scale["archives"]
+    only = set(args.only or ["cleaner", "summarizer", "dashboard"])
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        if "cleaner" in only:
+            results += bench_cleaner(minutes, args.repeat, workdir)
+    if "summarizer" in only:
+        results += bench_summarizer(minutes, args.repeat)
+    if "dashboard" in only:
+        for count in archives:
+            results += run_dashboard_child(count, args.repeat)
+
+    report = {
+        "generated_at": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "scale": args.scale,
+        "results": results,
+    }
+    for entry in results:
+        timing = entry.get("skipped") or f"median {entry['median_s'] * 1000:9.2f} ms"
+        print(f"{entry['name']:45} {json.dumps(entry['params']):45} {timing}", file=sys.stderr)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
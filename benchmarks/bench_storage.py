@@ -0,0 +1,65 @@
+"""Upload throughput of an artifact store
+
+    python benchmarks/bench_storage.py /tmp/artifacts --files 20 --size-mb 4
+    AWS_ENDPOINT_URL=http://localhost:9000 python benchmarks/bench_storage.py s3://bench/artifacts
+
+The second form runs against MinIO or `moto_server` (create the bucket
+first), so S3 multipart and upload_many concurrency can be measured
+offline. Compares serial upload() calls with one upload_many() batch.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import artifact_store  # noqa: E402
+
+
+def make_files(folder, count, size):
+    paths = []
+    for i in range(count):
+        path = os.path.join(folder, f"artifact_{i:04d}.bin")
+        with open(path, "wb") as f:
+            f.write(os.urandom(size))
+        paths.append(path)
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark artifact store uploads")
+    parser.add_argument("location", help="s3://bucket/prefix or a directory")
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--size-mb", type=float, default=4)
+    parser.add_argument("--workers", type=int, default=artifact_store.MAX_CONCURRENCY)
+    args = parser.parse_args(argv)
+
+    store = artifact_store.open_store(args.location)
+    size = int(args.size_mb * artifact_store.MB)
+    results = {"location": args.location, "files": args.files, "bytes_per_file": size}
+    with tempfile.TemporaryDirectory() as workdir:
+        paths = make_files(workdir, args.files, size)
+
+        start = time.perf_counter()
+        for path in paths:
+            store.upload(path, f"serial/{os.path.basename(path)}")
+        results["serial_s"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        outcome = store.upload_many([(path, f"batch/{os.path.basename(path)}") for path in paths],
+                                    max_workers=args.workers)
+        results["upload_many_s"] = time.perf_counter() - start
+        results["errors"] = [str(error) for _, _, error in outcome if error is not None]
+
+    total_mb = args.files * size / artifact_store.MB
+    for mode in ("serial", "upload_many"):
+        results[f"{mode}_mb_per_s"] = total_mb / results[f"{mode}_s"]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
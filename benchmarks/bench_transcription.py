@@ -0,0 +1,87 @@
+"""CPU transcription throughput over preprocessed chunks
+
+    python benchmarks/bench_transcription.py --minutes 30 --engine stub
+    VOSK_MODEL=models/vosk-small python benchmarks/bench_transcription.py recording.wav --engine vosk
+
+Preprocesses a recording (a synthetic one with speech-like bursts and
+pauses by default), then transcribes its chunks once per workers x
+batch-size combination and reports seconds of audio per second of wall
+time. No network is involved for the local engines.
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import wave
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import audio_preprocess  # noqa: E402
+import transcription  # noqa: E402
+
+
+def synthetic_recording(path, minutes, rate=audio_preprocess.SAMPLE_RATE, seed=0):
+    """Mono WAV of tone bursts ("words") in runs ("turns") separated by pauses"""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    with wave.open(path, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(audio_preprocess.SAMPLE_WIDTH)
+        wav.setframerate(rate)
+        written = 0
+        while written < minutes * 60 * rate:
+            parts = []
+            for _ in range(rng.integers(5, 40)):
+                n = int(rate * rng.uniform(0.15, 0.6))
+                parts.append(0.3 * np.sin(2 * np.pi * rng.uniform(120, 300) * np.arange(n) / rate))
+                parts.append(np.zeros(int(rate * rng.uniform(0.02, 0.15))))
+            parts.append(np.zeros(int(rate * rng.uniform(0.4, 2.0))))
+            samples = (np.concatenate(parts) * 32767).astype("<i2")
+            wav.writeframes(samples.tobytes())
+            written += len(samples)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark chunked CPU transcription")
+    parser.add_argument("source", nargs="?", help="recording to use (default: synthetic)")
+    parser.add_argument("--minutes", type=float, default=30, help="length of the synthetic recording")
+    parser.add_argument("--engine", choices=sorted(transcription.ENGINES), default="stub")
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, os.cpu_count() or 1])
+    parser.add_argument("--batch-size", type=int, nargs="+", default=[1, transcription.BATCH_SIZE])
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp()
+    try:
+        source = args.source
+        if source is None:
+            source = os.path.join(workdir, "synthetic.wav")
+            synthetic_recording(source, args.minutes)
+        start = time.perf_counter()
+        manifest = audio_preprocess.preprocess(source, os.path.join(workdir, "chunks"))
+        results = {
+            "engine": args.engine,
+            "audio_s": manifest["duration"],
+            "chunks": len(manifest["chunks"]),
+            "preprocess_s": time.perf_counter() - start,
+            "runs": [],
+        }
+        engine = transcription.open_engine(args.engine)
+        for workers in args.workers:
+            for batch_size in args.batch_size:
+                stats = transcription.transcribe_manifest(
+                    engine, os.path.join(workdir, "chunks"), workers, batch_size)["transcription"]
+                results["runs"].append({"workers": workers, "batch_size": batch_size,
+                                        "elapsed_s": stats["elapsed"],
+                                        "realtime_factor": stats["realtime_factor"]})
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Cold-start import budget check for the summarizer and the dashboard
+
+Each module is imported in a fresh interpreter (inside a scratch working
+directory, since app.py creates its data folders on import), with network
+access for NLTK disabled through offline mode. Exits non-zero when any
+import exceeds its budget, so it can gate CI:
+
+    python benchmarks/import_budget.py [--budget-scale 1.5]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Seconds allowed for a cold import, measured inside the child interpreter
+BUDGETS = {
+    "module3-summary.py": 0.5,
+    "app.py": 1.0,
+}
+
+# Modules that must not be loaded as a side effect of importing each target
+FORBIDDEN = {
+    "module3-summary.py": ["nltk", "boto3", "reportlab", "scipy", "numpy"],
+    "app.py": ["pandas", "plotly", "reportlab", "nltk", "boto3"],
+}
+
+_CHILD = r"""
+import importlib.util, json, sys, time
+sys.path.insert(0, {root!r})
+path = {path!r}
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location("target", path)
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+elapsed = time.perf_counter() - start
+loaded = [name for name in {forbidden!r} if name in sys.modules]
+print(json.dumps({{"seconds": elapsed, "loaded": loaded}}))
+sys.stdout.flush()
+import os
+os._exit(0)  # skip interpreter teardown (app.py starts daemon threads)
+"""
+
+
+def measure(target):
+    code = _CHILD.format(root=REPO_ROOT, path=os.path.join(REPO_ROOT, target),
+                         forbidden=FORBIDDEN.get(target, []))
+    env = dict(os.environ, VTT_OFFLINE="1", JOB_WORKERS="0")
+    with tempfile.TemporaryDirectory() as workdir:
+        out = subprocess.run([sys.executable, "-c", code], cwd=workdir, env=env,
+                             capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check cold-start import time budgets")
+    parser.add_argument("--budget-scale", type=float, default=1.0,
+                        help="multiply every budget (for slow CI machines)")
+    args = parser.parse_args(argv)
+
+    failures = 0
+    for target, budget in BUDGETS.items():
+        budget *= args.budget_scale
+        result = measure(target)
+        ok = result["seconds"] <= budget and not result["loaded"]
+        failures += not ok
+        extra = f" (eagerly imported: {', '.join(result['loaded'])})" if result["loaded"] else ""
+        print(f"{'OK  ' if ok else 'FAIL'} {target}: {result['seconds']:.3f}s "
+              f"(budget {budget:.2f}s){extra}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
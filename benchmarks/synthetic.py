@@ -0,0 +1,123 @@
+"""Synthetic inputs for the benchmarks, shaped like the repo's sample files
+
+- transcribe_output(): AWS Transcribe JSON like file1.json
+- clean_transcript(): cleaner output like clean_transcript.json
+- write_archive(): a data/ folder of dashboard meetings like data/M*.json
+"""
+import json
+import os
+import random
+from datetime import date, timedelta
+
+WORDS = (
+    "the project budget schedule review team deadline report client design launch "
+    "quarter revenue hiring roadmap meeting update risk plan release customer sprint "
+    "feature testing approval contract vendor marketing sales support analysis data "
+    "we will should need to agreed decided approved finalized confirmed um uh like "
+    "i think so this that with for about on at by from next week month today"
+).split()
+
+SPEAKING_RATE = 2.5  # words per second
+
+
+def _sentence(rng):
+    words = [rng.choice(WORDS) for _ in range(rng.randint(6, 18))]
+    words[0] = words[0].capitalize()
+    return words
+
+
+def transcribe_output(minutes, speakers=4, seed=0):
+    """Transcribe-style dict with results.items and speaker_labels for a meeting"""
+    rng = random.Random(seed)
+    items, segments, transcript_words = [], [], []
+    t = 0.0
+    end = minutes * 60.0
+    item_id = 0
+    while t < end:
+        speaker = f"spk_{rng.randrange(speakers)}"
+        turn_start = t
+        for _ in range(rng.randint(1, 6)):
+            for word in _sentence(rng):
+                duration = rng.uniform(0.15, 0.6)
+                items.append({
+                    "id": item_id, "type": "pronunciation",
+                    "alternatives": [{"confidence": "0.99", "content": word}],
+                    "start_time": f"{t:.3f}", "end_time": f"{t + duration:.3f}",
+                    "speaker_label": speaker,
+                })
+                transcript_words.append(word)
+                item_id += 1
+                t += 1 / SPEAKING_RATE
+            items.append({
+                "id": item_id, "type": "punctuation",
+                "alternatives": [{"confidence": "0.0", "content": "."}],
+                "speaker_label": speaker,
+            })
+            item_id += 1
+        segments.append({"start_time": f"{turn_start:.3f}", "end_time": f"{t:.3f}",
+                         "speaker_label": speaker, "items": []})
+        t += rng.uniform(0.2, 1.5)
+    return {
+        "jobName": f"synthetic-{minutes}m-{speakers}s",
+        "status": "COMPLETED",
+        "results": {
+            "transcripts": [{"transcript": " ".join(transcript_words)}],
+            "speaker_labels": {"speakers": speakers, "segments": segments},
+            "items": items,
+        },
+    }
+
+
+def clean_transcript(minutes, speakers=4, seed=0):
+    """Cleaner-style list of {speaker, start_time, text} turns"""
+    rng = random.Random(seed)
+    entries = []
+    t = 0.0
+    while t < minutes * 60:
+        words = []
+        for _ in range(rng.randint(1, 6)):
+            words += _sentence(rng)
+            words[-1] += "."
+        entries.append({
+            "speaker": f"spk_{rng.randrange(speakers)}",
+            "start_time": str(timedelta(seconds=t)),
+            "text": " ".join(words),
+        })
+        t += len(words) / SPEAKING_RATE + rng.uniform(0.2, 1.5)
+    return entries
+
+
+def meeting(index, rng):
+    """One dashboard meeting document"""
+    speakers = [f"spk_{i}" for i in range(rng.randint(2, 6))]
+    segments, t = [], 0
+    for _ in range(rng.randint(4, 20)):
+        length = rng.randint(10, 300)
+        segments.append({"speaker": rng.choice(speakers), "start": t, "end": t + length})
+        t += length
+    summary = " ".join(" ".join(_sentence(rng)) + "." for _ in range(3))
+    day = date(2024, 1, 1) + timedelta(days=index % 730)
+    return {
+        "meeting_id": f"M{day:%Y%m%d}-{index:06d}",
+        "date": day.isoformat(),
+        "duration_minutes": round(t / 60),
+        "participants": speakers,
+        "summary": summary,
+        "action_items": [" ".join(_sentence(rng)) for _ in range(rng.randint(0, 4))],
+        "decisions": [" ".join(_sentence(rng)) for _ in range(rng.randint(0, 2))],
+        "segments": segments,
+    }
+
+
+def write_archive(folder, count, seed=0):
+    """Fill folder with count meeting JSON files; returns the file names"""
+    os.makedirs(folder, exist_ok=True)
+    rng = random.Random(seed)
+    names = []
+    for i in range(count):
+        data = meeting(i, rng)
+        name = f"{data['meeting_id']}.json"
+        with open(os.path.join(folder, name), "w") as f:
+            json.dump(data, f, indent=2)
+        names.append(name)
+    return names
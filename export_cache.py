@@ -0,0 +1,156 @@
+import os
+import tempfile
+import threading
+import time
+import zipfile
+from collections import OrderedDict
+
+
+class ExportCache:
+    """Disk cache of generated meeting reports (PDF, TXT)
+
+    Each report is built once per (content hash, format) and kept as
+    <folder>/<hash>.<fmt>, so identical meetings share a file and an
+    edited meeting never serves a stale report. Entries for a meeting
+    are deleted when the catalog reports it changed or removed, and the
+    least recently used files are evicted beyond max_entries.
+    """
+
+    def __init__(self, folder, max_entries=512):
+        self.folder = os.path.abspath(folder)  # send_file resolves relative paths against the app root
+        self.max_entries = max_entries
+        os.makedirs(folder, exist_ok=True)
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # (content hash, fmt) -> path
+        self._hashes = {}              # meeting file name -> content hash it was exported at
+        self._building = {}            # (content hash, fmt) -> lock held while generating
+
+    def _path(self, content_hash, fmt):
+        return os.path.join(self.folder, f"{content_hash}.{fmt}")
+
+    @staticmethod
+    def _unlink(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def prune(self, content_hashes):
+        """Delete cached files (and leftover partial writes) for hashes not in content_hashes
+
+        Run at startup with the catalog's current hashes to clear reports
+        for meetings that changed while the dashboard was down.
+        """
+        keep = set(content_hashes)
+        for name in os.listdir(self.folder):
+            content_hash, _, fmt = name.partition(".")
+            path = os.path.join(self.folder, name)
+            if content_hash in keep and "." not in fmt:
+                with self._lock:
+                    self._entries.setdefault((content_hash, fmt), path)
+            else:
+                self._unlink(path)
+        with self._lock:
+            self._evict()
+
+    def get_or_build(self, file_name, content_hash, fmt, build):
+        """Path of the cached report, calling build(path) to write it on a miss"""
+        key = (content_hash, fmt)
+        with self._lock:
+            self._hashes[file_name] = content_hash
+            lock = self._building.setdefault(key, threading.Lock())
+
+        # One build per key; concurrent requests for it wait and reuse the file
+        with lock:
+            with self._lock:
+                path = self._entries.get(key)
+                if path is not None and os.path.exists(path):
+                    self._entries.move_to_end(key)
+                else:
+                    path = None
+            if path is None:
+                path = self._build(content_hash, fmt, build)
+
+        with self._lock:
+            self._building.pop(key, None)
+            if key not in self._entries:
+                self._entries[key] = path
+                self._evict()
+        return path
+
+    def _build(self, content_hash, fmt, build):
+        path = self._path(content_hash, fmt)
+        fd, tmp_path = tempfile.mkstemp(dir=self.folder, suffix=f".{fmt}.part")
+        os.close(fd)
+        try:
+            build(tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            self._unlink(tmp_path)
+            raise
+        return path
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries:
+            _, path = self._entries.popitem(last=False)
+            self._unlink(path)
+
+    def invalidate(self, file_name, meeting=None):
+        """Delete the reports of a meeting's previous version; usable as a MeetingCatalog listener"""
+        with self._lock:
+            content_hash = self._hashes.pop(file_name, None)
+            if content_hash is None or content_hash in self._hashes.values():
+                return  # never exported, or another meeting file has identical content
+            stale = [key for key in self._entries if key[0] == content_hash]
+            paths = [self._entries.pop(key) for key in stale]
+        for path in paths:
+            self._unlink(path)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+class _ChunkWriter:
+    """Unseekable file object collecting zipfile output until it is drained"""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def stream_zip(entries, chunk_size=64 * 1024):
+    """Yield a ZIP archive as bytes chunks from (archive name, binary file) pairs
+
+    Each file is copied in chunk_size pieces, emitted as it is written and
+    closed afterwards, so memory stays bounded by one chunk rather than
+    the archive. PDFs are stored as-is; other files are deflated.
+    """
+    writer = _ChunkWriter()
+    with zipfile.ZipFile(writer, "w") as archive:
+        for arcname, src in entries:
+            info = zipfile.ZipInfo(arcname, time.localtime()[:6])
+            info.external_attr = 0o644 << 16
+            info.compress_type = zipfile.ZIP_STORED if arcname.endswith(".pdf") else zipfile.ZIP_DEFLATED
+            with src, archive.open(info, "w") as dest:
+                while True:
+                    chunk = src.read(chunk_size)
+                    if not chunk:
+                        break
+                    dest.write(chunk)
+                    if writer.chunks:
+                        yield writer.drain()
+            if writer.chunks:
+                yield writer.drain()  # local header and data descriptor
+    yield writer.drain()  # central directory
@@ -0,0 +1,262 @@
+import argparse
+import importlib
+import json
+import multiprocessing
+import os
+import sqlite3
+import threading
+import time
+import traceback
+import uuid
+from contextlib import contextmanager
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+DEFAULT_DB = os.path.join("data", "jobs.db")
+
+
+def _resolve(task):
+    """Import a handler given as "module:function" """
+    module_name, _, func_name = task.partition(":")
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+class JobQueue:
+    """Persistent SQLite-backed job queue shared by the web app and worker processes
+
+    Jobs are claimed with a lease that the running worker renews while the
+    handler works, so long jobs are not taken over; a worker that dies
+    mid-job stops renewing, the lease expires and the job is picked up
+    again. Each claim carries a fresh lease token, and renew/complete/fail
+    only act while the job still holds it, so a worker that lost its lease
+    cannot overwrite the new owner's job. Failed attempts (including lost
+    leases) are retried with exponential backoff until max_attempts is
+    reached.
+    """
+
+    def __init__(self, db_path=DEFAULT_DB, lease_seconds=600):
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self._pool = []
+        with self._connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "id TEXT PRIMARY KEY, task TEXT NOT NULL, payload TEXT NOT NULL, "
+                "state TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0, "
+                "max_attempts INTEGER NOT NULL, result TEXT, error TEXT, dedup_key TEXT, "
+                "available_at REAL NOT NULL, lease_until REAL, lease_token TEXT, "
+                "created_at REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+            if "lease_token" not in columns:  # databases created before lease tokens
+                conn.execute("ALTER TABLE jobs ADD COLUMN lease_token TEXT")
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_pending ON jobs (state, available_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_dedup ON jobs (dedup_key, state)")
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @contextmanager
+    def _connection(self):
+        conn = self._connect()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def enqueue(self, task, payload, max_attempts=3, dedup_key=None):
+        """Add a job and return its id; task is a "module:function" handler
+
+        With a dedup_key, an existing queued or running job with the same key
+        is returned instead of adding a duplicate.
+        """
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            if dedup_key is not None:
+                row = conn.execute(
+                    "SELECT id FROM jobs WHERE dedup_key = ? AND state IN (?, ?)",
+                    (dedup_key, QUEUED, RUNNING),
+                ).fetchone()
+                if row is not None:
+                    conn.execute("COMMIT")
+                    return row["id"]
+            conn.execute(
+                "INSERT INTO jobs (id, task, payload, state, max_attempts, dedup_key, available_at, "
+                "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (job_id, task, json.dumps(payload), QUEUED, max_attempts, dedup_key, now, now, now),
+            )
+            conn.execute("COMMIT")
+        return job_id
+
+    def get(self, job_id):
+        """Return the job as a dict, or None if it does not exist"""
+        with self._connection() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        del job["lease_until"], job["lease_token"]
+        return job
+
+    def claim(self):
+        """Atomically take the next runnable job (or an expired lease)
+
+        Returns (job id, task, payload, lease token), or None when nothing
+        is runnable.
+        """
+        now = time.time()
+        token = uuid.uuid4().hex
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            # Leases that expired on their last attempt: the worker died every time, stop retrying
+            conn.execute(
+                "UPDATE jobs SET state = ?, error = ?, lease_until = NULL, lease_token = NULL, "
+                "updated_at = ? WHERE state = ? AND lease_until < ? AND attempts >= max_attempts",
+                (FAILED, "Lease expired: the worker stopped before finishing the job", now, RUNNING, now),
+            )
+            row = conn.execute(
+                "SELECT id, task, payload FROM jobs "
+                "WHERE (state = ? AND available_at <= ?) OR (state = ? AND lease_until < ?) "
+                "ORDER BY available_at LIMIT 1",
+                (QUEUED, now, RUNNING, now),
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute(
+                "UPDATE jobs SET state = ?, attempts = attempts + 1, lease_until = ?, lease_token = ?, "
+                "updated_at = ? WHERE id = ?",
+                (RUNNING, now + self.lease_seconds, token, now, row["id"]),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        return row["id"], row["task"], json.loads(row["payload"]), token
+
+    def renew(self, job_id, token):
+        """Extend a running job's lease; returns False if the lease was lost"""
+        now = time.time()
+        with self._connection() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_until = ?, updated_at = ? WHERE id = ? AND state = ? AND lease_token = ?",
+                (now + self.lease_seconds, now, job_id, RUNNING, token),
+            )
+        return cursor.rowcount > 0
+
+    def _keep_leased(self, job_id, token, stop):
+        """Renew a job's lease every third of the lease period until stop is set"""
+        while not stop.wait(self.lease_seconds / 3):
+            if not self.renew(job_id, token):
+                return
+
+    def complete(self, job_id, token, result):
+        """Store a job's result; returns False (and stores nothing) if the lease was lost"""
+        with self._connection() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET state = ?, result = ?, error = NULL, lease_until = NULL, lease_token = NULL, "
+                "updated_at = ? WHERE id = ? AND state = ? AND lease_token = ?",
+                (DONE, json.dumps(result), time.time(), job_id, RUNNING, token),
+            )
+        return cursor.rowcount > 0
+
+    def fail(self, job_id, token, error):
+        """Record a failed attempt; requeue with backoff unless attempts are used up
+
+        Returns False (and records nothing) if the lease was lost.
+        """
+        now = time.time()
+        with self._connection() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET "
+                "state = CASE WHEN attempts < max_attempts THEN ? ELSE ? END, "
+                "available_at = CASE WHEN attempts < max_attempts THEN ? + (1 << attempts) ELSE available_at END, "
+                "error = ?, lease_until = NULL, lease_token = NULL, updated_at = ? "
+                "WHERE id = ? AND state = ? AND lease_token = ?",
+                (QUEUED, FAILED, now, error, now, job_id, RUNNING, token),
+            )
+        return cursor.rowcount > 0
+
+    def run_one(self):
+        """Claim and run a single job; returns False when the queue is empty"""
+        claimed = self.claim()
+        if claimed is None:
+            return False
+        job_id, task, payload, token = claimed
+        stop = threading.Event()
+        heartbeat = threading.Thread(target=self._keep_leased, args=(job_id, token, stop),
+                                     name=f"lease-{job_id}", daemon=True)
+        heartbeat.start()
+        try:
+            result = _resolve(task)(payload)
+        except Exception:
+            error = traceback.format_exc()
+            stop.set()
+            heartbeat.join()
+            self.fail(job_id, token, error)
+        else:
+            stop.set()
+            heartbeat.join()
+            self.complete(job_id, token, result)
+        return True
+
+    def work(self, poll_interval=1.0):
+        """Worker loop: run jobs until the process is terminated"""
+        while True:
+            if not self.run_one():
+                time.sleep(poll_interval)
+
+    def start_workers(self, count=None):
+        """Start a pool of worker processes (one per core by default)"""
+        if self._pool:
+            return
+        count = count or os.cpu_count() or 1
+        for i in range(count):
+            proc = multiprocessing.Process(
+                target=_worker_main, args=(self.db_path, self.lease_seconds),
+                name=f"job-worker-{i}", daemon=True,
+            )
+            proc.start()
+            self._pool.append(proc)
+
+    def stop_workers(self):
+        for proc in self._pool:
+            proc.terminate()
+        for proc in self._pool:
+            proc.join()
+        self._pool = []
+
+
+def _worker_main(db_path, lease_seconds):
+    JobQueue(db_path, lease_seconds).work()
+
+
+# Run a standalone worker pool: python job_queue.py --workers 4
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run job queue workers")
+    parser.add_argument("--db", default=DEFAULT_DB, help="path to the jobs database")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    queue = JobQueue(args.db)
+    queue.start_workers(args.workers)
+    print(f"Started {args.workers} worker(s) on {args.db}")
+    try:
+        for proc in queue._pool:
+            proc.join()
+    except KeyboardInterrupt:
+        queue.stop_workers()
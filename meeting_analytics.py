@@ -0,0 +1,77 @@
+import re
+import threading
+from collections import Counter, OrderedDict
+
+# Stopwords for the lightweight keyword extractor used by the dashboard
+STOPWORDS = {
+    'the', 'is', 'in', 'it', 'and', 'of', 'to', 'a', 'that', 'this', 'we',
+    'on', 'for', 'with', 'as', 'at', 'be', 'an', 'are', 'by', 'will', 'or',
+    'can', 'not', 'should', 'you', 'our', 'they', 'about'
+}
+
+
+def compute_speaker_stats(segments):
+    """Total talk time per speaker (minutes) from {speaker, start, end} segments"""
+    speaker_stats = {}
+    for seg in segments:
+        speaker = seg.get("speaker", "Unknown")
+        duration = max(0, seg.get("end", 0) - seg.get("start", 0))
+        speaker_stats[speaker] = speaker_stats.get(speaker, 0) + round(duration / 60, 2)
+    return speaker_stats
+
+
+def extract_keywords(text, top_n=5):
+    """Most frequent non-stopword words in text"""
+    words = re.findall(r'\b\w+\b', text.lower())
+    filtered_words = [word for word in words if word not in STOPWORDS and len(word) > 2]
+    return dict(Counter(filtered_words).most_common(top_n))
+
+
+def add_derived_fields(meeting):
+    """Fill in speaker_stats and keywords in place when they are missing"""
+    if "speaker_stats" not in meeting and "segments" in meeting:
+        meeting["speaker_stats"] = compute_speaker_stats(meeting["segments"])
+    if "keywords" not in meeting:
+        meeting["keywords"] = extract_keywords(meeting.get("summary", ""))
+    return meeting
+
+
+class AnalyticsCache:
+    """Size-bounded LRU cache of derived per-meeting artifacts
+
+    Entries are keyed by (file name, content hash), so an edited meeting
+    never hits a stale entry; older entries for the same file are dropped
+    when a new one is stored.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # (file name, content hash) -> artifacts
+
+    def get_or_compute(self, file_name, content_hash, compute):
+        key = (file_name, content_hash)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        artifacts = compute()
+
+        with self._lock:
+            for stale in [k for k in self._entries if k[0] == file_name and k != key]:
+                del self._entries[stale]
+            self._entries[key] = artifacts
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return artifacts
+
+    def invalidate(self, file_name, meeting=None):
+        """Drop every entry for a file; usable as a MeetingCatalog listener"""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == file_name]:
+                del self._entries[key]
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,289 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import meeting_store
+import metrics
+
+# Length of the summary snippet shown on dashboard cards
+PREVIEW_LENGTH = 120
+
+# Decoded bodies (segments, transcript, words) of compact meetings kept in memory
+BODY_CACHE_SIZE = 128
+
+
+def _duration(meeting):
+    try:
+        return float(meeting.get("duration_minutes") or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+# Sort keys for paginated listings; ties fall back to the file name
+SORT_KEYS = {
+    "date": lambda m: (str(m.get("date") or ""), m["file_name"]),
+    "duration": lambda m: (_duration(m), m["file_name"]),
+    "meeting_id": lambda m: (str(m.get("meeting_id") or ""), m["file_name"]),
+}
+
+
+def summary_projection(meeting):
+    """Lightweight view of a meeting for listings and the JSON API"""
+    summary = meeting.get("summary") or ""
+    return {
+        "file_name": meeting["file_name"],
+        "meeting_id": meeting.get("meeting_id"),
+        "date": meeting.get("date"),
+        "duration_minutes": meeting.get("duration_minutes"),
+        "participants": meeting.get("participants", []),
+        "summary_preview": summary[:PREVIEW_LENGTH],
+    }
+
+
+class MeetingCatalog:
+    """Process-wide in-memory index of the meeting documents in a folder
+
+    The folder is scanned once up front; afterwards only file stats
+    (inode, mtime, size) are compared so unchanged meetings are never
+    re-read. Routes read from memory and write-through via put/remove.
+    For compact (.mtg) documents only the header is held in memory;
+    get() decodes the body on demand and keeps recent ones in an LRU.
+    """
+
+    def __init__(self, folder, refresh_interval=5.0):
+        self.folder = folder
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._meetings = {}  # file name -> meeting dict (header fields only for compact files)
+        self._bodies = OrderedDict()  # (file name, content hash) -> full compact meeting
+        self._stamps = {}    # file name -> (inode, mtime_ns, size)
+        self._projections = {}  # file name -> summary_projection()
+        self._hashes = {}    # file name -> sha256 of the file contents
+        self._by_audio = {}  # audio_sha256 of the source recording -> file name
+        self._orders = {}    # sort key -> file names in ascending order
+        self._watcher = None
+        self._listeners = []
+
+    @staticmethod
+    def _stamp(st):
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def add_listener(self, callback):
+        """Register callback(file_name, meeting) for changes; meeting is None on removal"""
+        self._listeners.append(callback)
+
+    def _notify(self, file_name, data):
+        for callback in self._listeners:
+            callback(file_name, data)
+
+    def _read(self, file_name, header_only=False):
+        with open(os.path.join(self.folder, file_name), "rb") as file:
+            raw = file.read()
+        metrics.FILES_READ.inc(component="catalog")
+        data = meeting_store.parse(file_name, raw, self.folder, header_only)
+        data["file_name"] = file_name
+        return data, hashlib.sha256(raw).hexdigest()
+
+    def refresh(self):
+        """Sync the catalog with the folder, re-reading only changed files"""
+        with metrics.stage("catalog.refresh"):
+            return self._refresh()
+
+    def _refresh(self):
+        current = {}
+        with os.scandir(self.folder) as entries:
+            for entry in entries:
+                if entry.name.endswith(meeting_store.EXTENSIONS) and entry.is_file():
+                    current[entry.name] = self._stamp(entry.stat())
+
+        with self._lock:
+            known = dict(self._stamps)
+
+        changed = [name for name, stamp in current.items() if known.get(name) != stamp]
+        removed = [name for name in known if name not in current]
+
+        # Listeners (search, analytics) need full meetings; without them headers suffice
+        header_only = not self._listeners
+        loaded = {}
+        for name in changed:
+            try:
+                loaded[name] = self._read(name, header_only)
+            except (OSError, ValueError):
+                # File vanished or is still being written; retry on the next pass
+                continue
+
+        with self._lock:
+            for name in removed:
+                self._discard(name)
+            for name, (data, digest) in loaded.items():
+                self._store(name, data, digest)
+                self._stamps[name] = current[name]
+
+        for name in removed:
+            self._notify(name, None)
+        for name, (data, _) in loaded.items():
+            self._notify(name, data)
+        return bool(loaded or removed)
+
+    # Both helpers expect self._lock to be held
+    def _store(self, file_name, data, digest):
+        self._discard_audio(file_name)
+        self._drop_bodies(file_name)
+        if meeting_store.is_compact(file_name):
+            if any(field in data for field in meeting_store.BODY_FIELDS):
+                self._cache_body(file_name, digest, data)
+            data = meeting_store.header_fields(data)
+        self._meetings[file_name] = data
+        if data.get("audio_sha256"):
+            self._by_audio[data["audio_sha256"]] = file_name
+        self._hashes[file_name] = digest
+        self._projections[file_name] = summary_projection(data)
+        self._orders.clear()
+
+    def _discard_audio(self, file_name):
+        old = self._meetings.get(file_name)
+        if old and self._by_audio.get(old.get("audio_sha256")) == file_name:
+            del self._by_audio[old["audio_sha256"]]
+
+    def _cache_body(self, file_name, digest, data):
+        self._bodies[(file_name, digest)] = data
+        while len(self._bodies) > BODY_CACHE_SIZE:
+            self._bodies.popitem(last=False)
+
+    def _drop_bodies(self, file_name):
+        for key in [k for k in self._bodies if k[0] == file_name]:
+            del self._bodies[key]
+
+    def _discard(self, file_name):
+        self._discard_audio(file_name)
+        self._drop_bodies(file_name)
+        self._meetings.pop(file_name, None)
+        self._projections.pop(file_name, None)
+        self._hashes.pop(file_name, None)
+        self._stamps.pop(file_name, None)
+        self._orders.clear()
+
+    def _watch(self):
+        while True:
+            self._stop.wait(self.refresh_interval)
+            if self._stop.is_set():
+                return
+            try:
+                self.refresh()
+            except OSError:
+                pass
+
+    def start_watcher(self):
+        """Poll the folder in a daemon thread so outside edits are picked up"""
+        if self._watcher is not None:
+            return
+        self._stop = threading.Event()
+        self._watcher = threading.Thread(target=self._watch, name="meeting-catalog", daemon=True)
+        self._watcher.start()
+
+    def stop_watcher(self):
+        if self._watcher is not None:
+            self._stop.set()
+            self._watcher.join()
+            self._watcher = None
+
+    def put(self, file_name, data):
+        """Insert or replace a meeting that was just written to disk"""
+        data = dict(data)
+        data["file_name"] = file_name
+        path = os.path.join(self.folder, file_name)
+        try:
+            stamp = self._stamp(os.stat(path))
+            with open(path, "rb") as file:
+                digest = hashlib.sha256(file.read()).hexdigest()
+        except OSError:
+            stamp = None
+            digest = None
+        with self._lock:
+            self._store(file_name, data, digest)
+            if stamp is None:
+                self._stamps.pop(file_name, None)
+            else:
+                self._stamps[file_name] = stamp
+        self._notify(file_name, data)
+
+    def remove(self, file_name):
+        with self._lock:
+            self._discard(file_name)
+        self._notify(file_name, None)
+
+    def get(self, file_name):
+        """The full meeting, decoding a compact document's body if it is not cached"""
+        with self._lock:
+            data = self._meetings.get(file_name)
+            if data is None or not meeting_store.is_compact(file_name):
+                return data
+            key = (file_name, self._hashes.get(file_name))
+            full = self._bodies.get(key)
+            if full is not None:
+                self._bodies.move_to_end(key)
+                return full
+        try:
+            full, digest = self._read(file_name)
+        except (OSError, ValueError):
+            return data  # replaced or removed since the last refresh; the watcher catches up
+        with self._lock:
+            if self._hashes.get(file_name) == digest:
+                self._cache_body(file_name, digest, full)
+        return full
+
+    def header(self, file_name):
+        """Listing fields of a meeting, never decoding a compact body"""
+        with self._lock:
+            return self._meetings.get(file_name)
+
+    def content_hash(self, file_name):
+        """SHA-256 of the meeting file as last read or written"""
+        with self._lock:
+            return self._hashes.get(file_name)
+
+    def find_by_audio(self, audio_sha256):
+        """File name of the meeting generated from a recording with this hash"""
+        with self._lock:
+            return self._by_audio.get(audio_sha256)
+
+    def all(self):
+        """Return every full meeting, ordered by file name (decodes compact bodies)"""
+        with self._lock:
+            names = sorted(self._meetings)
+        return [meeting for meeting in map(self.get, names) if meeting is not None]
+
+    def headers(self):
+        """Return every meeting's listing fields, ordered by file name"""
+        with self._lock:
+            return [self._meetings[name] for name in sorted(self._meetings)]
+
+    def projections(self, file_names):
+        """Summary projections for the given file names, skipping unknown ones"""
+        with self._lock:
+            return [self._projections[n] for n in file_names if n in self._projections]
+
+    def page(self, sort="date", descending=True, offset=0, limit=20):
+        """Return (projections, total) for one page of the sorted meeting list
+
+        The sorted order is cached per key and only rebuilt after a change,
+        so serving a page is a slice rather than a sort.
+        """
+        key = SORT_KEYS[sort]
+        with self._lock:
+            order = self._orders.get(sort)
+            if order is None:
+                order = sorted(self._meetings, key=lambda n: key(self._meetings[n]))
+                self._orders[sort] = order
+            total = len(order)
+            if descending:
+                start = max(total - offset - limit, 0)
+                names = order[start:max(total - offset, 0)][::-1]
+            else:
+                names = order[offset:offset + limit]
+            return [self._projections[n] for n in names], total
+
+    def __len__(self):
+        with self._lock:
+            return len(self._meetings)
@@ -0,0 +1,334 @@
+"""Storage formats for meeting documents in the data folder
+
+Two backends, picked by file extension:
+
+- ".json": the original indented JSON, kept for import/export and for
+  existing archives.
+- ".mtg": compact container. A small uncompressed header holds the fields
+  listings need (id, date, duration, participants, summary, ...); the
+  bulky fields (segments, transcript, words) follow as one compressed body, so
+  read_header() never decompresses or decodes them. Very long segment
+  lists can go to a fixed-width "<stem>.seg" sidecar that SegmentFile
+  reads through mmap.
+
+Layout of a .mtg file (little-endian):
+
+    magic "VTTM" | version u8 | codec u8 | reserved u16 | header length u32 | body length u32
+    header: JSON object | body: compressed JSON object
+
+New meetings are written in MEETING_FORMAT (env, default "compact").
+Convert an existing folder with:
+
+    python meeting_store.py migrate data --to compact
+"""
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+
+MAGIC = b"VTTM"
+VERSION = 1
+_PREFIX = struct.Struct("<4sBBHII")
+
+BODY_FIELDS = ("segments", "transcript", "words")  # decoded only when the full meeting is read
+
+CODEC_ZLIB = 1
+CODEC_ZSTD = 2
+
+SEGMENT_MAGIC = b"VTTS"
+_SEGMENT_PREFIX = struct.Struct("<4sBII")  # magic, version, segment count, speaker table length
+_SEGMENT_RECORD = struct.Struct("<ddI")    # start, end, speaker id
+SIDECAR_MIN_SEGMENTS = 2000  # segment lists at least this long go to a .seg sidecar
+
+FORMATS = {"json": ".json", "compact": ".mtg"}
+DEFAULT_FORMAT = os.environ.get("MEETING_FORMAT", "compact")
+EXTENSIONS = tuple(FORMATS.values())
+
+
+# --- Encoding helpers: orjson and zstandard when installed, stdlib otherwise ---
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def _dumps(value):
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _compress(raw):
+    if zstandard is not None:
+        return CODEC_ZSTD, zstandard.ZstdCompressor(level=6).compress(raw)
+    return CODEC_ZLIB, zlib.compress(raw, 6)
+
+
+def _decompress(codec, raw):
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(raw)
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise ValueError("Meeting body is zstd-compressed; install the zstandard package to read it")
+        return zstandard.ZstdDecompressor().decompress(raw)
+    raise ValueError(f"Unknown meeting body codec {codec}")
+
+
+# --- Segment sidecar ---
+
+def write_segments(path, segments):
+    """Write {speaker, start, end} segments as fixed-width records"""
+    speakers = {}
+    records = []
+    for seg in segments:
+        sid = speakers.setdefault(str(seg.get("speaker", "Unknown")), len(speakers))
+        records.append(_SEGMENT_RECORD.pack(float(seg.get("start", 0)), float(seg.get("end", 0)), sid))
+    table = json.dumps(list(speakers)).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(_SEGMENT_PREFIX.pack(SEGMENT_MAGIC, VERSION, len(records), len(table)))
+        f.write(table)
+        f.writelines(records)
+
+
+class SegmentFile:
+    """Read-only, memory-mapped view of a .seg sidecar
+
+    Segments are decoded one record at a time on access, so a timeline
+    query touches only the pages it reads.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self._count, table_length = _SEGMENT_PREFIX.unpack_from(self._map)
+        if magic != SEGMENT_MAGIC or version != VERSION:
+            raise ValueError(f"Not a segment file: {path}")
+        table_start = _SEGMENT_PREFIX.size
+        self.speakers = json.loads(self._map[table_start:table_start + table_length])
+        self._records = table_start + table_length
+
+    def __len__(self):
+        return self._count
+
+    def record(self, i):
+        """(start, end, speaker) of segment i"""
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        start, end, sid = _SEGMENT_RECORD.unpack_from(self._map, self._records + i * _SEGMENT_RECORD.size)
+        return start, end, self.speakers[sid]
+
+    def __getitem__(self, i):
+        start, end, speaker = self.record(i)
+        return {"speaker": speaker, "start": start, "end": end}
+
+    def __iter__(self):
+        for start, end, sid in _SEGMENT_RECORD.iter_unpack(
+                self._map[self._records:self._records + self._count * _SEGMENT_RECORD.size]):
+            yield {"speaker": self.speakers[sid], "start": start, "end": end}
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def sidecar_path(path):
+    return os.path.splitext(path)[0] + ".seg"
+
+
+# --- Compact container ---
+
+def encode(meeting, segments_file=None):
+    """Bytes of a .mtg document; segments_file names a sidecar that holds the segments instead"""
+    header = {k: v for k, v in meeting.items() if k not in BODY_FIELDS and k != "file_name"}
+    body = {k: meeting[k] for k in BODY_FIELDS if k in meeting}
+    if segments_file is not None:
+        body.pop("segments", None)
+        header["segments_file"] = segments_file
+    header_raw = _dumps(header)
+    codec, body_raw = _compress(_dumps(body))
+    return _PREFIX.pack(MAGIC, VERSION, codec, 0, len(header_raw), len(body_raw)) + header_raw + body_raw
+
+
+def _split(raw):
+    magic, version, codec, _, header_length, body_length = _PREFIX.unpack_from(raw)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a compact meeting document (or unsupported version)")
+    header_end = _PREFIX.size + header_length
+    return codec, raw[_PREFIX.size:header_end], raw[header_end:header_end + body_length]
+
+
+def decode_header(raw):
+    """Header fields of a .mtg document, leaving the body undecoded"""
+    _, header, _ = _split(raw)
+    meeting = _loads(header)
+    meeting.pop("segments_file", None)
+    return meeting
+
+
+def decode(raw, folder=None):
+    """Full meeting from a .mtg document; folder locates a segments sidecar"""
+    codec, header, body = _split(raw)
+    meeting = _loads(header)
+    meeting.update(_loads(_decompress(codec, body)))
+    segments_file = meeting.pop("segments_file", None)
+    if segments_file is not None:
+        with SegmentFile(os.path.join(folder or ".", segments_file)) as segments:
+            meeting["segments"] = list(segments)
+    return meeting
+
+
+# --- File-level API used by the catalog and the writers ---
+
+def is_compact(file_name):
+    return file_name.endswith(FORMATS["compact"])
+
+
+def parse(file_name, raw, folder, header_only=False):
+    """Meeting dict from a file's bytes; header_only skips compact bodies"""
+    if not is_compact(file_name):
+        return json.loads(raw)
+    return decode_header(raw) if header_only else decode(raw, folder)
+
+
+def header_fields(meeting):
+    """The part of a meeting a compact document keeps in its header"""
+    return {k: v for k, v in meeting.items() if k not in BODY_FIELDS}
+
+
+def read_meeting(path):
+    with open(path, "rb") as f:
+        return parse(path, f.read(), os.path.dirname(path))
+
+
+def read_header(path):
+    """Listing fields of a meeting without decoding its transcript body"""
+    if not is_compact(path):
+        return read_meeting(path)
+    with open(path, "rb") as f:
+        prefix = f.read(_PREFIX.size)
+        return decode_header(prefix + f.read(_PREFIX.unpack(prefix)[4]))
+
+
+def find_meeting(folder, stem):
+    """File name of the stored meeting with this stem, in any format"""
+    for extension in EXTENSIONS:
+        if os.path.exists(os.path.join(folder, stem + extension)):
+            return stem + extension
+    return None
+
+
+def write_meeting(folder, stem, meeting, fmt=None):
+    """Atomically store a meeting as <stem>.json or <stem>.mtg; returns the file name
+
+    Copies of the same meeting in the other format are removed, so a stem
+    maps to one document.
+    """
+    fmt = fmt or DEFAULT_FORMAT
+    file_name = stem + FORMATS[fmt]
+    path = os.path.join(folder, file_name)
+    tmp_path = path + ".tmp"
+    meeting = {k: v for k, v in meeting.items() if k != "file_name"}
+
+    seg_path = sidecar_path(path)
+    if fmt == "compact":
+        segments = meeting.get("segments") or []
+        use_sidecar = len(segments) >= SIDECAR_MIN_SEGMENTS
+        if use_sidecar:
+            write_segments(seg_path + ".tmp", segments)
+            os.replace(seg_path + ".tmp", seg_path)
+        with open(tmp_path, "wb") as f:
+            f.write(encode(meeting, os.path.basename(seg_path) if use_sidecar else None))
+    else:
+        use_sidecar = False
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meeting, f, indent=2)
+    os.replace(tmp_path, path)
+
+    if not use_sidecar and os.path.exists(seg_path):
+        os.remove(seg_path)
+    for extension in EXTENSIONS:
+        if extension != FORMATS[fmt] and os.path.exists(os.path.join(folder, stem + extension)):
+            os.remove(os.path.join(folder, stem + extension))
+    return file_name
+
+
+def delete_meeting(folder, file_name):
+    """Remove a stored meeting and its segments sidecar"""
+    path = os.path.join(folder, file_name)
+    for target in (path, sidecar_path(path)):
+        if os.path.exists(target):
+            os.remove(target)
+
+
+# --- Migration / export tool ---
+
+def migrate(folder, fmt, dry_run=False):
+    """Rewrite every meeting in folder into fmt; returns (converted, bytes before, bytes after)"""
+    converted = before = after = 0
+    target = FORMATS[fmt]
+    for name in sorted(os.listdir(folder)):
+        stem, extension = os.path.splitext(name)
+        if extension not in EXTENSIONS or extension == target:
+            continue
+        path = os.path.join(folder, name)
+        size = os.path.getsize(path) + (os.path.getsize(sidecar_path(path))
+                                        if os.path.exists(sidecar_path(path)) else 0)
+        meeting = read_meeting(path)
+        converted += 1
+        before += size
+        if dry_run:
+            after += len(encode(meeting)) if fmt == "compact" else len(json.dumps(meeting, indent=2))
+            continue
+        new_name = write_meeting(folder, stem, meeting, fmt)
+        new_path = os.path.join(folder, new_name)
+        after += os.path.getsize(new_path) + (os.path.getsize(sidecar_path(new_path))
+                                              if os.path.exists(sidecar_path(new_path)) else 0)
+    return converted, before, after
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Meeting storage tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+    convert = commands.add_parser("migrate", help="convert every meeting in a folder to one format")
+    convert.add_argument("folder", nargs="?", default="data")
+    convert.add_argument("--to", choices=sorted(FORMATS), default="compact")
+    convert.add_argument("--dry-run", action="store_true", help="report sizes without writing")
+    show = commands.add_parser("cat", help="print a stored meeting as JSON")
+    show.add_argument("path")
+    show.add_argument("--header", action="store_true", help="only the listing fields")
+    args = parser.parse_args(argv)
+
+    if args.command == "cat":
+        meeting = read_header(args.path) if args.header else read_meeting(args.path)
+        json.dump(meeting, sys.stdout, indent=2)
+        print()
+        return
+
+    converted, before, after = migrate(args.folder, args.to, args.dry_run)
+    ratio = f" ({after / before:.0%} of original)" if before else ""
+    print(f"{'Would convert' if args.dry_run else 'Converted'} {converted} meeting(s) "
+          f"to {args.to}: {before} -> {after} bytes{ratio}")
+
+
+if __name__ == "__main__":
+    main()
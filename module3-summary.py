@@ -1,26 +1,65 @@
+import argparse
+import glob
 import json
 import re
-from datetime import datetime, timedelta
-import boto3
-from collections import Counter
-import nltk
-from nltk.tokenize import sent_tokenize, word_tokenize
-from nltk.corpus import stopwords
+from datetime import datetime
 import os
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import cached_property
+from heapq import heapify, heappop, heappush
+from transcript_model import Transcript, format_timestamp, parse_timestamp
+from meeting_analytics import compute_speaker_stats, extract_keywords
+import metrics
+import report_renderer
+import artifact_store
+import meeting_store
+import transcript_cleaner
+
+# Heavy dependencies (nltk, numpy/scipy, reportlab, boto3) are imported on first
+# use, so importing this module stays fast and never touches the network.
+
+# Offline mode: never download NLTK data (set VTT_OFFLINE=1 or pass --offline)
+OFFLINE_ENV = "VTT_OFFLINE"
+
+_nltk_ready = False
+
+
+def ensure_nltk_data():
+    """Check required NLTK data locally once per process, downloading only what is missing"""
+    global _nltk_ready
+    if _nltk_ready:
+        return
+    import nltk
+    # NLTK >= 3.9 loads the sentence tokenizer from punkt_tab instead of punkt
+    tokenizer = "punkt_tab" if hasattr(nltk.tokenize, "PunktTokenizer") else "punkt"
+    for resource, path in ((tokenizer, f"tokenizers/{tokenizer}"), ("stopwords", "corpora/stopwords")):
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            if os.environ.get(OFFLINE_ENV) == "1":
+                raise LookupError(
+                    f"NLTK resource '{resource}' is not installed and offline mode is on; "
+                    f"install it with: python -m nltk.downloader {resource}"
+                )
+            nltk.download(resource, quiet=True)
+    _nltk_ready = True
+
+
+def sent_tokenize(text):
+    ensure_nltk_data()
+    from nltk.tokenize import sent_tokenize as nltk_sent_tokenize
+    return nltk_sent_tokenize(text)
+
+
+def word_tokenize(text):
+    ensure_nltk_data()
+    from nltk.tokenize import word_tokenize as nltk_word_tokenize
+    return nltk_word_tokenize(text)
 
-# Download required NLTK data
-nltk.download('punkt', quiet=True)
-nltk.download('stopwords', quiet=True)
 
 class MeetingSummaryGenerator:
     def __init__(self):
-        # Get English stopwords
-        self.stop_words = set(stopwords.words('english'))
-        
         # Keywords for detecting action items and decisions
         self.action_keywords = [
             "will", "should", "must", "need to", "have to", "going to",
@@ -33,40 +72,44 @@ class MeetingSummaryGenerator:
             "concluded", "resolved", "determined", "chosen", "selected"
         ]
         
+        # One precompiled word-bounded alternation over both keyword lists;
+        # each matched keyword maps back to its category
+        self.keyword_kinds = {kw: "action" for kw in self.action_keywords}
+        self.keyword_kinds.update({kw: "decision" for kw in self.decision_keywords})
+        alternation = "|".join(
+            re.escape(kw).replace(r"\ ", r"\s+")
+            for kw in sorted(self.keyword_kinds, key=len, reverse=True)
+        )
+        self.keyword_pattern = re.compile(rf"\b(?:{alternation})\b", re.IGNORECASE)
+        
+    @cached_property
+    def stop_words(self):
+        """English stopwords, loaded on first use"""
+        ensure_nltk_data()
+        from nltk.corpus import stopwords
+        return set(stopwords.words('english'))
+    
     def load_transcript(self, filename="clean_transcript.json"):
-        """Load the clean transcript from JSON file"""
-        with open(filename, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        """Load the clean transcript (binary, columnar JSON or legacy JSON list)"""
+        return Transcript.load(filename)
     
     def calculate_duration(self, transcript):
-        """Calculate meeting duration from transcript timestamps"""
-        if not transcript:
-            return 0
-            
-        # Parse the last timestamp to get total duration
-        last_entry = transcript[-1]
-        time_str = last_entry['start_time']
-        
-        # Parse time format "H:MM:SS.microseconds"
-        time_parts = time_str.split(':')
-        hours = int(time_parts[0])
-        minutes = int(time_parts[1])
-        seconds = float(time_parts[2])
-        
-        total_minutes = hours * 60 + minutes + seconds / 60
-        return round(total_minutes)
+        """Calculate meeting duration (minutes) from transcript timestamps"""
+        transcript = Transcript.coerce(transcript)
+        return round(transcript.duration / 60)
     
     def extract_speakers(self, transcript):
         """Extract unique speakers from transcript"""
-        speakers = set()
-        for entry in transcript:
-            speakers.add(entry['speaker'])
-        return list(speakers)
+        return list(Transcript.coerce(transcript).speakers)
     
     def generate_extractive_summary(self, transcript, num_sentences=3):
-        """Generate summary using extractive summarization with NLTK"""
+        """Generate summary using extractive summarization with NLTK
+
+        Sentences are tokenized once into a sparse sentence x term count
+        matrix; word frequencies and sentence scores are matrix operations.
+        """
         # Combine all text
-        full_text = " ".join([entry['text'] for entry in transcript])
+        full_text = " ".join(Transcript.coerce(transcript).texts())
         
         # Tokenize into sentences
         sentences = sent_tokenize(full_text)
@@ -74,117 +117,138 @@ class MeetingSummaryGenerator:
         if len(sentences) <= num_sentences:
             return full_text
         
-        # Calculate word frequencies
-        words = word_tokenize(full_text.lower())
-        # Filter out stopwords and non-alphabetic tokens
-        words = [word for word in words if word.isalpha() and word not in self.stop_words]
-        word_freq = Counter(words)
+        import numpy as np
+        from scipy import sparse
         
-        # Score sentences based on word frequency
-        sentence_scores = {}
-        for sent in sentences:
-            sent_words = word_tokenize(sent.lower())
-            sent_words = [word for word in sent_words if word.isalpha() and word not in self.stop_words]
-            
-            if len(sent_words) > 0:
-                score = sum([word_freq[word] for word in sent_words if word in word_freq])
-                # Normalize by sentence length
-                sentence_scores[sent] = score / len(sent_words)
+        # Build the term-sentence matrix, keeping alphabetic non-stopword tokens
+        vocabulary = {}
+        rows, cols = [], []
+        for i, sent in enumerate(sentences):
+            for word in word_tokenize(sent.lower()):
+                if word.isalpha() and word not in self.stop_words:
+                    rows.append(i)
+                    cols.append(vocabulary.setdefault(word, len(vocabulary)))
         
-        # Get top sentences
-        top_sentences = sorted(sentence_scores.items(), 
-                             key=lambda x: x[1], reverse=True)[:num_sentences]
+        if not vocabulary:
+            return " ".join(sentences[:num_sentences])
         
-        # Sort by original order
-        summary_sentences = []
-        for sent in sentences:
-            for top_sent, _ in top_sentences:
-                if sent == top_sent:
-                    summary_sentences.append(sent)
-                    break
+        counts = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float64), (rows, cols)),
+            shape=(len(sentences), len(vocabulary))
+        )  # duplicate (row, col) pairs are summed into counts
         
-        summary = " ".join(summary_sentences)
+        # Word frequencies over the whole text, then each sentence's score is the
+        # sum of its words' frequencies normalized by sentence length
+        word_freq = np.asarray(counts.sum(axis=0)).ravel()
+        lengths = np.asarray(counts.sum(axis=1)).ravel()
+        scores = np.full(len(sentences), -np.inf)
+        scored = lengths > 0
+        scores[scored] = (counts @ word_freq)[scored] / lengths[scored]
+        
+        # Top-k without a full sort: argpartition finds the k-th best score, then
+        # sentences tied at it are taken earliest first, so ties are deterministic
+        k = min(num_sentences, int(scored.sum()))
+        if k <= 0:
+            return ""
+        threshold = scores[np.argpartition(-scores, k - 1)[k - 1]]
+        above = np.flatnonzero(scores > threshold)
+        tied = np.flatnonzero(scores == threshold)[:k - len(above)]
+        top = np.sort(np.concatenate((above, tied)))
+        
+        summary = " ".join(sentences[i] for i in top)
         return summary
     
-    def extract_action_items(self, transcript):
-        """Extract potential action items from transcript"""
-        action_items = []
-        
-        for entry in transcript:
-            text = entry['text'].lower()
-            
-            # Check for action keywords
-            for keyword in self.action_keywords:
-                if keyword in text:
-                    # Extract the sentence containing the keyword
-                    sentences = sent_tokenize(entry['text'])
-                    for sent in sentences:
-                        if keyword in sent.lower():
-                            action_items.append({
-                                'text': sent.strip(),
-                                'speaker': entry['speaker'],
-                                'timestamp': entry['start_time']
-                            })
-                            break
+    def extract_candidates(self, transcript):
+        """Find action-item and decision sentences in a single pass over the transcript
+
+        Each candidate carries the matched keyword spans (offsets into its
+        text) and a score: the number of distinct keywords it contains.
+        """
+        found = {"action": [], "decision": []}
+        seen = {"action": set(), "decision": set()}
         
-        # Remove duplicates
-        unique_items = []
-        seen = set()
-        for item in action_items:
-            if item['text'] not in seen:
-                unique_items.append(item)
-                seen.add(item['text'])
+        for speaker, start, _, entry_text in Transcript.coerce(transcript).turns():
+            self._collect_candidates(speaker, start, entry_text, found, seen)
         
-        return unique_items[:5]  # Limit to top 5 action items
+        return found["action"], found["decision"]
+    
+    def _collect_candidates(self, speaker, start, entry_text, found, seen):
+        """Append one turn's action/decision candidates to found, skipping texts in seen"""
+        # Cheap prefilter: only sentence-split entries that contain a keyword
+        if not self.keyword_pattern.search(entry_text):
+            return
+        for sent in sent_tokenize(entry_text):
+            text = sent.strip()
+            hits = {}
+            for match in self.keyword_pattern.finditer(text):
+                keyword = " ".join(match.group(0).lower().split())
+                hits.setdefault(self.keyword_kinds[keyword], []).append((keyword, match.span()))
+            
+            for kind, matches in hits.items():
+                # Remove duplicates
+                if text in seen[kind]:
+                    continue
+                seen[kind].add(text)
+                found[kind].append({
+                    'text': text,
+                    'speaker': speaker,
+                    'timestamp': format_timestamp(start),
+                    'spans': [span for _, span in matches],
+                    'score': len({keyword for keyword, _ in matches})
+                })
+    
+    @staticmethod
+    def _top_candidates(candidates, limit):
+        """Highest-scoring candidates (earliest first on ties), kept in transcript order"""
+        ranked = sorted(range(len(candidates)), key=lambda i: -candidates[i]['score'])[:limit]
+        return [candidates[i] for i in sorted(ranked)]
+    
+    def extract_action_items(self, transcript):
+        """Extract potential action items from transcript"""
+        action_items, _ = self.extract_candidates(transcript)
+        return self._top_candidates(action_items, 5)  # Limit to top 5 action items
     
     def extract_decisions(self, transcript):
         """Extract decisions made during the meeting"""
-        decisions = []
-        
-        for entry in transcript:
-            text = entry['text'].lower()
-            
-            # Check for decision keywords
-            for keyword in self.decision_keywords:
-                if keyword in text:
-                    sentences = sent_tokenize(entry['text'])
-                    for sent in sentences:
-                        if keyword in sent.lower():
-                            decisions.append({
-                                'text': sent.strip(),
-                                'speaker': entry['speaker'],
-                                'timestamp': entry['start_time']
-                            })
-                            break
-        
-        # Remove duplicates
-        unique_decisions = []
-        seen = set()
-        for decision in decisions:
-            if decision['text'] not in seen:
-                unique_decisions.append(decision)
-                seen.add(decision['text'])
-        
-        return unique_decisions[:3]  # Limit to top 3 decisions
+        _, decisions = self.extract_candidates(transcript)
+        return self._top_candidates(decisions, 3)  # Limit to top 3 decisions
     
     def generate_meeting_summary(self, transcript_file="clean_transcript.json"):
         """Generate complete meeting summary"""
         # Load transcript
-        transcript = self.load_transcript(transcript_file)
+        with metrics.stage("summary.load_transcript"):
+            transcript = self.load_transcript(transcript_file)
+        metrics.FILES_READ.inc(component="summarizer")
+        return self.summarize_transcript(transcript, transcript_file)
+    
+    def summarize_transcript(self, transcript, transcript_file=None):
+        """Generate complete meeting summary for an already loaded transcript"""
+        transcript = Transcript.coerce(transcript)
         
         # Extract metadata
-        duration = self.calculate_duration(transcript)
-        speakers = self.extract_speakers(transcript)
+        with metrics.stage("summary.metadata"):
+            duration = self.calculate_duration(transcript)
+            speakers = self.extract_speakers(transcript)
         
         # Generate summary components
-        summary_text = self.generate_extractive_summary(transcript)
-        action_items = self.extract_action_items(transcript)
-        decisions = self.extract_decisions(transcript)
+        with metrics.stage("summary.extractive_summary"):
+            summary_text = self.generate_extractive_summary(transcript)
+        with metrics.stage("summary.action_items_decisions"):
+            action_items, decisions = self.extract_candidates(transcript)
+            action_items = self._top_candidates(action_items, 5)
+            decisions = self._top_candidates(decisions, 3)
         
-        # Create meeting summary object
-        meeting_summary = {
-            "meeting_id": f"M{datetime.now().strftime('%Y%m%d-%H%M')}",
-            "date": datetime.now().strftime("%Y-%m-%d"),
+        return self._summary_dict(duration, speakers, summary_text, action_items, decisions,
+                                  transcript_file, len(transcript))
+    
+    @staticmethod
+    def _summary_dict(duration, speakers, summary_text, action_items, decisions,
+                      transcript_file, total_segments, started_at=None):
+        """Create meeting summary object"""
+        started_at = started_at or datetime.now()
+        return {
+            "meeting_id": f"M{started_at.strftime('%Y%m%d-%H%M')}",
+            "date": started_at.strftime("%Y-%m-%d"),
             "duration_minutes": duration,
             "participants": speakers,
             "summary": summary_text,
@@ -193,88 +257,43 @@ class MeetingSummaryGenerator:
             "metadata": {
                 "generated_at": datetime.now().isoformat(),
                 "transcript_file": transcript_file,
-                "total_segments": len(transcript)
+                "total_segments": total_segments
             }
         }
-        
-        return meeting_summary
+    
+    def incremental(self, num_sentences=3, transcript_file=None):
+        """Start a running summary that is updated one speaker turn at a time"""
+        return IncrementalSummary(self, num_sentences, transcript_file)
+    
+    def to_dashboard_meeting(self, summary, transcript):
+        """Add the fields the dashboard expects (segments, speaker stats, keywords)"""
+        meeting = dict(summary)
+        meeting["segments"] = [
+            {"speaker": speaker, "start": start, "end": end}
+            for speaker, start, end, _ in Transcript.coerce(transcript).turns()
+        ]
+        meeting["speaker_stats"] = compute_speaker_stats(meeting["segments"])
+        meeting["keywords"] = extract_keywords(meeting["summary"])
+        return meeting
+    
+    def save_summary(self, summary, outputs):
+        """Write the summary to every {format: filename} in outputs (json, txt, pdf) in one pass"""
+        report_renderer.render(summary, outputs)
+        for fmt, filename in outputs.items():
+            metrics.count_written("summarizer", filename)
+            print(f"{fmt.upper()} summary saved to {filename}")
     
     def save_summary_to_json(self, summary, filename="meeting_summary.json"):
         """Save summary to JSON file"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2)
-        print(f"Summary saved to {filename}")
+        self.save_summary(summary, {"json": filename})
     
     def save_summary_to_txt(self, summary, filename="meeting_summary.txt"):
         """Save summary to text file"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write("MEETING SUMMARY\n")
-            f.write("="*50 + "\n\n")
-            f.write(f"Meeting ID: {summary['meeting_id']}\n")
-            f.write(f"Date: {summary['date']}\n")
-            f.write(f"Duration: {summary['duration_minutes']} minutes\n")
-            f.write(f"Participants: {', '.join(summary['participants'])}\n\n")
-            
-            f.write("SUMMARY:\n")
-            f.write(summary['summary'] + "\n\n")
-            
-            if summary['action_items']:
-                f.write("ACTION ITEMS:\n")
-                for i, item in enumerate(summary['action_items'], 1):
-                    f.write(f"{i}. {item}\n")
-                f.write("\n")
-            
-            if summary['decisions']:
-                f.write("KEY DECISIONS:\n")
-                for i, decision in enumerate(summary['decisions'], 1):
-                    f.write(f"{i}. {decision}\n")
-        
-        print(f"Text summary saved to {filename}")
+        self.save_summary(summary, {"txt": filename})
     
     def save_summary_to_pdf(self, summary, filename="meeting_summary.pdf"):
         """Save summary to PDF file"""
-        doc = SimpleDocTemplate(filename, pagesize=letter)
-        styles = getSampleStyleSheet()
-        story = []
-        
-        # Title
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor='darkblue',
-            spaceAfter=30
-        )
-        story.append(Paragraph("Meeting Summary", title_style))
-        
-        # Meeting metadata
-        story.append(Paragraph(f"<b>Meeting ID:</b> {summary['meeting_id']}", styles['Normal']))
-        story.append(Paragraph(f"<b>Date:</b> {summary['date']}", styles['Normal']))
-        story.append(Paragraph(f"<b>Duration:</b> {summary['duration_minutes']} minutes", styles['Normal']))
-        story.append(Paragraph(f"<b>Participants:</b> {', '.join(summary['participants'])}", styles['Normal']))
-        story.append(Spacer(1, 0.2*inch))
-        
-        # Summary
-        story.append(Paragraph("<b>Summary:</b>", styles['Heading2']))
-        story.append(Paragraph(summary['summary'], styles['Normal']))
-        story.append(Spacer(1, 0.2*inch))
-        
-        # Action Items
-        if summary['action_items']:
-            story.append(Paragraph("<b>Action Items:</b>", styles['Heading2']))
-            for item in summary['action_items']:
-                story.append(Paragraph(f"• {item}", styles['Normal']))
-            story.append(Spacer(1, 0.2*inch))
-        
-        # Decisions
-        if summary['decisions']:
-            story.append(Paragraph("<b>Key Decisions:</b>", styles['Heading2']))
-            for decision in summary['decisions']:
-                story.append(Paragraph(f"• {decision}", styles['Normal']))
-        
-        # Build PDF
-        doc.build(story)
-        print(f"PDF summary saved to {filename}")
+        self.save_summary(summary, {"pdf": filename})
     
     def upload_to_s3(self, filename, bucket_name, s3_key=None):
         """Upload file to S3 bucket"""
@@ -282,31 +301,295 @@ class MeetingSummaryGenerator:
             s3_key = f"summaries/{os.path.basename(filename)}"
         
         try:
-            s3_client = boto3.client('s3')
-            s3_client.upload_file(filename, bucket_name, s3_key)
-            print(f"File uploaded to s3://{bucket_name}/{s3_key}")
+            url = artifact_store.open_store(f"s3://{bucket_name}").upload(filename, s3_key)
+            print(f"File uploaded to {url}")
             return True
         except Exception as e:
             print(f"Error uploading to S3: {e}")
             return False
+    
+    def upload_artifacts(self, filenames, location):
+        """Upload files concurrently to an artifact store (s3://bucket/prefix or a directory)"""
+        results = artifact_store.open_store(location).upload_many((name, None) for name in filenames)
+        for filename, url, error in results:
+            if error is None:
+                print(f"File uploaded to {url}")
+            else:
+                print(f"Error uploading {filename}: {error}")
+        return all(error is None for _, _, error in results)
 
-# Main execution
-if __name__ == "__main__":
-    # Initialize the generator
-    generator = MeetingSummaryGenerator()
+class IncrementalSummary:
+    """Running minutes for a transcript that is still being produced
+
+    Keeps word frequencies, a postings list per word (the sentences that
+    use it and how often), each sentence's running score and the action /
+    decision candidates as state. A score is the sentence's counts dotted
+    with the current frequencies, kept as an exact integer numerator over
+    the sentence length. Adding a turn tokenizes only that turn, then
+    updates the numerators of just the earlier sentences that share one of
+    its words, so its cost follows the turn and those words' postings, not
+    the meeting. Changed scores are pushed onto a max-heap; reading the
+    summary pops the best current entries (skipping outdated ones), so it
+    costs O(k log n) rather than a pass over every sentence.
+
+    Sentences are split per turn rather than over the joined text, so a
+    turn without closing punctuation does not merge with the next one as
+    it can in generate_extractive_summary.
+    """
+
+    def __init__(self, generator, num_sentences=3, transcript_file=None):
+        self.generator = generator
+        self.num_sentences = num_sentences
+        self.transcript_file = transcript_file
+        self.started_at = datetime.now()
+        self.transcript = Transcript()
+        self.duration_seconds = 0.0
+        self.sentences = []              # sentence texts, in transcript order
+        self.lengths = []                # scored tokens per sentence
+        self.numerators = []             # sum over the sentence's words of count x frequency
+        self.scores = []                 # numerator / length, None for sentences without scored words
+        self.vocabulary = {}             # word -> term id
+        self.word_freq = []              # term id -> occurrences so far
+        self.postings = []               # term id -> [(sentence index, count)]
+        self._heap = []                  # (-score, sentence index); entries go stale as scores grow
+        self._top = None                 # cached summary sentence indices; None when stale
+        self.found = {"action": [], "decision": []}
+        self.seen = {"action": set(), "decision": set()}
+
+    def add_turn(self, speaker, start, end, text):
+        """Fold one speaker turn (the cleaner's turn record) into the running state"""
+        stop_words = self.generator.stop_words
+        self.transcript.append(speaker, start, end, text)
+        self.duration_seconds = max(self.duration_seconds, end)
+
+        new = []           # (sentence index, [(term id, count)]) for this turn's sentences
+        added = Counter()  # term id -> occurrences in this turn
+        for sent in sent_tokenize(text):
+            counts = Counter(word for word in word_tokenize(sent.lower())
+                             if word.isalpha() and word not in stop_words)
+            pairs = []
+            for word, count in counts.items():
+                term = self.vocabulary.setdefault(word, len(self.vocabulary))
+                if term == len(self.word_freq):
+                    self.word_freq.append(0)
+                    self.postings.append([])
+                pairs.append((term, count))
+                added[term] += count
+            new.append((len(self.sentences), pairs))
+            self.sentences.append(sent)
+            self.lengths.append(sum(counts.values()))
+            self.numerators.append(0)
+            self.scores.append(None)
+
+        # Frequencies only grow: the turn's words raise the score of each earlier sentence using them
+        changed = set()
+        for term, delta in added.items():
+            self.word_freq[term] += delta
+            for index, count in self.postings[term]:
+                self.numerators[index] += count * delta
+                changed.add(index)
+        for index, pairs in new:
+            for term, count in pairs:
+                self.postings[term].append((index, count))
+            if pairs:
+                self.numerators[index] = sum(count * self.word_freq[term] for term, count in pairs)
+                changed.add(index)
+        for index in changed:
+            self.scores[index] = self.numerators[index] / self.lengths[index]
+            heappush(self._heap, (-self.scores[index], index))
+        if len(self._heap) > 4 * len(self.sentences) + 64:
+            self._compact()
+        self._top = None
+
+        self.generator._collect_candidates(speaker, start, text, self.found, self.seen)
+        return self
+
+    def _compact(self):
+        """Rebuild the heap from the current scores, dropping stale entries"""
+        self._heap = [(-score, i) for i, score in enumerate(self.scores) if score is not None]
+        heapify(self._heap)
+
+    @property
+    def top(self):
+        """Indices of the current summary sentences, highest score first (earliest on ties)"""
+        if self._top is None:
+            top, popped = [], []
+            while self._heap and len(top) < self.num_sentences:
+                entry = heappop(self._heap)
+                if -entry[0] == self.scores[entry[1]]:  # otherwise outdated by a later turn
+                    top.append(entry[1])
+                    popped.append(entry)
+            for entry in popped:
+                heappush(self._heap, entry)
+            self._top = top
+        return self._top
+
+    def feed(self, turns):
+        """Add (speaker, start, end, text) records or {speaker, start_time, text} dicts"""
+        for turn in turns:
+            if isinstance(turn, dict):
+                start = parse_timestamp(turn["start_time"])
+                end = parse_timestamp(turn["end_time"]) if "end_time" in turn else start
+                self.add_turn(turn["speaker"], start, end, turn["text"])
+            else:
+                self.add_turn(*turn)
+        return self
+
+    def summary_text(self):
+        if len(self.sentences) <= self.num_sentences:
+            return " ".join(self.transcript.texts())
+        if not self.top:
+            return " ".join(self.sentences[:self.num_sentences])
+        return " ".join(self.sentences[i] for i in sorted(self.top))
+
+    def summary(self):
+        """The current meeting summary, in the same shape as summarize_transcript()"""
+        top_candidates = MeetingSummaryGenerator._top_candidates
+        return MeetingSummaryGenerator._summary_dict(
+            round(self.duration_seconds / 60),
+            list(self.transcript.speakers),
+            self.summary_text(),
+            top_candidates(self.found["action"], 5),
+            top_candidates(self.found["decision"], 3),
+            self.transcript_file,
+            len(self.transcript),
+            self.started_at,
+        )
+
+
+# --- Batch mode: summarize a directory of transcripts across cores ---
+
+TRANSCRIPT_EXTENSIONS = (".json", ".bin")
+
+_worker_generator = None
+
+
+def _init_batch_worker():
+    """Build one MeetingSummaryGenerator per worker process"""
+    global _worker_generator
+    ensure_nltk_data()
+    _worker_generator = MeetingSummaryGenerator()
+    _worker_generator.stop_words  # load once per worker, not per transcript
+
+
+def find_transcripts(source):
+    """Expand a directory or glob pattern into transcript file paths"""
+    if os.path.isdir(source):
+        paths = [os.path.join(source, name) for name in os.listdir(source)
+                 if name.endswith(TRANSCRIPT_EXTENSIONS)]
+    else:
+        paths = glob.glob(source)
+    return sorted(paths)
+
+
+def batch_output_path(transcript_file, output_dir):
+    """data/<transcript name>.<ext> for a transcript file, in whichever format it is stored"""
+    stem = os.path.splitext(os.path.basename(transcript_file))[0]
+    existing = meeting_store.find_meeting(output_dir, stem)
+    return os.path.join(output_dir, existing or stem + meeting_store.FORMATS[meeting_store.DEFAULT_FORMAT])
+
+
+def is_up_to_date(transcript_file, output_path):
+    return (os.path.exists(output_path)
+            and os.path.getmtime(output_path) >= os.path.getmtime(transcript_file))
+
+
+def summarize_to_dashboard(transcript_file, output_dir):
+    """Worker task: summarize one transcript into the dashboard's data folder"""
+    generator = _worker_generator or MeetingSummaryGenerator()
+    transcript = generator.load_transcript(transcript_file)
+    summary = generator.summarize_transcript(transcript, transcript_file)
+    
+    # Stable ids/dates from the input file, so reruns overwrite rather than duplicate
+    stem = os.path.splitext(os.path.basename(transcript_file))[0]
+    summary["meeting_id"] = stem
+    summary["date"] = datetime.fromtimestamp(os.path.getmtime(transcript_file)).strftime("%Y-%m-%d")
+    meeting = generator.to_dashboard_meeting(summary, transcript)
+    
+    # Write atomically: an interrupted run never leaves a partial (or "up to date") output
+    return os.path.join(output_dir, meeting_store.write_meeting(output_dir, stem, meeting))
+
+
+def run_batch(source, output_dir="data", workers=None, force=False):
+    """Summarize every transcript matching source; returns (written, skipped, failed)"""
+    os.makedirs(output_dir, exist_ok=True)
+    transcripts = find_transcripts(source)
+    pending = [path for path in transcripts
+               if force or not is_up_to_date(path, batch_output_path(path, output_dir))]
+    skipped = len(transcripts) - len(pending)
+    print(f"{len(transcripts)} transcript(s) found, {skipped} already up to date")
     
-    # Generate meeting summary from existing clean_transcript.json
-    print("Generating meeting summary...")
-    summary = generator.generate_meeting_summary("clean_transcript.json")
+    written, failed = 0, 0
+    if not pending:
+        return written, skipped, failed
     
-    # Save to JSON
-    generator.save_summary_to_json(summary)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker) as pool:
+        futures = {pool.submit(summarize_to_dashboard, path, output_dir): path for path in pending}
+        for future in as_completed(futures):
+            try:
+                print(f"Saved {future.result()}")
+                written += 1
+            except Exception as e:
+                print(f"Error summarizing {futures[future]}: {e}")
+                failed += 1
+    return written, skipped, failed
+
+
+def run_live(generator, transcribe_file, every=25):
+    """Summarize a Transcribe output turn by turn as the cleaner yields it"""
+    running = generator.incremental(transcript_file=transcribe_file)
+    turns = transcript_cleaner.iter_turn_records(
+        transcript_cleaner.iter_words(transcript_cleaner.iter_items(transcribe_file)))
+    for count, turn in enumerate(turns, 1):
+        running.add_turn(*turn)
+        if count % every == 0:
+            print(f"[{format_timestamp(turn[2])}] Running minutes: {running.summary_text()}")
+    return running.summary()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate meeting summaries from clean transcripts")
+    parser.add_argument("transcript", nargs="?", default="clean_transcript.json",
+                        help="transcript for single-meeting mode")
+    parser.add_argument("--batch", metavar="DIR_OR_GLOB",
+                        help="summarize every transcript in a directory or glob into --output-dir")
+    parser.add_argument("--output-dir", default="data", help="batch output folder (dashboard data)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--force", action="store_true", help="reprocess even if outputs are up to date")
+    parser.add_argument("--store", default="s3://your-meeting-summaries-bucket/summaries",
+                        help="where to upload the summary files: s3://bucket/prefix or a directory")
+    parser.add_argument("--live", metavar="TRANSCRIBE_JSON",
+                        help="stream a Transcribe output through the cleaner, printing running minutes")
+    parser.add_argument("--every", type=int, default=25,
+                        help="speaker turns between running-minute updates in --live mode")
+    parser.add_argument("--offline", action="store_true",
+                        help="use only locally installed NLTK data (same as VTT_OFFLINE=1)")
+    args = parser.parse_args(argv)
     
-    # Save to TXT
-    generator.save_summary_to_txt(summary)
+    if args.offline:
+        os.environ[OFFLINE_ENV] = "1"  # inherited by batch worker processes
     
-    # Save to PDF
-    generator.save_summary_to_pdf(summary)
+    if args.batch:
+        written, skipped, failed = run_batch(args.batch, args.output_dir, args.workers, args.force)
+        print(f"Batch complete: {written} written, {skipped} skipped, {failed} failed")
+        return
+    
+    # Initialize the generator
+    generator = MeetingSummaryGenerator()
+    
+    if args.live:
+        summary = run_live(generator, args.live, args.every)
+    else:
+        # Generate meeting summary from existing clean_transcript.json
+        print("Generating meeting summary...")
+        summary = generator.generate_meeting_summary(args.transcript)
+    
+    # Save to JSON, TXT and PDF from one report layout
+    generator.save_summary(summary, {
+        "json": "meeting_summary.json",
+        "txt": "meeting_summary.txt",
+        "pdf": "meeting_summary.pdf",
+    })
     
     # Print summary to console
     print("\n" + "="*50)
@@ -314,8 +597,11 @@ if __name__ == "__main__":
     print("="*50)
     print(json.dumps(summary, indent=2))
 
-     # Upload to S3 (configure bucket name first)
-    bucket_name = "your-meeting-summaries-bucket"
-    generator.upload_to_s3("meeting_summary.json", bucket_name)
-    generator.upload_to_s3("meeting_summary.txt", bucket_name)
-    generator.upload_to_s3("meeting_summary.pdf", bucket_name)
+    # Upload to S3 (configure bucket name first) or another artifact store
+    generator.upload_artifacts(
+        ["meeting_summary.json", "meeting_summary.txt", "meeting_summary.pdf"], args.store)
+
+
+# Main execution
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import os
+import uuid
+from datetime import datetime
+
+from meeting_analytics import compute_speaker_stats, extract_keywords
+from transcript_model import format_timestamp
+import artifact_store
+import audio_preprocess
+import meeting_store
+import transcript_cleaner
+import transcription
+
+
+def transcribe_chunks(chunk_folder, engine_name):
+    """Turns, segments and word timings of a preprocessed recording, via a transcription engine"""
+    transcription.transcribe_manifest(transcription.open_engine(engine_name), chunk_folder)
+    words = list(transcript_cleaner.iter_words(transcript_cleaner.iter_manifest_items(chunk_folder)))
+    turns = list(transcript_cleaner.iter_turn_records(words))
+    if not turns:
+        return {}
+    return {
+        "participants": sorted({speaker for speaker, _, _, _ in turns}),
+        "segments": [{"speaker": speaker, "start": start, "end": end} for speaker, start, end, _ in turns],
+        "transcript": [{"speaker": speaker, "start_time": format_timestamp(start),
+                        "end_time": format_timestamp(end), "text": text}
+                       for speaker, start, end, text in turns],
+        "words": list(transcript_cleaner.iter_word_timings(words)),
+    }
+
+
+def process_upload(payload):
+    """Turn an uploaded recording into a meeting summary JSON in the data folder
+
+    Runs inside a job worker. With a chunk folder and a transcription
+    engine configured, speaker turns, segments and word timings come from
+    the recording; the summary text is still simulated. The meeting
+    written here has the dashboard's schema.
+    """
+    data_folder = payload["data_folder"]
+
+    # --- Simulated summary generation (dummy data) ---
+    now = datetime.now()
+    # Workers run in parallel, so the minute alone is not unique: suffix the recording's
+    # hash (a retried job rewrites its own meeting, never another recording's)
+    suffix = (payload.get("audio_sha256") or uuid.uuid4().hex)[:8]
+    meeting_data = {
+        "meeting_id": f"M{now.strftime('%Y%m%d-%H%M')}-{suffix}",
+        "date": now.strftime("%Y-%m-%d"),
+        "duration_minutes": 5,
+        "participants": ["spk_0", "spk_1"],
+        "summary": "This is a mock summary generated after uploading the file.",
+        "action_items": ["Finalize report", "Send follow-up email"],
+        "decisions": ["Move to next sprint"],
+        "segments": [
+            {"speaker": "spk_0", "start": 0, "end": 60},
+            {"speaker": "spk_1", "start": 60, "end": 180}
+        ],
+        "audio_file": os.path.basename(payload["audio_path"]),
+        "audio_sha256": payload.get("audio_sha256"),
+        "source_filename": payload.get("source_filename"),
+    }
+
+    # Decode and split the recording into silence-delimited chunks with a timing manifest.
+    # Chunk folders are named by the audio's hash, so a retried job reuses finished work.
+    if payload.get("chunk_folder"):
+        chunk_id = payload.get("audio_sha256") or meeting_data["meeting_id"]
+        chunk_folder = os.path.join(payload["chunk_folder"], chunk_id)
+        try:
+            manifest = audio_preprocess.load_manifest(chunk_folder)
+        except FileNotFoundError:
+            try:
+                manifest = audio_preprocess.preprocess(payload["audio_path"], chunk_folder)
+            except audio_preprocess.DecoderUnavailable:
+                manifest = None  # no ffmpeg on this worker; keep the recording whole
+        if manifest is not None:
+            meeting_data["audio_manifest"] = os.path.join(chunk_folder, audio_preprocess.MANIFEST_NAME)
+            meeting_data["audio_chunks"] = len(manifest["chunks"])
+            meeting_data["duration_minutes"] = max(1, round(manifest["duration"] / 60))
+            if payload.get("transcription_engine"):
+                meeting_data.update(transcribe_chunks(chunk_folder, payload["transcription_engine"]))
+
+    # Precompute speaker stats and top 5 keywords at ingest time
+    meeting_data["speaker_stats"] = compute_speaker_stats(meeting_data["segments"])
+    meeting_data["keywords"] = extract_keywords(meeting_data["summary"])
+
+    # Archive the recording (multipart, in parallel for large files) when a store is configured
+    if payload.get("artifact_store"):
+        store = artifact_store.open_store(payload["artifact_store"])
+        meeting_data["audio_url"] = store.upload(payload["audio_path"], f"audio/{meeting_data['audio_file']}")
+
+    # Written atomically (MEETING_FORMAT) so the catalog watcher never sees a partial file
+    output_filename = meeting_store.write_meeting(data_folder, meeting_data["meeting_id"], meeting_data)
+
+    return {"file_name": output_filename, "meeting_id": meeting_data["meeting_id"]}
@@ -0,0 +1,136 @@
+"""Meeting reports in JSON, TXT and PDF from one document model
+
+A meeting (summarizer output or dashboard meeting) is laid out once by
+build_report() into a Report; each writer only walks that model. render()
+builds the model once and writes every requested format:
+
+    render(meeting, {"txt": "summary.txt", "pdf": "summary.pdf"})
+"""
+import json
+from functools import lru_cache
+from xml.sax.saxutils import escape
+
+import metrics
+
+
+class Section:
+    """A headed block: a paragraph of text or a list of items"""
+
+    __slots__ = ("heading", "text", "items", "numbered")
+
+    def __init__(self, heading, text=None, items=None, numbered=True):
+        self.heading = heading
+        self.text = text
+        self.items = items or []
+        self.numbered = numbered
+
+
+class Report:
+    """Layout-independent meeting report"""
+
+    __slots__ = ("title", "fields", "sections", "data")
+
+    def __init__(self, title, fields, sections, data):
+        self.title = title
+        self.fields = fields      # [(label, value)] metadata lines
+        self.sections = sections  # [Section]
+        self.data = data          # the source meeting, for JSON output
+
+
+def build_report(meeting):
+    """Lay out a meeting dict as a Report"""
+    fields = [
+        ("Meeting ID", str(meeting.get("meeting_id"))),
+        ("Date", str(meeting.get("date", "N/A"))),
+        ("Duration", f"{meeting.get('duration_minutes')} minutes"),
+        ("Participants", ", ".join(meeting.get("participants", []))),
+    ]
+    sections = [Section("Summary", text=meeting.get("summary") or "")]
+    if meeting.get("action_items"):
+        sections.append(Section("Action Items", items=meeting["action_items"]))
+    if meeting.get("decisions"):
+        sections.append(Section("Key Decisions", items=meeting["decisions"]))
+    if meeting.get("keywords"):
+        sections.append(Section(
+            "Keyword Analytics", numbered=False,
+            items=[f"{k}: {v} mentions" for k, v in meeting["keywords"].items()]))
+    return Report("Meeting Summary", fields, sections, meeting)
+
+
+def write_json(report, path):
+    meeting = {k: v for k, v in report.data.items() if k != "file_name"}  # catalog bookkeeping
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(meeting, f, indent=2)
+
+
+def write_txt(report, path):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(report.title.upper() + "\n")
+        f.write("=" * 50 + "\n\n")
+        for label, value in report.fields:
+            f.write(f"{label}: {value}\n")
+        for section in report.sections:
+            f.write(f"\n{section.heading.upper()}:\n")
+            if section.text is not None:
+                f.write(section.text + "\n")
+            for i, item in enumerate(section.items, 1):
+                marker = f"{i}." if section.numbered else "-"
+                f.write(f"{marker} {item}\n")
+
+
+@lru_cache(maxsize=None)
+def pdf_styles():
+    """Reportlab paragraph styles, built once per process"""
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+
+    styles = getSampleStyleSheet()
+    return {
+        "title": ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            textColor='darkblue',
+            spaceAfter=30
+        ),
+        "heading": styles['Heading2'],
+        "normal": styles['Normal'],
+    }
+
+
+def write_pdf(report, path):
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    from reportlab.lib.units import inch
+
+    styles = pdf_styles()
+    story = [Paragraph(escape(report.title), styles["title"])]
+    for label, value in report.fields:
+        story.append(Paragraph(f"<b>{escape(label)}:</b> {escape(value)}", styles["normal"]))
+    for section in report.sections:
+        story.append(Spacer(1, 0.2*inch))
+        story.append(Paragraph(f"<b>{escape(section.heading)}:</b>", styles["heading"]))
+        if section.text is not None:
+            story.append(Paragraph(escape(section.text), styles["normal"]))
+        for item in section.items:
+            story.append(Paragraph(f"• {escape(item)}", styles["normal"]))
+
+    SimpleDocTemplate(path, pagesize=letter).build(story)
+
+
+WRITERS = {
+    "json": write_json,
+    "txt": write_txt,
+    "pdf": write_pdf,
+}
+
+
+def render(meeting, outputs):
+    """Write a meeting to every {format: path} in outputs from a single layout pass"""
+    unknown = set(outputs) - set(WRITERS)
+    if unknown:
+        raise ValueError(f"Unsupported report format(s): {', '.join(sorted(unknown))}")
+    report = build_report(meeting)
+    for fmt, path in outputs.items():
+        with metrics.stage(f"report.{fmt}"):
+            WRITERS[fmt](report, path)
+    return outputs
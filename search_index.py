@@ -0,0 +1,159 @@
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+
+# Indexed columns and their bm25 weights (higher = more relevant)
+FIELDS = [
+    ("meeting_id", 5.0),
+    ("date", 3.0),
+    ("participants", 3.0),
+    ("summary", 2.0),
+    ("action_items", 1.5),
+    ("decisions", 1.5),
+    ("transcript", 1.0),
+]
+
+
+def _as_text(value):
+    if isinstance(value, list):
+        return " ".join(_as_text(v) for v in value)
+    if isinstance(value, dict):
+        return str(value.get("text", ""))
+    return "" if value is None else str(value)
+
+
+def _document(meeting):
+    """Flatten a meeting dict into the text columns of the index"""
+    transcript = meeting.get("transcript", meeting.get("segments", []))
+    return [
+        _as_text(meeting.get("meeting_id")),
+        _as_text(meeting.get("date")),
+        _as_text(meeting.get("participants", [])),
+        _as_text(meeting.get("summary")),
+        _as_text(meeting.get("action_items", [])),
+        _as_text(meeting.get("decisions", [])),
+        _as_text(transcript),
+    ]
+
+
+class SearchIndex:
+    """Persistent SQLite FTS5 index over the meetings in the catalog
+
+    Stored as a sidecar database next to the meeting files. Each document
+    keeps a signature so startup syncs and watcher events only rewrite
+    meetings whose content actually changed: content_hash(file_name), when
+    given, supplies it (the catalog already hashes every file); otherwise
+    the indexed text is hashed.
+    """
+
+    def __init__(self, db_path, content_hash=None):
+        self.db_path = db_path
+        self.content_hash = content_hash
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        columns = ", ".join(name for name, _ in FIELDS)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS docs ("
+                "id INTEGER PRIMARY KEY, file_name TEXT UNIQUE NOT NULL, signature TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS docs_fts USING fts5({columns}, prefix='2 3')"
+            )
+
+    def _signature(self, file_name, columns):
+        if self.content_hash is not None:
+            digest = self.content_hash(file_name)
+            if digest:
+                return digest
+        return hashlib.sha1(json.dumps(columns).encode("utf-8")).hexdigest()
+
+    def _upsert(self, file_name, meeting):
+        columns = _document(meeting)
+        signature = self._signature(file_name, columns)
+        row = self._conn.execute(
+            "SELECT id, signature FROM docs WHERE file_name = ?", (file_name,)
+        ).fetchone()
+        if row and row[1] == signature:
+            return
+        if row:
+            doc_id = row[0]
+            self._conn.execute("DELETE FROM docs_fts WHERE rowid = ?", (doc_id,))
+            self._conn.execute("UPDATE docs SET signature = ? WHERE id = ?", (signature, doc_id))
+        else:
+            doc_id = self._conn.execute(
+                "INSERT INTO docs (file_name, signature) VALUES (?, ?)", (file_name, signature)
+            ).lastrowid
+        placeholders = ", ".join("?" for _ in FIELDS)
+        self._conn.execute(
+            f"INSERT INTO docs_fts (rowid, {', '.join(n for n, _ in FIELDS)}) VALUES (?, {placeholders})",
+            [doc_id] + columns,
+        )
+
+    def _delete(self, file_name):
+        row = self._conn.execute("SELECT id FROM docs WHERE file_name = ?", (file_name,)).fetchone()
+        if row:
+            self._conn.execute("DELETE FROM docs_fts WHERE rowid = ?", (row[0],))
+            self._conn.execute("DELETE FROM docs WHERE id = ?", (row[0],))
+
+    def sync(self, file_names, load):
+        """Bring the index in line with the catalog's meetings (used at startup)
+
+        load(file_name) returns a full meeting, or None if it is gone. With
+        content_hash, only files whose hash differs from the stored
+        signature are loaded, one at a time.
+        """
+        with self._lock, self._conn:
+            stored = dict(self._conn.execute("SELECT file_name, signature FROM docs"))
+            for file_name in stored.keys() - set(file_names):
+                self._delete(file_name)
+            for file_name in file_names:
+                if self.content_hash is not None and stored.get(file_name) == self.content_hash(file_name):
+                    continue
+                meeting = load(file_name)
+                if meeting is not None:
+                    self._upsert(file_name, meeting)
+
+    def on_change(self, file_name, meeting):
+        """MeetingCatalog listener: index or drop a single meeting"""
+        with self._lock, self._conn:
+            if meeting is None:
+                self._delete(file_name)
+            else:
+                self._upsert(file_name, meeting)
+
+    @staticmethod
+    def _match_expression(query):
+        # Every term must match; each one is treated as a prefix
+        terms = re.findall(r"\w+", query.lower())
+        return " ".join(f'"{term}"*' for term in terms)
+
+    def search(self, query, limit=None, offset=0):
+        """Return matching file names, best match first; limit/offset select one page of them"""
+        expression = self._match_expression(query)
+        if not expression:
+            return []
+        weights = ", ".join(str(weight) for _, weight in FIELDS)
+        sql = (
+            "SELECT docs.file_name FROM docs_fts JOIN docs ON docs.id = docs_fts.rowid "
+            f"WHERE docs_fts MATCH ? ORDER BY bm25(docs_fts, {weights}) LIMIT ? OFFSET ?"
+        )
+        params = [expression, -1 if limit is None else limit, offset]
+        with self._lock:
+            return [row[0] for row in self._conn.execute(sql, params)]
+
+    def count(self, query):
+        """Number of meetings matching query"""
+        expression = self._match_expression(query)
+        if not expression:
+            return 0
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM docs_fts WHERE docs_fts MATCH ?", (expression,)
+            ).fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,62 @@
+// Minimal SVG bar chart for speaker talk time.
+// Reads {"speakers": [...], "minutes": [...]} from the data-series attribute
+// of every element with class "speaker-chart" and draws one bar per speaker.
+(function () {
+  "use strict";
+
+  var SVG_NS = "http://www.w3.org/2000/svg";
+  var COLORS = ["#7F3C8D", "#11A579", "#3969AC", "#F2B701", "#E73F74",
+                "#80BA5A", "#E68310", "#008695", "#CF1C90", "#f97b72"];
+
+  function el(name, attrs, text) {
+    var node = document.createElementNS(SVG_NS, name);
+    for (var key in attrs) node.setAttribute(key, attrs[key]);
+    if (text !== undefined) node.textContent = text;
+    return node;
+  }
+
+  function draw(container) {
+    var series = JSON.parse(container.getAttribute("data-series"));
+    var speakers = series.speakers, minutes = series.minutes;
+    if (!speakers.length) return;
+
+    var width = container.clientWidth || 600, height = 360;
+    var pad = {top: 20, right: 20, bottom: 50, left: 60};
+    var plotW = width - pad.left - pad.right, plotH = height - pad.top - pad.bottom;
+    var max = Math.max.apply(null, minutes) || 1;
+    var slot = plotW / speakers.length, barW = slot * 0.6;
+
+    var svg = el("svg", {width: width, height: height, role: "img",
+                         "aria-label": "Speaker Talk Time (mins)"});
+
+    // Y axis with five gridlines
+    for (var i = 0; i <= 5; i++) {
+      var value = max * i / 5, y = pad.top + plotH - plotH * i / 5;
+      svg.appendChild(el("line", {x1: pad.left, x2: width - pad.right, y1: y, y2: y,
+                                  stroke: "#e5e5e5"}));
+      svg.appendChild(el("text", {x: pad.left - 8, y: y + 4, "text-anchor": "end",
+                                  "font-size": 12, fill: "#555"}, value.toFixed(1)));
+    }
+    svg.appendChild(el("text", {x: 14, y: pad.top + plotH / 2, "font-size": 12, fill: "#555",
+                                transform: "rotate(-90 14 " + (pad.top + plotH / 2) + ")",
+                                "text-anchor": "middle"}, "Talk Time (mins)"));
+
+    speakers.forEach(function (speaker, idx) {
+      var barH = plotH * minutes[idx] / max;
+      var x = pad.left + slot * idx + (slot - barW) / 2;
+      var bar = el("rect", {x: x, y: pad.top + plotH - barH, width: barW, height: barH,
+                            fill: COLORS[idx % COLORS.length]});
+      bar.appendChild(el("title", {}, speaker + ": " + minutes[idx] + " mins"));
+      svg.appendChild(bar);
+      svg.appendChild(el("text", {x: x + barW / 2, y: height - pad.bottom + 20,
+                                  "text-anchor": "middle", "font-size": 12}, speaker));
+    });
+
+    container.appendChild(svg);
+  }
+
+  document.addEventListener("DOMContentLoaded", function () {
+    var charts = document.querySelectorAll(".speaker-chart");
+    for (var i = 0; i < charts.length; i++) draw(charts[i]);
+  });
+})();
@@ -0,0 +1,37 @@
+// Seek-to-timestamp playback for the meeting timeline.
+// Clicking a turn's timestamp seeks the page's audio player; whenever playback
+// is paused or seeked, the timeline API is asked who is speaking at that time.
+(function () {
+  "use strict";
+
+  function init(container) {
+    var audio = container.querySelector(".timeline-audio");
+    var now = container.querySelector(".timeline-now");
+    var api = container.getAttribute("data-api");
+    if (!audio) return;
+
+    container.addEventListener("click", function (event) {
+      var link = event.target.closest(".timeline-seek");
+      if (!link) return;
+      event.preventDefault();
+      audio.currentTime = parseFloat(link.getAttribute("data-start"));
+      audio.play();
+    });
+
+    function update() {
+      fetch(api + "?at=" + audio.currentTime.toFixed(2))
+        .then(function (response) { return response.json(); })
+        .then(function (data) {
+          now.textContent = data.speakers && data.speakers.length ? data.speakers.join(", ") : "–";
+        });
+    }
+
+    audio.addEventListener("seeked", update);
+    audio.addEventListener("pause", update);
+  }
+
+  document.addEventListener("DOMContentLoaded", function () {
+    var containers = document.querySelectorAll(".timeline");
+    for (var i = 0; i < containers.length; i++) init(containers[i]);
+  });
+})();
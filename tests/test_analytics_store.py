@@ -0,0 +1,97 @@
+"""Trigger-maintained rollups of the analytics store
+
+    python -m pytest -q tests
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from analytics_store import AnalyticsStore  # noqa: E402
+
+
+class AnalyticsRollupTest(unittest.TestCase):
+    """Trigger-maintained rollups must equal a fresh aggregate of the fact tables"""
+
+    ROLLUPS = {
+        "monthly": "SELECT month, COUNT(*), SUM(duration_minutes), SUM(action_items) FROM meetings GROUP BY month",
+        "speaker_month": "SELECT month, speaker, COUNT(*), SUM(minutes) FROM speaker_time GROUP BY month, speaker",
+        "keyword_quarter": "SELECT quarter, keyword, COUNT(*), SUM(count) FROM keyword_counts "
+                           "GROUP BY quarter, keyword",
+        "participant_month": "SELECT month, participant, COUNT(*), SUM(action_items) FROM participants "
+                             "GROUP BY month, participant",
+    }
+
+    def setUp(self):
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder, ignore_errors=True)
+        self.store = AnalyticsStore(os.path.join(folder, "analytics.db"))
+        self.addCleanup(self.store._conn.close)
+
+    def assertRollupsCurrent(self):
+        conn = self.store._conn
+        for table, query in self.ROLLUPS.items():
+            stored = sorted(conn.execute(f"SELECT * FROM {table}"))
+            expected = sorted(conn.execute(query))
+            self.assertEqual(len(stored), len(expected), table)
+            for row, fresh in zip(stored, expected):
+                self.assertEqual(row[:-2], fresh[:-2], table)
+                self.assertEqual(row[-2], fresh[-2], table)
+                self.assertAlmostEqual(row[-1], fresh[-1], places=6, msg=table)
+
+    def meeting(self, date, speakers, keywords, participants, actions):
+        return {"date": date, "duration_minutes": sum(speakers.values()), "speaker_stats": speakers,
+                "keywords": keywords, "participants": participants, "action_items": ["x"] * actions}
+
+    def test_rollups_follow_add_update_remove(self):
+        meetings = {
+            "a.mtg": self.meeting("2025-07-03", {"Alice": 3.5, "Bob": 1.25}, {"budget": 4}, ["Alice", "Bob"], 2),
+            "b.mtg": self.meeting("2025-07-20", {"Alice": 2.0}, {"budget": 1, "release": 2}, ["Alice"], 1),
+            "c.json": self.meeting("2025-09-01", {"Bob": 0.1}, {"release": 5}, ["Bob", "Bob"], 0),
+            "d.json": self.meeting("not a date", {"Carol": 7.0}, {}, [], 3),
+        }
+        self.store.sync(list(meetings), meetings.get)
+        self.assertRollupsCurrent()
+
+        self.store.on_change("a.mtg", self.meeting("2025-10-15", {"Alice": 9.0}, {"plan": 1}, ["Alice"], 0))
+        self.assertRollupsCurrent()
+        self.store.on_change("b.mtg", None)
+        self.assertRollupsCurrent()
+        self.store.on_change("e.mtg", self.meeting("2025-07-04", {"Bob": 2.5}, {"budget": 2}, ["Bob"], 4))
+        self.assertRollupsCurrent()
+
+        self.store.sync(["c.json"], meetings.get)
+        self.assertRollupsCurrent()
+        conn = self.store._conn
+        self.assertEqual(conn.execute("SELECT month, meetings FROM monthly").fetchall(), [("2025-09", 1)])
+
+        self.store.sync([], meetings.get)
+        for table in self.ROLLUPS:
+            self.assertEqual(conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0], 0, table)
+
+    def test_bounded_ranges_leave_out_undated_meetings(self):
+        meetings = {
+            "a.mtg": self.meeting("2025-07-03", {"Alice": 1.0}, {"budget": 1}, ["Alice"], 1),
+            "b.mtg": self.meeting("2025-11-20", {"Bob": 2.0}, {"release": 1}, ["Bob"], 2),
+            "c.mtg": self.meeting("", {"Carol": 3.0}, {"plan": 1}, ["Carol"], 3),
+        }
+        self.store.sync(list(meetings), meetings.get)
+
+        def months(start=None, end=None):
+            return [row["month"] for row in self.store.monthly_totals(start, end)]
+
+        self.assertEqual(months(), ["2025-07", "2025-11", "unknown"])
+        self.assertEqual(months("2025-08"), ["2025-11"])
+        self.assertEqual(months(end="2025-08"), ["2025-07"])
+        self.assertEqual([row["speaker"] for row in self.store.talk_time("2025-01")], ["Alice", "Bob"])
+        self.assertEqual([row["quarter"] for row in self.store.top_keywords("2025-Q3")], ["2025-Q3", "2025-Q4"])
+        self.assertEqual([row["participant"] for row in self.store.action_items_by_participant("2025-01")],
+                         ["Bob", "Alice"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+"""Silence splitting and per-chunk timing: chunk offsets must map back onto the recording
+
+    python -m pytest -q tests
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import wave
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import audio_preprocess  # noqa: E402
+from transcript_cleaner import iter_manifest_items  # noqa: E402
+from transcription import word_item  # noqa: E402
+
+# (start, end) seconds of each tone burst: short "sentences" separated by pauses,
+# and one 15 s stretch without a pause that has to be cut at max_chunk
+BURSTS = [(0.5, 2.0), (2.8, 4.3), (5.1, 6.6), (7.4, 8.9), (9.7, 11.2), (12.0, 27.0), (28.0, 29.5), (30.3, 31.8)]
+DURATION = 33.0
+SETTINGS = {"min_silence": 0.4, "min_chunk": 3.0, "max_chunk": 12.0}
+TOLERANCE = 2 * audio_preprocess.FRAME_SECONDS  # speech edges are judged per frame
+
+
+def write_recording(path, rate):
+    import numpy as np
+
+    t = np.arange(int(DURATION * rate)) / rate
+    samples = np.zeros_like(t)
+    for start, end in BURSTS:
+        inside = (t >= start) & (t < end)
+        samples[inside] = 0.25 * np.sin(2 * np.pi * 220 * t[inside])
+    with wave.open(path, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(np.round(samples * 32767).astype("<i2").tobytes())
+
+
+def speech_onset(t):
+    """Where speech resumes at or after t in the recording"""
+    for start, end in BURSTS:
+        if end > t:
+            return max(start, t)
+    return None
+
+
+class PreprocessTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.folder, ignore_errors=True)
+
+    def preprocess(self, rate=audio_preprocess.SAMPLE_RATE, workers=0, name="chunks"):
+        source = os.path.join(self.folder, f"recording_{rate}.wav")
+        if not os.path.exists(source):
+            write_recording(source, rate)
+        return audio_preprocess.preprocess(source, os.path.join(self.folder, name), workers=workers, **SETTINGS)
+
+    def assertChunksTile(self, manifest):
+        chunks = manifest["chunks"]
+        self.assertGreater(len(chunks), 3)
+        self.assertEqual(chunks[0]["offset_samples"], 0)
+        for before, after in zip(chunks, chunks[1:]):
+            self.assertEqual(after["offset_samples"], before["offset_samples"] + before["samples"])
+        total = sum(c["samples"] for c in chunks)
+        self.assertAlmostEqual(total / manifest["sample_rate"], DURATION, delta=0.01)
+        self.assertAlmostEqual(manifest["duration"], DURATION, delta=0.01)
+        for chunk in chunks[:-1]:
+            length = chunk["samples"] / manifest["sample_rate"]
+            self.assertGreaterEqual(length, SETTINGS["min_chunk"] - 0.01)
+            self.assertLessEqual(length, SETTINGS["max_chunk"] + 0.01)
+        for chunk in chunks:
+            path = os.path.join(self.folder, "chunks", chunk["file"])
+            with wave.open(path, "rb") as wav:
+                self.assertEqual(wav.getnframes(), chunk["samples"])
+
+    def test_chunks_tile_the_recording(self):
+        manifest = self.preprocess()
+        self.assertChunksTile(manifest)
+        # Cuts land in pauses, except the forced max_chunk cut inside the long stretch
+        for chunk in manifest["chunks"][1:]:
+            inside = [b for b in BURSTS if b[0] + TOLERANCE < chunk["start"] < b[1] - TOLERANCE]
+            self.assertTrue(not inside or inside == [(12.0, 27.0)], chunk["start"])
+
+    def test_resampled_source_keeps_the_timeline(self):
+        manifest = self.preprocess(rate=22050)
+        self.assertEqual(manifest["sample_rate"], audio_preprocess.SAMPLE_RATE)
+        self.assertChunksTile(manifest)
+
+    def test_process_pool_matches_inline(self):
+        inline = self.preprocess()
+        pooled = self.preprocess(workers=2, name="pooled")
+        for manifest in (inline, pooled):
+            del manifest["elapsed"]
+        self.assertEqual(pooled, inline)
+
+    def test_stitched_items_land_on_the_recording_timeline(self):
+        manifest = self.preprocess()
+        chunk_folder = os.path.join(self.folder, "chunks")
+        expected = []
+        for chunk in manifest["chunks"]:
+            if chunk["speech_start"] is None:
+                continue
+            # What a recognizer reports: times relative to the chunk
+            items = [word_item("word", chunk["speech_start"], chunk["speech_end"]),
+                     {"type": "punctuation", "alternatives": [{"confidence": "0.0", "content": "."}]}]
+            name = chunk["file"].replace(".wav", ".transcript.json")
+            with open(os.path.join(chunk_folder, name), "w", encoding="utf-8") as f:
+                json.dump({"results": {"items": items}}, f)
+            chunk["transcript"] = name
+            expected.append(speech_onset(chunk["start"]))
+        with open(os.path.join(chunk_folder, audio_preprocess.MANIFEST_NAME), "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+
+        stitched = list(iter_manifest_items(chunk_folder))
+        words = [item for item in stitched if item["type"] == "pronunciation"]
+        self.assertEqual(len(stitched), 2 * len(words))
+        self.assertEqual(len(words), len(expected))
+        for item, onset in zip(words, expected):
+            self.assertAlmostEqual(float(item["start_time"]), onset, delta=TOLERANCE)
+            self.assertGreater(float(item["end_time"]), float(item["start_time"]))
+
+    def test_shift_items_leaves_punctuation_alone(self):
+        punctuation = {"type": "punctuation", "alternatives": [{"confidence": "0.0", "content": ","}]}
+        shifted = list(audio_preprocess.shift_items([word_item("hi", 0.25, 0.5), punctuation], 60.0))
+        self.assertEqual((shifted[0]["start_time"], shifted[0]["end_time"]), ("60.250", "60.500"))
+        self.assertIs(shifted[1], punctuation)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+"""Claiming, leases, retries and ownership in the SQLite job queue
+
+    python -m pytest -q tests
+"""
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from job_queue import DONE, FAILED, QUEUED, RUNNING, JobQueue  # noqa: E402
+
+# Handlers are "module:function" strings; stdlib functions keep the tests self-contained
+ECHO = "json:dumps"      # returns its payload as a JSON string
+BROKEN = "json:loads"    # raises TypeError for a non-string payload
+SLEEP = "time:sleep"     # payload: seconds
+
+
+class JobQueueTest(unittest.TestCase):
+    def setUp(self):
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder, ignore_errors=True)
+        self.db_path = os.path.join(folder, "jobs.db")
+
+    def queue(self, lease_seconds=600):
+        return JobQueue(self.db_path, lease_seconds)
+
+    def make_runnable(self, job_id):
+        """Skip a requeued job's backoff"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("UPDATE jobs SET available_at = 0 WHERE id = ?", (job_id,))
+
+    def test_run_one_completes_a_job(self):
+        queue = self.queue()
+        job_id = queue.enqueue(ECHO, {"a": 1})
+        self.assertTrue(queue.run_one())
+        job = queue.get(job_id)
+        self.assertEqual((job["state"], job["result"], job["attempts"]), (DONE, '{"a": 1}', 1))
+        self.assertFalse(queue.run_one())
+
+    def test_dedup_key_returns_the_pending_job(self):
+        queue = self.queue()
+        first = queue.enqueue(ECHO, 1, dedup_key="audio")
+        self.assertEqual(queue.enqueue(ECHO, 2, dedup_key="audio"), first)
+        queue.run_one()
+        self.assertNotEqual(queue.enqueue(ECHO, 3, dedup_key="audio"), first)
+
+    def test_failures_back_off_then_fail_for_good(self):
+        queue = self.queue()
+        job_id = queue.enqueue(BROKEN, 5, max_attempts=2)
+        queue.run_one()
+        job = queue.get(job_id)
+        self.assertEqual(job["state"], QUEUED)
+        self.assertIn("TypeError", job["error"])
+        self.assertGreater(job["available_at"], time.time())
+        self.assertIsNone(queue.claim())  # still backing off
+
+        self.make_runnable(job_id)
+        queue.run_one()
+        job = queue.get(job_id)
+        self.assertEqual((job["state"], job["attempts"]), (FAILED, 2))
+        self.assertIsNone(queue.claim())
+
+    def test_expired_lease_is_reclaimed_and_the_old_owner_is_ignored(self):
+        queue = self.queue(lease_seconds=0.05)
+        job_id = queue.enqueue(ECHO, 1)
+        _, _, _, old_token = queue.claim()
+        time.sleep(0.1)
+        claimed_id, _, _, token = queue.claim()
+        self.assertEqual(claimed_id, job_id)
+        self.assertNotEqual(token, old_token)
+
+        self.assertFalse(queue.renew(job_id, old_token))
+        self.assertFalse(queue.complete(job_id, old_token, "stale"))
+        self.assertFalse(queue.fail(job_id, old_token, "stale"))
+        job = queue.get(job_id)
+        self.assertEqual((job["state"], job["attempts"], job["result"]), (RUNNING, 2, None))
+
+        self.assertTrue(queue.complete(job_id, token, "fresh"))
+        self.assertEqual(queue.get(job_id)["result"], "fresh")
+        self.assertFalse(queue.complete(job_id, token, "twice"))
+
+    def test_lease_lost_on_the_last_attempt_fails_the_job(self):
+        queue = self.queue(lease_seconds=0.05)
+        job_id = queue.enqueue(ECHO, 1, max_attempts=1)
+        queue.claim()
+        time.sleep(0.1)
+        self.assertIsNone(queue.claim())
+        job = queue.get(job_id)
+        self.assertEqual(job["state"], FAILED)
+        self.assertIn("Lease expired", job["error"])
+
+    def test_running_job_keeps_its_lease(self):
+        queue = self.queue(lease_seconds=0.3)
+        job_id = queue.enqueue(SLEEP, 1.0)
+        worker = threading.Thread(target=queue.run_one)
+        worker.start()
+        time.sleep(0.7)  # more than twice the lease: only renewals keep the job
+        self.assertIsNone(queue.claim())
+        worker.join()
+        self.assertEqual(queue.get(job_id)["state"], DONE)
+
+    def test_adds_lease_tokens_to_an_older_database(self):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "CREATE TABLE jobs (id TEXT PRIMARY KEY, task TEXT NOT NULL, payload TEXT NOT NULL, "
+                "state TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0, max_attempts INTEGER NOT NULL, "
+                "result TEXT, error TEXT, dedup_key TEXT, available_at REAL NOT NULL, lease_until REAL, "
+                "created_at REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+        queue = self.queue()
+        job_id = queue.enqueue(ECHO, 2)
+        queue.run_one()
+        self.assertEqual(queue.get(job_id)["state"], DONE)
+
+
+if __name__ == "__main__":
+    unittest.main()
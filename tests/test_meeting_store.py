@@ -0,0 +1,81 @@
+"""Compact meeting documents, segment sidecars and the migration tool
+
+    python -m pytest -q tests
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import meeting_store  # noqa: E402
+
+
+def meeting_with_segments(count):
+    """A meeting shaped like the ones pipeline.py stores"""
+    speakers = ["spk_0", "spk_1", "Alice"]
+    return {
+        "meeting_id": "M20250801-1000-abcdef12",
+        "date": "2025-08-01",
+        "duration_minutes": 12.5,
+        "participants": ["Alice", "Bob"],
+        "summary": "Budget review. Release plan agreed.",
+        "action_items": ["Alice to send budget", "Bob to ship release"],
+        "segments": [{"speaker": speakers[i % 3], "start": i * 1.25, "end": i * 1.25 + 1.0 / 3}
+                     for i in range(count)],
+        "transcript": [{"speaker": speakers[i % 3], "start_time": f"0:00:{i:02d}", "text": f"turn {i} é"}
+                       for i in range(40)],
+        "words": [{"word": "budget", "start": 0.5, "end": 0.9, "speaker": "spk_0"}],
+    }
+
+
+class MeetingStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.folder, ignore_errors=True)
+
+    def roundtrip(self, meeting):
+        """json -> compact -> json through the migrate tool; returns the final meeting"""
+        meeting_store.write_meeting(self.folder, "meeting", meeting, "json")
+        self.assertEqual(meeting_store.migrate(self.folder, "compact")[0], 1)
+        compact = meeting_store.read_meeting(os.path.join(self.folder, "meeting.mtg"))
+        self.assertEqual(compact, meeting)
+        self.assertEqual(meeting_store.migrate(self.folder, "json")[0], 1)
+        self.assertEqual(sorted(os.listdir(self.folder)), ["meeting.json"])
+        return meeting_store.read_meeting(os.path.join(self.folder, "meeting.json"))
+
+    def test_migration_roundtrip_is_lossless(self):
+        meeting = meeting_with_segments(25)
+        self.assertEqual(self.roundtrip(meeting), meeting)
+
+    def test_migration_roundtrip_through_segment_sidecar(self):
+        meeting = meeting_with_segments(meeting_store.SIDECAR_MIN_SEGMENTS + 7)
+        meeting_store.write_meeting(self.folder, "meeting", meeting, "compact")
+        self.assertTrue(os.path.exists(os.path.join(self.folder, "meeting.seg")))
+        meeting_store.migrate(self.folder, "json")
+        self.assertEqual(self.roundtrip(meeting), meeting)
+
+    def test_header_leaves_body_out(self):
+        meeting = meeting_with_segments(10)
+        name = meeting_store.write_meeting(self.folder, "meeting", meeting, "compact")
+        header = meeting_store.read_header(os.path.join(self.folder, name))
+        self.assertEqual(header, meeting_store.header_fields(meeting))
+
+    def test_segment_file_records(self):
+        segments = meeting_with_segments(meeting_store.SIDECAR_MIN_SEGMENTS)["segments"]
+        path = os.path.join(self.folder, "meeting.seg")
+        meeting_store.write_segments(path, segments)
+        with meeting_store.SegmentFile(path) as stored:
+            self.assertEqual(len(stored), len(segments))
+            self.assertEqual(list(stored), segments)
+            self.assertEqual(stored[len(segments) - 1], segments[-1])
+            self.assertEqual(stored.record(3), (segments[3]["start"], segments[3]["end"], segments[3]["speaker"]))
+            with self.assertRaises(IndexError):
+                stored.record(len(segments))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""Ranked, paged lookups in the FTS5 search index
+
+    python -m pytest -q tests
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from search_index import SearchIndex  # noqa: E402
+
+
+class SearchIndexTest(unittest.TestCase):
+    def setUp(self):
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder, ignore_errors=True)
+        self.index = SearchIndex(os.path.join(folder, "search_index.db"))
+        self.addCleanup(self.index.close)
+        meetings = {
+            f"m{i:02d}.mtg": {"meeting_id": f"M{i:02d}",
+                              "summary": "budget " * (i + 1) + ("schedule" if i % 2 else "")}
+            for i in range(30)
+        }
+        self.index.sync(list(meetings), meetings.get)
+
+    def test_pages_follow_the_full_ranking(self):
+        ranked = self.index.search("budget")
+        self.assertEqual(len(ranked), 30)
+        self.assertEqual(self.index.search("budget", 10), ranked[:10])
+        self.assertEqual(self.index.search("budget", 10, 20), ranked[20:])
+        self.assertEqual(self.index.search("budget", 10, 30), [])
+        self.assertEqual(self.index.search("budget", offset=25), ranked[25:])
+
+    def test_count(self):
+        self.assertEqual(self.index.count("budget"), 30)
+        self.assertEqual(self.index.count("sched"), 15)
+        self.assertEqual(self.index.count("budget sched"), 15)
+        self.assertEqual(self.index.count("nothing"), 0)
+        self.assertEqual(self.index.count("  "), 0)
+        self.assertEqual(self.index.search("  ", 5), [])
+
+
+    def test_sync_loads_only_changed_meetings(self):
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder, ignore_errors=True)
+        meetings = {"a.mtg": {"summary": "budget"}, "b.mtg": {"summary": "release"}, "c.mtg": {"summary": "plan"}}
+        hashes = {name: f"hash-{name}" for name in meetings}
+        loaded = []
+
+        def load(name):
+            loaded.append(name)
+            return meetings.get(name)
+
+        index = SearchIndex(os.path.join(folder, "search_index.db"), content_hash=hashes.get)
+        self.addCleanup(index.close)
+        index.sync(list(meetings), load)
+        self.assertEqual(sorted(loaded), ["a.mtg", "b.mtg", "c.mtg"])
+
+        loaded.clear()
+        meetings["b.mtg"] = {"summary": "schedule"}
+        hashes["b.mtg"] = "hash-b2"
+        del meetings["c.mtg"], hashes["c.mtg"]
+        index.sync(list(meetings), load)
+        self.assertEqual(loaded, ["b.mtg"])
+        self.assertEqual(index.search("sched"), ["b.mtg"])
+        self.assertEqual(index.search("release"), [])
+        self.assertEqual(index.search("plan"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""Extractive summary selection in module3-summary.py, batch and running (IncrementalSummary)
+
+Needs NLTK's sentence tokenizer and stopword list installed
+(python -m nltk.downloader punkt_tab stopwords); skipped otherwise.
+
+    python -m pytest -q tests
+"""
+import importlib.util
+import os
+import sys
+import unittest
+from collections import Counter
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+
+def _load_summary_module():
+    spec = importlib.util.spec_from_file_location("module3_summary", os.path.join(REPO_ROOT, "module3-summary.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+summary = _load_summary_module()
+
+
+def _nltk_data_installed():
+    try:
+        import nltk
+
+        tokenizer = "punkt_tab" if hasattr(nltk.tokenize, "PunktTokenizer") else "punkt"
+        nltk.data.find(f"tokenizers/{tokenizer}")
+        nltk.data.find("corpora/stopwords")
+    except (ImportError, LookupError):
+        return False
+    return True
+
+
+def entries(*texts):
+    return [{"speaker": f"spk_{i % 2}", "start_time": f"0:00:{i:02d}", "text": text} for i, text in enumerate(texts)]
+
+
+@unittest.skipUnless(_nltk_data_installed(), "NLTK punkt/stopwords data not installed")
+class ExtractiveSummaryTest(unittest.TestCase):
+    TEXTS = [
+        "We reviewed the budget for the release.",
+        "Budget numbers look fine and the release budget is approved.",
+        "Lunch was good.",
+        "The release plan moves the release to next week.",
+        "Marketing wants a new logo.",
+        "Budget owners will update the release budget tomorrow.",
+        "Thanks everyone.",
+    ]
+
+    def setUp(self):
+        self.generator = summary.MeetingSummaryGenerator()
+
+    def reference(self, texts, k):
+        """Dense re-implementation: mean word frequency per sentence, best k in transcript order"""
+        sentences = summary.sent_tokenize(" ".join(texts))
+        tokens = [[w for w in summary.word_tokenize(s.lower()) if w.isalpha() and w not in self.generator.stop_words]
+                  for s in sentences]
+        freq = Counter(word for words in tokens for word in words)
+        ranked = sorted((-sum(freq[w] for w in words) / len(words), i) for i, words in enumerate(tokens) if words)
+        return " ".join(sentences[i] for i in sorted(i for _, i in ranked[:k]))
+
+    def test_matches_dense_scoring(self):
+        for k in (1, 2, 3, 5):
+            self.assertEqual(self.generator.generate_extractive_summary(entries(*self.TEXTS), k),
+                             self.reference(self.TEXTS, k), k)
+
+    def test_ties_go_to_the_earlier_sentence(self):
+        texts = ["Alpha beta.", "Beta alpha.", "Alpha alpha beta beta.", "Beta beta alpha alpha.", "Alpha beta."]
+        self.assertEqual(self.generator.generate_extractive_summary(entries(*texts), 2), "Alpha beta. Beta alpha.")
+        self.assertEqual(self.generator.generate_extractive_summary(entries(*texts), 3),
+                         "Alpha beta. Beta alpha. Alpha alpha beta beta.")
+
+    def test_short_transcripts_are_returned_whole(self):
+        self.assertEqual(self.generator.generate_extractive_summary(entries("Hello there.", "Bye now."), 3),
+                         "Hello there. Bye now.")
+
+
+@unittest.skipUnless(_nltk_data_installed(), "NLTK punkt/stopwords data not installed")
+class IncrementalSummaryTest(unittest.TestCase):
+    WORDS = ["budget", "release", "schedule", "design", "review", "launch", "hiring", "roadmap", "customer", "pricing"]
+
+    def setUp(self):
+        self.generator = summary.MeetingSummaryGenerator()
+
+    def reference_top(self, turns, k):
+        """Best k sentence indices after rescoring everything, highest first, earliest on ties"""
+        sentences = [sent for text in turns for sent in summary.sent_tokenize(text)]
+        tokens = [[w for w in summary.word_tokenize(s.lower()) if w.isalpha() and w not in self.generator.stop_words]
+                  for s in sentences]
+        freq = Counter(word for words in tokens for word in words)
+        ranked = sorted((-sum(freq[w] for w in words) / len(words), i) for i, words in enumerate(tokens) if words)
+        return [i for _, i in ranked[:k]]
+
+    def test_running_scores_match_a_full_rescore_after_every_turn(self):
+        import random
+
+        rng = random.Random(11)
+        live = self.generator.incremental(num_sentences=3)
+        turns = []
+        for t in range(150):
+            text = " ".join(
+                " ".join(rng.choice(self.WORDS[:rng.randint(2, len(self.WORDS))]) for _ in range(rng.randint(1, 6)))
+                + "." for _ in range(rng.randint(1, 3)))
+            turns.append(text)
+            live.add_turn(f"spk_{t % 3}", float(t), t + 1.0, text)
+            self.assertEqual(live.top, self.reference_top(turns, 3), t)
+        self.assertGreater(len(live.sentences), 150)
+
+    def test_summary_reads_the_running_state(self):
+        live = self.generator.incremental(num_sentences=2)
+        live.feed(entries("Budget review first.", "Lunch.", "Budget budget release.", "Release review."))
+        self.assertEqual(live.summary_text(), "Budget review first. Budget budget release.")
+        result = live.summary()
+        self.assertEqual(result["summary"], live.summary_text())
+        self.assertEqual(sorted(result["participants"]), ["spk_0", "spk_1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
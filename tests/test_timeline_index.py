@@ -0,0 +1,93 @@
+"""Timeline queries of the speaker-turn index against brute-force scans
+
+    python -m pytest -q tests
+"""
+import os
+import random
+import sys
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from timeline_index import TimelineIndex  # noqa: E402
+
+
+def random_turns(rng, count, speakers=("A", "B", "C")):
+    turns = []
+    for i in range(count):
+        start = round(rng.uniform(0, 600), 2)
+        end = round(start + rng.choice([0.0, rng.uniform(0.1, 5), rng.uniform(5, 60)]), 2)
+        turns.append((start, end, rng.choice(speakers), f"turn{i}"))
+    turns.append((0.0, 650.0, "Chair", "spans the whole meeting"))
+    return turns
+
+
+class TimelineIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.Random(7)
+        self.turns = random_turns(self.rng, 400)
+        self.index = TimelineIndex(self.turns)
+        self.ordered = sorted(self.turns, key=lambda turn: (turn[0], turn[1]))
+        self.times = [self.rng.uniform(-5, 660) for _ in range(200)] + [t[0] for t in self.turns[:50]]
+
+    def test_speakers_at(self):
+        for t in self.times:
+            expected = list(dict.fromkeys(s for start, end, s, _ in self.ordered if start <= t < end))
+            self.assertEqual(self.index.speakers_at(t), expected, t)
+
+    def test_turns_between(self):
+        for t1 in self.times[:100]:
+            t2 = t1 + self.rng.choice([0.5, 10, 120])
+            expected = [(start, end, s, text) for start, end, s, text in self.ordered if start < t2 and end > t1]
+            found = [(turn["start"], turn["end"], turn["speaker"], turn["text"])
+                     for turn in self.index.turns_between(t1, t2)]
+            self.assertEqual(found, expected, (t1, t2))
+
+    def test_talk_time(self):
+        for t1, t2 in [(None, None), (0, 60), (100.5, 101), (300, 900), (-10, 5)]:
+            lo = 0.0 if t1 is None else t1
+            hi = float("inf") if t2 is None else t2
+            for speaker, seconds in self.index.talk_time(t1, t2).items():
+                # Union of the speaker's turns clipped to the window
+                spans = sorted((max(s, lo), min(e, hi)) for s, e, who, _ in self.turns if who == speaker)
+                covered, reach = 0.0, lo
+                for start, end in spans:
+                    start = max(start, reach)
+                    if end > start:
+                        covered += end - start
+                        reach = end
+                self.assertAlmostEqual(seconds, covered, places=2, msg=(speaker, t1, t2))
+
+    def test_overlaps_and_interruptions(self):
+        turns = [(0, 10, "A", "a"), (5, 12, "B", "b"), (6, 8, "A", "a2"), (11, 15, "C", "c"), (20, 25, "A", "a3")]
+        index = TimelineIndex(turns)
+        # (5, B) overlaps A; (6, A) overlaps B; (11, C) overlaps B
+        self.assertEqual(index.overlaps(), 3)
+        self.assertEqual(index.interruptions(), 3)
+        self.assertEqual(index.overlaps(5, 6), 1)
+        self.assertEqual(index.interruptions(6, 20), 2)
+        self.assertEqual(index.overlaps(12, 30), 0)
+
+    def test_text_between_uses_words_when_present(self):
+        turns = [(0, 4, "A", "hello there"), (4, 8, "B", "general remarks")]
+        words = [(0, 1, "A", "hello"), (1, 2, "A", "there"), (4, 5, "B", "general"), (5.5, 7, "B", "remarks")]
+        self.assertEqual(TimelineIndex(turns, words).text_between(1.5, 5.2), "there general")
+        self.assertEqual(TimelineIndex(turns).text_between(3, 5), "hello there general remarks")
+
+    def test_from_meeting_segments(self):
+        meeting = {"segments": [{"speaker": "A", "start": 0, "end": 30},
+                                {"speaker": "B", "start": "0:00:30", "end": "0:01:15.500000"}]}
+        index = TimelineIndex.from_meeting(meeting)
+        self.assertEqual(index.duration, 75.5)
+        self.assertEqual(index.speakers_at(45), ["B"])
+        self.assertEqual(index.talk_time(), {"A": 30.0, "B": 45.5})
+
+    def test_empty(self):
+        index = TimelineIndex([])
+        self.assertEqual((index.duration, index.speakers_at(1), index.turns_between(0, 10)), (0.0, [], []))
+        self.assertEqual(index.talk_time(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""Streaming Transcribe reader: JsonStream must agree with json.load at any chunk size
+
+    python -m pytest -q tests
+"""
+import io
+import json
+import os
+import sys
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from transcript_cleaner import JsonStream  # noqa: E402
+
+SAMPLE_TRANSCRIBE_OUTPUT = os.path.join(REPO_ROOT, "file1.json")
+
+# Skipped values hold brackets, braces, quotes and escapes inside strings
+TRICKY_DOCUMENT = {
+    "jobName": "a \"quoted\" {name} [with] brackets \\ and é中",
+    "status": "COMPLETED",
+    "results": {
+        "transcripts": [{"transcript": "}]{[\",\\"}, {"nested": {"deep": [[], {}, [1, [2, [3]]]]}}],
+        "speaker_labels": {"segments": [], "speakers": 2, "ratio": -1.5e-3, "ok": True, "none": None},
+        "items": [
+            {"type": "pronunciation", "alternatives": [{"confidence": "0.99", "content": "café"}],
+             "start_time": "0.01", "end_time": "0.42", "speaker_label": "spk_0"},
+            {"type": "punctuation", "alternatives": [{"confidence": "0.0", "content": ","}]},
+            {"type": "pronunciation", "alternatives": [{"confidence": "1.0", "content": "\"x\"\n\\y"}],
+             "start_time": "1e1", "end_time": "12.5", "speaker_label": "spk_1"},
+            [], {}, 0, -0.0, "]", None, False,
+        ],
+        "audio_segments": [{"items": [0, 1, 2]}],
+    },
+}
+
+
+class JsonStreamTest(unittest.TestCase):
+    def check_document(self, text, sizes):
+        expected = json.loads(text)["results"]["items"]
+        for chunk_size in sizes:
+            items = list(JsonStream(io.StringIO(text), chunk_size).iter_array("results", "items"))
+            self.assertEqual(items, expected, f"chunk size {chunk_size}")
+
+    def test_matches_json_load_at_every_chunk_size(self):
+        with open(SAMPLE_TRANSCRIBE_OUTPUT, encoding="utf-8") as f:
+            document = json.load(f)
+        # Real Transcribe output cut to its first items, so 4096 passes stay quick
+        results = document["results"]
+        results["items"] = results["items"][:60]
+        results["audio_segments"] = results["audio_segments"][:3]
+        results["speaker_labels"]["segments"] = results["speaker_labels"]["segments"][:3]
+        self.check_document(json.dumps(document), range(1, 4097))
+
+    def test_strings_and_nesting_in_skipped_values(self):
+        for indent in (None, 2):
+            self.check_document(json.dumps(TRICKY_DOCUMENT, indent=indent, ensure_ascii=False), range(1, 257))
+
+    def test_missing_key(self):
+        with self.assertRaises(KeyError):
+            list(JsonStream(io.StringIO('{"results": {"transcripts": []}}')).iter_array("results", "items"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+"""Round trips of the columnar Transcript through its binary and JSON forms
+
+    python -m pytest -q tests
+"""
+import json
+import os
+import sys
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from transcript_model import Transcript  # noqa: E402
+
+
+class TranscriptTest(unittest.TestCase):
+    def setUp(self):
+        self.transcript = Transcript()
+        for i, (speaker, text) in enumerate([("spk_0", "Hello there."), ("spk_1", "café 中文"),
+                                             ("spk_0", ""), ("Alice", "Ok \U0001f44d")]):
+            self.transcript.append(speaker, i * 2.5, i * 2.5 + 1 / 3, text)
+
+    def assertSameTranscript(self, other):
+        self.assertEqual(list(other.turns()), list(self.transcript.turns()))
+        self.assertEqual(other.speakers, self.transcript.speakers)
+
+    def test_binary_roundtrip(self):
+        self.assertSameTranscript(Transcript.from_bytes(self.transcript.to_bytes()))
+
+    def test_columnar_json_roundtrip(self):
+        data = json.loads(json.dumps(self.transcript.to_dict()))
+        self.assertSameTranscript(Transcript.from_dict(data))
+
+    def test_rejects_other_bytes(self):
+        with self.assertRaises(ValueError):
+            Transcript.from_bytes(b"VTTM" + bytes(16))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,229 @@
+"""Interval index over a meeting's speaker turns and word timings
+
+TimelineIndex answers timeline questions without scanning the meeting:
+
+- speakers_at(t): who is speaking at t
+- text_between(t1, t2) / turns_between(t1, t2): what was said in a window
+- talk_time(t1, t2): seconds per speaker inside a window
+- overlaps(t1, t2) / interruptions(t1, t2): cross-talk counts in a window
+
+Turns are sorted by start and indexed by a segment tree holding the
+largest end under each node, so "who is speaking at t" and window
+queries take O(log n) per turn reported, however long the longest turn
+is. Each speaker's turns are merged into disjoint intervals with prefix
+sums of their lengths, which makes windowed talk time O(log n) per
+speaker.
+"""
+from bisect import bisect_left, bisect_right
+from heapq import heappop, heappush
+from itertools import accumulate
+
+from transcript_model import Transcript, parse_timestamp
+
+
+class _Intervals:
+    """Intervals sorted by start, indexed by a max-end segment tree
+
+    Queries bisect the starts to the intervals that begin early enough,
+    then walk the tree only into subtrees whose largest end reaches past
+    the query time, so a stabbing or window query costs O(log n) per
+    reported interval even when one interval spans the whole meeting.
+    """
+
+    __slots__ = ("starts", "ends", "values", "_size", "_tree")
+
+    def __init__(self, rows):
+        rows = sorted(rows, key=lambda row: (row[0], row[1]))
+        self.starts = [row[0] for row in rows]
+        self.ends = [row[1] for row in rows]
+        self.values = [row[2] for row in rows]
+        size = 1
+        while size < len(rows):
+            size *= 2
+        tree = [float("-inf")] * (2 * size)
+        tree[size:size + len(rows)] = self.ends
+        for node in range(size - 1, 0, -1):
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+        self._size = size
+        self._tree = tree
+
+    def __len__(self):
+        return len(self.starts)
+
+    @property
+    def max_end(self):
+        return self._tree[1] if self.starts else 0.0
+
+    def _ending_after(self, last, t):
+        """Indexes i < last with ends[i] > t, in start order"""
+        found = []
+        tree, size = self._tree, self._size
+        stack = [(1, 0, size)]  # (node, first leaf, past last leaf)
+        while stack:
+            node, lo, hi = stack.pop()
+            if lo >= last or tree[node] <= t:
+                continue
+            if node >= size:
+                found.append(lo)
+                continue
+            mid = (lo + hi) // 2
+            stack.append((2 * node + 1, mid, hi))
+            stack.append((2 * node, lo, mid))
+        return found
+
+    def containing(self, t):
+        """Indexes of intervals with start <= t < end, in start order"""
+        return self._ending_after(bisect_right(self.starts, t), t)
+
+    def overlapping(self, t1, t2):
+        """Indexes of intervals intersecting [t1, t2), in start order"""
+        return self._ending_after(bisect_left(self.starts, t2), t1)
+
+
+class _SpeakerTime:
+    """One speaker's turns merged into disjoint intervals with cumulative lengths"""
+
+    __slots__ = ("starts", "ends", "cumulative")
+
+    def __init__(self, spans):
+        starts, ends = [], []
+        for start, end in sorted(spans):
+            if ends and start <= ends[-1]:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+        self.starts = starts
+        self.ends = ends
+        self.cumulative = [0.0, *accumulate(e - s for s, e in zip(starts, ends))]
+
+    def within(self, t1, t2):
+        """Seconds spoken inside [t1, t2)"""
+        first = bisect_right(self.ends, t1)
+        last = bisect_left(self.starts, t2)
+        if first >= last:
+            return 0.0
+        total = self.cumulative[last] - self.cumulative[first]
+        total -= max(0.0, t1 - self.starts[first])   # clip the turn running into the window
+        total -= max(0.0, self.ends[last - 1] - t2)  # and the one running out of it
+        return total
+
+
+def _turns_from_transcript(transcript):
+    """(start, end, speaker, text) rows of a stored transcript, ends filled from the next turn"""
+    if isinstance(transcript, dict):
+        transcript = Transcript.from_dict(transcript)
+    else:
+        transcript = Transcript.coerce(transcript)
+    rows = list(transcript.turns())
+    turns = []
+    for i, (speaker, start, end, text) in enumerate(rows):
+        if end <= start and i + 1 < len(rows):
+            end = max(start, rows[i + 1][1])  # legacy entries only record start_time
+        turns.append((start, end, speaker, text))
+    return turns
+
+
+def _seconds(value):
+    return parse_timestamp(value) if isinstance(value, str) else float(value)
+
+
+class TimelineIndex:
+    """Timeline queries over one meeting's segments, transcript turns and word timings"""
+
+    def __init__(self, turns, words=()):
+        """turns: (start, end, speaker, text or None); words: (start, end, speaker, word)"""
+        self.turns = _Intervals((start, end, (speaker, text)) for start, end, speaker, text in turns)
+        self.words = _Intervals((start, end, (speaker, word)) for start, end, speaker, word in words)
+        self.duration = self.turns.max_end
+
+        spans = {}
+        for start, end, (speaker, _) in zip(self.turns.starts, self.turns.ends, self.turns.values):
+            spans.setdefault(speaker, []).append((start, end))
+        self._speakers = {speaker: _SpeakerTime(s) for speaker, s in spans.items()}
+        self._overlap_starts, self._interruption_starts = self._cross_talk()
+
+    @classmethod
+    def from_meeting(cls, meeting):
+        """Index a stored meeting: segments, else transcript turns; words when present"""
+        if meeting.get("segments"):
+            turns = [(_seconds(seg.get("start", 0)), _seconds(seg.get("end", 0)),
+                      seg.get("speaker", "Unknown"), seg.get("text"))
+                     for seg in meeting["segments"]]
+        elif meeting.get("transcript"):
+            turns = _turns_from_transcript(meeting["transcript"])
+        else:
+            turns = []
+        words = [(_seconds(w["start"]), _seconds(w["end"]), w.get("speaker", ""), w["word"])
+                 for w in meeting.get("words") or []]
+        if not words and meeting.get("segments") and meeting.get("transcript"):
+            # Segments carry the timing; transcript turns still provide text for windows
+            words = [(start, end, speaker, text)
+                     for start, end, speaker, text in _turns_from_transcript(meeting["transcript"])]
+        return cls(turns, words)
+
+    def _cross_talk(self):
+        """Sorted start times of overlapping turn pairs, and of turns that interrupt another speaker"""
+        overlaps, interruptions = [], []
+        active = []  # heap of (end, speaker) for turns still running
+        for start, end, (speaker, _) in zip(self.turns.starts, self.turns.ends, self.turns.values):
+            while active and active[0][0] <= start:
+                heappop(active)
+            others = [s for _, s in active if s != speaker]
+            overlaps.extend([start] * len(others))
+            if others:
+                interruptions.append(start)
+            heappush(active, (end, speaker))
+        return overlaps, interruptions
+
+    # --- Queries ---
+
+    def speakers_at(self, t):
+        """Speakers whose turn covers time t (more than one during cross-talk)"""
+        speakers = []
+        for i in self.turns.containing(t):
+            speaker = self.turns.values[i][0]
+            if speaker not in speakers:
+                speakers.append(speaker)
+        return speakers
+
+    def turns_between(self, t1, t2):
+        """Turns intersecting [t1, t2) as {speaker, start, end[, text]} dicts"""
+        found = []
+        for i in self.turns.overlapping(t1, t2):
+            speaker, text = self.turns.values[i]
+            turn = {"speaker": speaker, "start": self.turns.starts[i], "end": self.turns.ends[i]}
+            if text is not None:
+                turn["text"] = text
+            found.append(turn)
+        return found
+
+    def text_between(self, t1, t2):
+        """Words (or transcript turns) said in [t1, t2), in time order"""
+        if not len(self.words):
+            return " ".join(turn["text"] for turn in self.turns_between(t1, t2) if "text" in turn)
+        first = bisect_left(self.words.starts, t1)
+        last = bisect_left(self.words.starts, t2)
+        if first > 0 and self.words.ends[first - 1] > t1:
+            first -= 1  # word (or turn) already running at t1
+        return " ".join(self.words.values[i][1] for i in range(first, last))
+
+    def talk_time(self, t1=None, t2=None):
+        """Seconds spoken per speaker in [t1, t2) (the whole meeting by default)"""
+        t1 = 0.0 if t1 is None else t1
+        t2 = float("inf") if t2 is None else t2
+        return {speaker: round(time.within(t1, t2), 3) for speaker, time in self._speakers.items()}
+
+    def overlaps(self, t1=None, t2=None):
+        """Pairs of turns by different speakers that overlap, counted where the later one starts"""
+        return self._count(self._overlap_starts, t1, t2)
+
+    def interruptions(self, t1=None, t2=None):
+        """Turns starting while another speaker is still talking"""
+        return self._count(self._interruption_starts, t1, t2)
+
+    @staticmethod
+    def _count(times, t1, t2):
+        first = 0 if t1 is None else bisect_left(times, t1)
+        last = len(times) if t2 is None else bisect_left(times, t2)
+        return max(0, last - first)
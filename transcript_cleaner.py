@@ -0,0 +1,335 @@
+import argparse
+import json
+import os
+import re
+
+import audio_preprocess
+import metrics
+from transcript_model import Transcript, format_timestamp
+
+# Define common filler words to remove
+FILLER_WORDS = {"um", "uh", "erm", "ah", "hmm", "like", "you know", "mm", "eh"}
+
+# Exclude specific speaker labels
+EXCLUDED_SPEAKERS = {"spk_2"}
+
+CHUNK_SIZE = 64 * 1024  # Characters read per refill of the JSON stream
+
+_WHITESPACE = re.compile(r"\s*")
+_STRUCTURE = re.compile(r'["{}\[\]]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+_NUMBER_TAIL = re.compile(r"[-+.eE0-9]*")
+_decoder = json.JSONDecoder()
+
+
+class JsonStream:
+    """Minimal incremental JSON reader over a text file
+
+    Walks down to one array by key path and yields its elements one at a
+    time. Values that are skipped on the way are scanned, not decoded, so
+    memory stays bounded by the largest single element.
+    """
+
+    def __init__(self, file, chunk_size=CHUNK_SIZE):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        """Read another chunk, dropping consumed text; returns False at EOF"""
+        if self.eof:
+            return False
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def _peek(self):
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON input")
+
+    def _expect(self, char):
+        if self._peek() != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos}, got {self.buf[self.pos]!r}")
+        self.pos += 1
+
+    def _read_value(self):
+        """Decode one complete value at the cursor, reading more input as needed"""
+        self._peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number may continue in the next chunk ("-0" of "-0.5", "1" of "1e3")
+            if (not self.eof and isinstance(value, (int, float))
+                    and _NUMBER_TAIL.match(self.buf, end).end() == len(self.buf) and self._fill()):
+                continue
+            self.pos = end
+            return value
+
+    def _skip_string(self):
+        self.pos += 1  # opening quote
+        while True:
+            match = _STRING_SPECIAL.search(self.buf, self.pos)
+            if match is None:
+                self.pos = len(self.buf)
+                if not self._fill():
+                    raise ValueError("Unterminated string")
+                continue
+            if match.group() == '"':
+                self.pos = match.end()
+                return
+            # Backslash escape: make sure the escaped character is buffered
+            self.pos = match.start()
+            if self.pos + 1 >= len(self.buf) and not self._fill():
+                raise ValueError("Unterminated string")
+            self.pos += 2
+
+    def _skip_value(self):
+        char = self._peek()
+        if char == '"':
+            self._skip_string()
+            return
+        if char not in "{[":
+            self._read_value()
+            return
+        depth = 0
+        while True:
+            match = _STRUCTURE.search(self.buf, self.pos)
+            if match is None:
+                self.pos = len(self.buf)
+                if not self._fill():
+                    raise ValueError("Unexpected end of JSON input")
+                continue
+            self.pos = match.start()
+            token = match.group()
+            if token == '"':
+                self._skip_string()
+                continue
+            self.pos += 1
+            depth += 1 if token in "{[" else -1
+            if depth == 0:
+                return
+
+    def _read_key(self):
+        self._peek()
+        while True:
+            try:
+                key, end = json.decoder.scanstring(self.buf, self.pos + 1)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            self.pos = end
+            return key
+
+    def iter_array(self, *path):
+        """Yield the elements of the array found at the given key path"""
+        for key in path:
+            self._expect("{")
+            while True:
+                if self._peek() == "}":
+                    raise KeyError(key)
+                name = self._read_key()
+                self._expect(":")
+                if name == key:
+                    break
+                self._skip_value()
+                if self._peek() == ",":
+                    self.pos += 1
+
+        self._expect("[")
+        if self._peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self._read_value()
+            if self._peek() == ",":
+                self.pos += 1
+            else:
+                self._expect("]")
+                return
+
+
+def iter_items(path, chunk_size=CHUNK_SIZE):
+    """Stream results.items from an AWS Transcribe output file"""
+    metrics.FILES_READ.inc(component="cleaner")
+    with open(path, "r", encoding="utf-8") as f:
+        yield from JsonStream(f, chunk_size).iter_array("results", "items")
+
+
+def iter_manifest_items(folder, transcripts=None):
+    """Items of per-chunk Transcribe outputs stitched onto the original recording's timeline
+
+    folder holds an audio_preprocess manifest; transcripts lists one
+    Transcribe output per chunk, defaulting to each chunk's "transcript"
+    entry (relative to folder). Chunks without one are skipped.
+    """
+    manifest = audio_preprocess.load_manifest(folder)
+    chunks = manifest["chunks"]
+    if transcripts is None:
+        transcripts = [os.path.join(folder, c["transcript"]) if c.get("transcript") else None for c in chunks]
+    elif len(transcripts) != len(chunks):
+        raise ValueError(f"{len(transcripts)} transcript(s) given for {len(chunks)} chunk(s)")
+    pairs = [(chunk, path) for chunk, path in zip(chunks, transcripts) if path]
+    return audio_preprocess.stitch_items({"chunks": [chunk for chunk, _ in pairs]},
+                                         (iter_items(path) for _, path in pairs))
+
+
+def iter_words(items):
+    """Yield word dicts with trailing punctuation attached to the preceding word"""
+    pending = None
+    for item in items:
+        if item['type'] == 'pronunciation':
+            if pending is not None:
+                yield pending
+            pending = {
+                'word': item['alternatives'][0]['content'],
+                'start_time': float(item['start_time']),
+                'end_time': float(item['end_time']),
+                'speaker_label': item.get('speaker_label', '')
+            }
+        elif item['type'] == 'punctuation':
+            if pending is not None:
+                pending['word'] += item['alternatives'][0]['content']
+    if pending is not None:
+        yield pending
+
+
+def iter_turn_records(words, filler_words=FILLER_WORDS, excluded_speakers=EXCLUDED_SPEAKERS):
+    """Group words into cleaned speaker turns: (speaker, start, end, text) tuples"""
+    current_speaker = ""
+    current_words = []
+    start_time = None
+    end_time = None
+
+    def turn():
+        # Optional: Fix lowercase "i"
+        text = re.sub(r"\bi\b", "I", " ".join(current_words))
+        return current_speaker, start_time, end_time, text
+
+    for word_info in words:
+        word = word_info['word']
+        speaker = word_info['speaker_label']
+
+        # Skip excluded speakers
+        if speaker in excluded_speakers:
+            continue
+
+        if speaker != current_speaker:
+            if current_words:
+                yield turn()
+            current_speaker = speaker
+            current_words = []
+            start_time = word_info['start_time']
+
+        end_time = word_info['end_time']
+        if word.lower() not in filler_words:
+            current_words.append(word)
+
+    # Append the last sentence
+    if current_words:
+        yield turn()
+
+
+def iter_word_timings(words, filler_words=FILLER_WORDS, excluded_speakers=EXCLUDED_SPEAKERS):
+    """Kept words with their own timings: {speaker, start, end, word}, for the timeline index"""
+    for word_info in words:
+        if word_info['speaker_label'] in excluded_speakers or word_info['word'].lower() in filler_words:
+            continue
+        yield {"speaker": word_info['speaker_label'], "start": word_info['start_time'],
+               "end": word_info['end_time'], "word": word_info['word']}
+
+
+def iter_speaker_turns(words, filler_words=FILLER_WORDS, excluded_speakers=EXCLUDED_SPEAKERS):
+    """Group words into cleaned speaker turns: {speaker, start_time, text}"""
+    for speaker, start, _, text in iter_turn_records(words, filler_words, excluded_speakers):
+        yield {"speaker": speaker, "start_time": format_timestamp(start), "text": text}
+
+
+def clean_transcript(path):
+    """Yield cleaned speaker turns for an AWS Transcribe output file"""
+    return iter_speaker_turns(iter_words(iter_items(path)))
+
+
+def iter_speaker_turns_from(transcript):
+    """Legacy {speaker, start_time, text} dicts for a Transcript"""
+    for speaker, start, _, text in transcript.turns():
+        yield {"speaker": speaker, "start_time": format_timestamp(start), "text": text}
+
+
+def build_transcript(path, items=None):
+    """Clean an AWS Transcribe output file (or its already-read items) into a columnar Transcript"""
+    transcript = Transcript()
+    with metrics.stage("cleaner.build_transcript"):
+        for record in iter_turn_records(iter_words(iter_items(path) if items is None else items)):
+            transcript.append(*record)
+    return transcript
+
+
+def write_outputs(turns, json_path="clean_transcript.json", txt_path="clean_transcript.txt"):
+    """Write turns to JSON and TXT as they arrive; returns the number written"""
+    count = 0
+    with metrics.stage("cleaner.write_outputs"), \
+            open(json_path, "w", encoding="utf-8") as jf, open(txt_path, "w", encoding="utf-8") as tf:
+        for entry in turns:
+            # Same layout as json.dump(turns, f, indent=2), one entry at a time
+            body = json.dumps(entry, indent=2).replace("\n", "\n  ")
+            jf.write(("[\n  " if count == 0 else ",\n  ") + body)
+            tf.write(f"[{entry['start_time']}] {entry['speaker']}: {entry['text']}\n\n")
+            count += 1
+        jf.write("\n]" if count else "[]")
+    metrics.count_written("cleaner", json_path)
+    metrics.count_written("cleaner", txt_path)
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Clean an AWS Transcribe output into speaker turns")
+    parser.add_argument("input", nargs="?", default="new audio file.json", help="Transcribe JSON file")
+    parser.add_argument("--json-out", default="clean_transcript.json")
+    parser.add_argument("--txt-out", default="clean_transcript.txt")
+    parser.add_argument("--transcript-out",
+                        help="also save the compact transcript (binary, or columnar JSON for .json)")
+    parser.add_argument("--words-out", help="also save per-word speaker/start/end timings as JSON")
+    parser.add_argument("--manifest", metavar="FOLDER",
+                        help="clean per-chunk transcripts of a preprocessed recording (audio_preprocess.py) "
+                             "instead of input, with times on the original recording's timeline")
+    parser.add_argument("--chunk-transcripts", nargs="+", metavar="JSON",
+                        help="Transcribe output per chunk, in order (default: the manifest's transcript entries)")
+    args = parser.parse_args(argv)
+
+    def items():
+        if args.manifest:
+            return iter_manifest_items(args.manifest, args.chunk_transcripts)
+        return iter_items(args.input)
+
+    if args.transcript_out:
+        transcript = build_transcript(args.input, items())
+        transcript.save(args.transcript_out)
+        turns = iter_speaker_turns_from(transcript)
+    else:
+        turns = iter_speaker_turns(iter_words(items()))
+
+    count = write_outputs(turns, args.json_out, args.txt_out)
+    if args.words_out:
+        with open(args.words_out, "w", encoding="utf-8") as f:
+            json.dump(list(iter_word_timings(iter_words(items()))), f)
+        metrics.count_written("cleaner", args.words_out)
+    print(f"Wrote {count} speaker turns to {args.json_out} and {args.txt_out}")
+
+
+if __name__ == "__main__":
+    main()
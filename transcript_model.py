@@ -0,0 +1,228 @@
+import json
+import struct
+import sys
+from array import array
+from datetime import timedelta
+
+MAGIC = b"VTTT"
+VERSION = 1
+_HEADER = struct.Struct("<4sHII")  # magic, version, turn count, speaker count
+_LENGTH = struct.Struct("<I")
+
+
+def parse_timestamp(value):
+    """Seconds from a float or a str(timedelta) string such as "0:01:02.500000" """
+    if isinstance(value, (int, float)) or ":" not in value:
+        return float(value)
+    hours, minutes, seconds = value.split(":")
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def format_timestamp(seconds):
+    """Inverse of parse_timestamp, matching the cleaner's legacy string format"""
+    return str(timedelta(seconds=seconds))
+
+
+def _to_little_endian(arr):
+    if sys.byteorder != "little":
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _from_little_endian(typecode, data):
+    arr = array(typecode)
+    arr.frombytes(data)
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr
+
+
+class Transcript:
+    """Compact columnar transcript: one row per speaker turn
+
+    Start/end times are float arrays, speakers are interned into a small
+    table and referenced by id, and all turn text lives in one string
+    buffer addressed by offsets. Converts losslessly to and from columnar
+    JSON, a binary format, and the cleaner's legacy list-of-dicts JSON.
+    """
+
+    __slots__ = ("starts", "ends", "speaker_ids", "speakers", "offsets",
+                 "_speaker_index", "_buffer", "_pending")
+
+    def __init__(self):
+        self.starts = array("d")
+        self.ends = array("d")
+        self.speaker_ids = array("I")
+        self.speakers = []        # speaker id -> label
+        self.offsets = array("Q", [0])  # turn i is buffer[offsets[i]:offsets[i + 1]]
+        self._speaker_index = {}  # label -> speaker id
+        self._buffer = ""
+        self._pending = []        # text appended since the buffer was last joined
+
+    def speaker_id(self, label):
+        """Intern a speaker label and return its id"""
+        sid = self._speaker_index.get(label)
+        if sid is None:
+            sid = self._speaker_index[label] = len(self.speakers)
+            self.speakers.append(sys.intern(label))
+        return sid
+
+    def append(self, speaker, start, end, text):
+        self.starts.append(start)
+        self.ends.append(end)
+        self.speaker_ids.append(self.speaker_id(speaker))
+        self._pending.append(text)
+        self.offsets.append(self.offsets[-1] + len(text))
+
+    @property
+    def buffer(self):
+        if self._pending:
+            self._buffer += "".join(self._pending)
+            self._pending = []
+        return self._buffer
+
+    def __len__(self):
+        return len(self.starts)
+
+    def text(self, i):
+        return self.buffer[self.offsets[i]:self.offsets[i + 1]]
+
+    def speaker(self, i):
+        return self.speakers[self.speaker_ids[i]]
+
+    def texts(self):
+        buffer, offsets = self.buffer, self.offsets
+        for i in range(len(self)):
+            yield buffer[offsets[i]:offsets[i + 1]]
+
+    def turns(self):
+        """Yield (speaker, start, end, text) for every turn"""
+        buffer, offsets, speakers = self.buffer, self.offsets, self.speakers
+        for i in range(len(self)):
+            yield (speakers[self.speaker_ids[i]], self.starts[i], self.ends[i],
+                   buffer[offsets[i]:offsets[i + 1]])
+
+    @property
+    def duration(self):
+        """Seconds from the start of the recording to the end of the last turn"""
+        return max(self.ends) if len(self) else 0.0
+
+    # --- Legacy list-of-dicts format ({speaker, start_time, text}) ---
+
+    @classmethod
+    def from_entries(cls, entries):
+        """Build from dicts with string or float start_time (and optional end_time)"""
+        transcript = cls()
+        for entry in entries:
+            start = parse_timestamp(entry["start_time"])
+            end = parse_timestamp(entry["end_time"]) if "end_time" in entry else start
+            transcript.append(entry["speaker"], start, end, entry["text"])
+        return transcript
+
+    def to_entries(self):
+        return [
+            {"speaker": speaker, "start_time": format_timestamp(start), "text": text}
+            for speaker, start, _, text in self.turns()
+        ]
+
+    @classmethod
+    def coerce(cls, transcript):
+        """Accept a Transcript or a legacy list of entry dicts"""
+        return transcript if isinstance(transcript, cls) else cls.from_entries(transcript)
+
+    # --- Columnar JSON ---
+
+    def to_dict(self):
+        return {
+            "format": "columnar-transcript",
+            "version": VERSION,
+            "speakers": self.speakers,
+            "speaker_ids": self.speaker_ids.tolist(),
+            "starts": self.starts.tolist(),
+            "ends": self.ends.tolist(),
+            "offsets": self.offsets.tolist(),
+            "text": self.buffer,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        transcript = cls()
+        for label in data["speakers"]:
+            transcript.speaker_id(label)
+        transcript.speaker_ids = array("I", data["speaker_ids"])
+        transcript.starts = array("d", data["starts"])
+        transcript.ends = array("d", data["ends"])
+        transcript.offsets = array("Q", data["offsets"])
+        transcript._buffer = data["text"]
+        return transcript
+
+    # --- Binary ---
+
+    def to_bytes(self):
+        text = self.buffer.encode("utf-8")
+        parts = [_HEADER.pack(MAGIC, VERSION, len(self), len(self.speakers))]
+        for label in self.speakers:
+            encoded = label.encode("utf-8")
+            parts += [_LENGTH.pack(len(encoded)), encoded]
+        parts += [
+            _to_little_endian(self.speaker_ids),
+            _to_little_endian(self.starts),
+            _to_little_endian(self.ends),
+            _to_little_endian(self.offsets),
+            _LENGTH.pack(len(text)),
+            text,
+        ]
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, count, speaker_count = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a binary transcript (or unsupported version)")
+        pos = _HEADER.size
+        transcript = cls()
+        for _ in range(speaker_count):
+            (size,) = _LENGTH.unpack_from(data, pos)
+            pos += _LENGTH.size
+            transcript.speaker_id(data[pos:pos + size].decode("utf-8"))
+            pos += size
+
+        def column(typecode, length):
+            nonlocal pos
+            size = array(typecode).itemsize * length
+            values = _from_little_endian(typecode, data[pos:pos + size])
+            pos += size
+            return values
+
+        transcript.speaker_ids = column("I", count)
+        transcript.starts = column("d", count)
+        transcript.ends = column("d", count)
+        transcript.offsets = column("Q", count + 1)
+        (size,) = _LENGTH.unpack_from(data, pos)
+        pos += _LENGTH.size
+        transcript._buffer = data[pos:pos + size].decode("utf-8")
+        return transcript
+
+    # --- Files ---
+
+    def save(self, path):
+        """Write binary (any extension) or columnar JSON (.json)"""
+        if path.endswith(".json"):
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f)
+        else:
+            with open(path, "wb") as f:
+                f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        """Read binary, columnar JSON or legacy list-of-dicts JSON"""
+        with open(path, "rb") as f:
+            raw = f.read()
+        if raw[:4] == MAGIC:
+            return cls.from_bytes(raw)
+        data = json.loads(raw)
+        if isinstance(data, dict):
+            return cls.from_dict(data)
+        return cls.from_entries(data)
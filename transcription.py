@@ -0,0 +1,273 @@
+"""Speech-to-text engines that all emit AWS Transcribe-shaped result items
+
+    engine = open_engine("stub")                       # or "vosk", "transcribe-json"
+    transcribe_manifest(engine, "chunks/<sha256>")     # chunks from audio_preprocess.py
+
+Every engine turns audio chunks into the items the cleaner already reads
+from Transcribe output ({"type", "alternatives", "start_time",
+"end_time", "speaker_label"}, times in seconds as strings). Results are
+saved per chunk as chunk_NNNN.transcript.json and recorded in the
+manifest, so `transcript_cleaner.py --manifest` stitches them onto the
+recording's timeline whichever engine produced them.
+
+- transcribe-json: reads existing Transcribe output; no audio is decoded.
+- vosk: CPU-only local recognizer (`pip install vosk`, model folder in
+  VOSK_MODEL).
+- stub: deterministic energy-based word segmentation with placeholder
+  words, for measuring pipeline throughput without a model.
+
+Local engines run chunks in batches on a process pool. Each worker
+builds its engine (and loads its model) once, then transcribes one batch
+of chunks per task.
+"""
+import argparse
+import json
+import os
+import time
+import wave
+from concurrent.futures import ProcessPoolExecutor
+
+import audio_preprocess
+import metrics
+from transcript_cleaner import iter_items
+
+BATCH_SIZE = 4  # chunks per pool task
+TRANSCRIPT_SUFFIX = ".transcript.json"
+
+
+def word_item(word, start, end, speaker="spk_0", confidence=1.0):
+    """One Transcribe "pronunciation" item"""
+    return {
+        "type": "pronunciation",
+        "alternatives": [{"confidence": f"{confidence:.3f}", "content": word}],
+        "start_time": f"{start:.3f}",
+        "end_time": f"{end:.3f}",
+        "speaker_label": speaker,
+    }
+
+
+class TranscriptionEngine:
+    """Base class: subclasses implement transcribe(path) -> items with chunk-relative times"""
+
+    name = None
+    local = True  # decodes audio itself (runs on the worker pool)
+
+    def transcribe(self, path):
+        raise NotImplementedError
+
+    def transcribe_batch(self, paths):
+        """Items for each chunk; backends with batched inference override this"""
+        return [self.transcribe(path) for path in paths]
+
+
+class TranscribeJsonEngine(TranscriptionEngine):
+    """Pre-existing AWS Transcribe output, one JSON file per chunk
+
+    transcripts lists the files in chunk order; by default each chunk's
+    "<chunk>.json" next to the audio is used.
+    """
+
+    name = "transcribe-json"
+    local = False
+
+    def __init__(self, transcripts=None):
+        self.transcripts = transcripts
+
+    def source_for(self, path, index):
+        if self.transcripts is not None:
+            return self.transcripts[index]
+        return os.path.splitext(path)[0] + ".json"
+
+    def transcribe(self, path, index=0):
+        return list(iter_items(self.source_for(path, index)))
+
+
+class VoskEngine(TranscriptionEngine):
+    """Kaldi recognizer from the vosk package; CPU only, no network"""
+
+    name = "vosk"
+    FEED_FRAMES = 4000
+
+    def __init__(self, model_path=None):
+        from vosk import Model, SetLogLevel
+
+        SetLogLevel(-1)
+        model_path = model_path or os.environ.get("VOSK_MODEL")
+        if not model_path:
+            raise ValueError("Set VOSK_MODEL (or model_path) to a vosk model folder")
+        self.model = Model(model_path)
+
+    def transcribe(self, path):
+        from vosk import KaldiRecognizer
+
+        items = []
+        with wave.open(path, "rb") as wav:
+            recognizer = KaldiRecognizer(self.model, wav.getframerate())
+            recognizer.SetWords(True)
+
+            def collect(result):
+                for word in json.loads(result).get("result", []):
+                    items.append(word_item(word["word"], word["start"], word["end"],
+                                           confidence=word.get("conf", 1.0)))
+
+            while True:
+                data = wav.readframes(self.FEED_FRAMES)
+                if not data:
+                    break
+                if recognizer.AcceptWaveform(data):
+                    collect(recognizer.Result())
+            collect(recognizer.FinalResult())
+        return items
+
+
+class StubEngine(TranscriptionEngine):
+    """Deterministic stand-in for a recognizer
+
+    Voiced runs (frames above silence_dbfs) become "words" of about
+    word_seconds each, named from a fixed vocabulary; a pause of at
+    least turn_pause seconds switches between two speakers. Costs about
+    what reading and framing the audio costs, so it measures everything
+    around inference.
+    """
+
+    name = "stub"
+    VOCABULARY = ("we", "will", "review", "the", "budget", "and", "schedule", "next", "week",
+                  "action", "item", "decided", "to", "ship", "release", "plan")
+
+    def __init__(self, silence_dbfs=audio_preprocess.SILENCE_DBFS, word_seconds=0.35, turn_pause=1.0):
+        self.silence_dbfs = silence_dbfs
+        self.word_seconds = word_seconds
+        self.turn_pause = turn_pause
+
+    def transcribe(self, path):
+        import numpy as np
+
+        with wave.open(path, "rb") as wav:
+            rate = wav.getframerate()
+            samples = np.frombuffer(wav.readframes(wav.getnframes()), dtype="<i2")
+        frame = max(1, int(rate * audio_preprocess.FRAME_SECONDS))
+        voiced = audio_preprocess.frame_levels(samples, frame) > self.silence_dbfs
+        seconds = frame / rate
+
+        # Edges of voiced runs: starts where voicing turns on, ends where it turns off
+        edges = np.flatnonzero(np.diff(np.concatenate(([False], voiced, [False])).astype(np.int8)))
+        items, speaker, previous_end, n = [], 0, None, 0
+        for run_start, run_end in zip(edges[::2] * seconds, edges[1::2] * seconds):
+            if previous_end is not None and run_start - previous_end >= self.turn_pause:
+                speaker = 1 - speaker
+            count = max(1, int(round((run_end - run_start) / self.word_seconds)))
+            step = (run_end - run_start) / count
+            for i in range(count):
+                word = self.VOCABULARY[n % len(self.VOCABULARY)]
+                start = run_start + i * step
+                items.append(word_item(word, start, start + step, f"spk_{speaker}"))
+                n += 1
+            previous_end = run_end
+        return items
+
+
+ENGINES = {engine.name: engine for engine in (TranscribeJsonEngine, VoskEngine, StubEngine)}
+
+
+def open_engine(name, **options):
+    """Engine by name: "transcribe-json", "vosk" or "stub" """
+    if name not in ENGINES:
+        raise ValueError(f"Unknown transcription engine {name}; choose from {', '.join(ENGINES)}")
+    return ENGINES[name](**options)
+
+
+# --- Batched chunk inference on a process pool ---
+
+_worker_engine = None
+
+
+def _init_worker(name, options):
+    global _worker_engine
+    _worker_engine = open_engine(name, **options)
+
+
+def _transcribe_batch(paths):
+    return _worker_engine.transcribe_batch(paths)
+
+
+def _save_items(path, items):
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump({"results": {"items": items}}, f)
+    os.replace(path + ".tmp", path)
+
+
+def transcribe_manifest(engine, folder, workers=None, batch_size=BATCH_SIZE, options=None, skip_silent=True):
+    """Transcribe every chunk of a preprocessed recording and record the results in its manifest
+
+    Local engines run batch_size chunks per task on workers processes,
+    each building the engine from (engine.name, options) once; workers=0
+    (or a daemonic job worker) transcribes inline with engine itself.
+    Chunks the preprocessor found silent are skipped. Returns the updated
+    manifest, with the elapsed time and realtime factor under
+    "transcription".
+    """
+    manifest = audio_preprocess.load_manifest(folder)
+    chunks = [c for c in manifest["chunks"] if not (skip_silent and c.get("speech_ratio") == 0)]
+    paths = [os.path.join(folder, c["file"]) for c in chunks]
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    started = time.perf_counter()
+
+    with metrics.stage(f"transcription.{engine.name}"):
+        if not engine.local:
+            results = [engine.transcribe(path, manifest["chunks"].index(chunk))
+                       for chunk, path in zip(chunks, paths)]
+        elif workers and not audio_preprocess.in_daemon() and len(paths) > 1:
+            batches = [paths[i:i + batch_size] for i in range(0, len(paths), batch_size)]
+            with ProcessPoolExecutor(max_workers=min(workers, len(batches)), initializer=_init_worker,
+                                     initargs=(engine.name, options or {})) as pool:
+                results = [items for batch in pool.map(_transcribe_batch, batches) for items in batch]
+        else:
+            results = [items for i in range(0, len(paths), batch_size)
+                       for items in engine.transcribe_batch(paths[i:i + batch_size])]
+
+    for chunk, path, items in zip(chunks, paths, results):
+        name = os.path.splitext(chunk["file"])[0] + TRANSCRIPT_SUFFIX
+        _save_items(os.path.join(folder, name), items)
+        chunk["transcript"] = name
+        chunk["words"] = sum(1 for item in items if item["type"] == "pronunciation")
+
+    elapsed = time.perf_counter() - started
+    manifest["transcription"] = {
+        "engine": engine.name,
+        "chunks": len(chunks),
+        "elapsed": round(elapsed, 3),
+        "realtime_factor": round(manifest["duration"] / elapsed, 2) if elapsed else None,
+    }
+    manifest_path = os.path.join(folder, audio_preprocess.MANIFEST_NAME)
+    with open(manifest_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(manifest_path + ".tmp", manifest_path)
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Transcribe the chunks of a preprocessed recording")
+    parser.add_argument("folder", help="chunk folder with manifest.json (audio_preprocess.py --out)")
+    parser.add_argument("--engine", choices=sorted(ENGINES), default="stub")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (0 = inline)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--model", help="vosk model folder (default: VOSK_MODEL)")
+    parser.add_argument("--transcripts", nargs="+", metavar="JSON",
+                        help="transcribe-json: Transcribe output per chunk, in order")
+    args = parser.parse_args(argv)
+
+    options = {}
+    if args.engine == "vosk" and args.model:
+        options["model_path"] = args.model
+    if args.engine == "transcribe-json" and args.transcripts:
+        options["transcripts"] = args.transcripts
+    manifest = transcribe_manifest(open_engine(args.engine, **options), args.folder,
+                                   args.workers, args.batch_size, options)
+    stats = manifest["transcription"]
+    words = sum(c.get("words", 0) for c in manifest["chunks"])
+    print(f"{args.engine}: {stats['chunks']} chunk(s), {words} words, {manifest['duration']:.1f}s of audio "
+          f"in {stats['elapsed']:.2f}s ({stats['realtime_factor']}x realtime)")
+
+
+if __name__ == "__main__":
+    main()